@@ -79,9 +79,8 @@ def verify_agent_card(card: Dict[str, Any]) -> bool:
         return False
 
     # Verify agent_id matches pubkey.
-    from .identity import agent_id_from_pubkey
-    expected_id = agent_id_from_pubkey(bytes.fromhex(pubkey_hex))
-    if expected_id != agent_id:
+    from .identity import _agent_id_from_pubkey_hex
+    if _agent_id_from_pubkey_hex(pubkey_hex) != agent_id:
         return False
 
     # Verify signature.
@@ -4513,7 +4513,8 @@ def cmd_dashboard(args: argparse.Namespace) -> int:
 
 # ── Argument parser ──
 
-def main(argv: Optional[List[str]] = None) -> None:
+def build_parser() -> argparse.ArgumentParser:
+    """The full ``beacon`` argument parser; each subcommand sets ``func``."""
     p = argparse.ArgumentParser(prog="beacon", description="Beacon 2.4.0 - autonomous agent economy: presence, trust, feed, rules, tasks, memory, outbox, executor, mayday, heartbeat, accord")
     p.add_argument("--version", action="version", version=__version__)
     sub = p.add_subparsers(dest="cmd", required=True)
@@ -5796,8 +5797,11 @@ def main(argv: Optional[List[str]] = None) -> None:
 
 
     register_agentmatrix_parser(sub)
+    return p
+
 
-    args = p.parse_args(argv)
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
     rc = args.func(args)
     raise SystemExit(rc)
 
@@ -2,15 +2,25 @@
 
 import json
 import secrets
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
-
+try:
+    import msgpack  # optional dep: compact binary envelopes
+except ImportError:
+    msgpack = None
 
 BEACON_VERSION = 2
 BEACON_HEADER_PREFIX = "[BEACON v"
 NONCE_BYTES = 6  # 12 hex chars
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Binary envelope: BINARY_MAGIC, version byte, body format byte, body.
+BINARY_MAGIC = b"BCN"
+_BINARY_MSGPACK = 1
+_BINARY_JSON = 2
+
 # Known envelope kinds — used by modules to set the "kind" field in payloads.
 # The codec itself is kind-agnostic; this list serves as a protocol reference.
 ENVELOPE_KINDS = {
@@ -68,6 +78,55 @@ def encode_envelope(
 
     If identity is provided and version >= 2, the envelope is automatically signed.
     """
+    payload = _signed_payload(payload, version, identity, include_pubkey)
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return f"[BEACON v{version}]\n{body}"
+
+
+def encode_envelope_binary(
+    payload: Dict[str, Any],
+    version: int = BEACON_VERSION,
+    identity: Any = None,
+    include_pubkey: bool = False,
+) -> bytes:
+    """Encode a Beacon envelope as compact bytes for datagram transports.
+
+    Format: b"BCN" + version byte + body format byte + body, where the body
+    is msgpack (or compact JSON without msgpack). Signing is identical to
+    encode_envelope(), so verify_envelope() works on the decoded dict.
+    """
+    payload = _signed_payload(payload, version, identity, include_pubkey)
+    if msgpack is not None:
+        fmt, body = _BINARY_MSGPACK, msgpack.packb(payload, use_bin_type=True)
+    else:
+        fmt, body = _BINARY_JSON, json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return BINARY_MAGIC + bytes((version, fmt)) + body
+
+
+def decode_envelope_binary(data: bytes) -> Optional[Dict[str, Any]]:
+    """Decode an encode_envelope_binary() datagram; None if it isn't one."""
+    if not data.startswith(BINARY_MAGIC) or len(data) < len(BINARY_MAGIC) + 2:
+        return None
+    version, fmt = data[len(BINARY_MAGIC)], data[len(BINARY_MAGIC) + 1]
+    body = data[len(BINARY_MAGIC) + 2:]
+    try:
+        if fmt == _BINARY_MSGPACK and msgpack is not None:
+            obj = msgpack.unpackb(body, raw=False)
+        elif fmt == _BINARY_JSON:
+            obj = json.loads(body)
+        else:
+            return None
+    except Exception:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    obj.setdefault("_beacon_version", version)
+    return obj
+
+
+def _signed_payload(
+    payload: Dict[str, Any], version: int, identity: Any, include_pubkey: bool,
+) -> Dict[str, Any]:
     if version >= 2 and identity is not None:
         # Inject identity fields before signing.
         payload = dict(payload)
@@ -82,9 +141,7 @@ def encode_envelope(
         signing_payload = {k: v for k, v in payload.items() if k != "sig"}
         msg = _canonical_json(signing_payload)
         payload["sig"] = identity.sign_hex(msg)
-
-    body = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-    return f"[BEACON v{version}]\n{body}"
+    return payload
 
 
 def _find_balanced_json(s: str, start: int) -> Optional[Tuple[int, int]]:
@@ -151,19 +208,24 @@ def decode_envelopes(text: str) -> List[Dict[str, Any]]:
             break
         header_line = text[h:nl]
         version = _parse_version(header_line)
-        # Look for a JSON object after the header.
-        span = _find_balanced_json(text, nl + 1)
-        if not span:
+        # Look for a JSON object after the header. The C scanner parses it
+        # and finds its end in one pass; only malformed bodies fall back to
+        # the brace matcher to know how far to skip.
+        j0 = text.find("{", nl + 1)
+        if j0 < 0:
             idx = nl + 1
             continue
-        j0, j1 = span
-        blob = text[j0:j1]
         try:
-            obj = json.loads(blob)
-            obj.setdefault("_beacon_version", version)
-            out.append(obj)
-        except Exception:
-            pass
+            obj, j1 = _JSON_DECODER.raw_decode(text, j0)
+        except ValueError:
+            span = _find_balanced_json(text, j0)
+            if not span:
+                idx = nl + 1
+                continue
+            idx = span[1]
+            continue
+        obj.setdefault("_beacon_version", version)
+        out.append(obj)
         idx = j1
     return out
 
@@ -198,18 +260,32 @@ def verify_envelope(
         return None  # No key available to verify
 
     # Verify that the pubkey matches the claimed agent_id.
-    from .identity import agent_id_from_pubkey
-    expected_id = agent_id_from_pubkey(bytes.fromhex(pubkey_hex))
-    if agent_id and expected_id != agent_id:
+    from .identity import _agent_id_from_pubkey_hex
+    expected_id = _agent_id_from_pubkey_hex(pubkey_hex)
+    if expected_id is None or (agent_id and expected_id != agent_id):
         return False  # agent_id doesn't match pubkey
 
     # Reconstruct the signing payload (everything except sig).
     signing_payload = {k: v for k, v in envelope.items() if k not in ("sig", "_beacon_version")}
     msg = _canonical_json(signing_payload)
 
+    if not isinstance(sig_hex, str):
+        return False
+    return _verify_signature(pubkey_hex, sig_hex, msg)
+
+
+@lru_cache(maxsize=8192)
+def _verify_signature(pubkey_hex: str, sig_hex: str, msg: bytes) -> bool:
+    """Ed25519 check, memoized on the exact (key, signature, message) triple.
+
+    Inbox views re-verify the same immutable envelopes on every read; keying
+    on the full signed message (not just the nonce) keeps a replayed
+    signature on altered content from hitting a cached ``True``.
+    """
+    from .identity import _public_key_from_hex
+
     try:
-        pk = Ed25519PublicKey.from_public_bytes(bytes.fromhex(pubkey_hex))
-        pk.verify(bytes.fromhex(sig_hex), msg)
+        _public_key_from_hex(pubkey_hex).verify(bytes.fromhex(sig_hex), msg)
         return True
     except Exception:
         return False
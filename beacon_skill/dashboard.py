@@ -18,6 +18,8 @@ from .storage import append_jsonl
 from .transports.udp import udp_send
 
 DEFAULT_API_BASE_URL = "https://rustchain.org/beacon/api"
+NOTIFY_DEDUP_WINDOW_S = 2.0
+_RTC_KEYS = ("rtc_tip", "tip_rtc", "reward_rtc")
 
 
 def _format_ts(ts: Optional[float]) -> str:
@@ -45,17 +47,37 @@ def _as_text(entry: Dict[str, Any]) -> str:
 
 def _rtc_tip(entry: Dict[str, Any]) -> Optional[float]:
     env = entry.get("envelope") or {}
-    for k in ("rtc_tip", "tip_rtc", "reward_rtc"):
+    for k in _RTC_KEYS:
         v = env.get(k)
-        if v is None:
-            continue
-        try:
+        if isinstance(v, (int, float)):
             return float(v)
-        except Exception:
-            continue
+        if isinstance(v, str):
+            try:
+                return float(v)
+            except ValueError:
+                continue
     return None
 
 
+def _should_notify(
+    seen: Dict[Any, float],
+    key: Any,
+    now: float,
+    window_s: float = NOTIFY_DEDUP_WINDOW_S,
+) -> bool:
+    """Return False if an identical notification fired within ``window_s``."""
+    last = seen.get(key)
+    if last is not None and now - last < window_s:
+        return False
+    seen[key] = now
+    return True
+
+
+def _prune_notify_seen(seen: Dict[Any, float], now: float, window_s: float = NOTIFY_DEDUP_WINDOW_S) -> None:
+    for key in [k for k, ts in seen.items() if now - ts >= window_s]:
+        del seen[key]
+
+
 def _transport_tag(entry: Dict[str, Any]) -> str:
     p = (entry.get("platform") or "unknown").lower()
     if p == "udp":
@@ -327,6 +349,7 @@ def run_dashboard(
                 "fetched_at": None,
             }
             self._http = requests.Session()
+            self._notify_seen: Dict[tuple[str, str], float] = {}
 
         def compose(self) -> ComposeResult:
             yield Header(show_clock=True)
@@ -463,6 +486,8 @@ def run_dashboard(
                 mayday = kind == "mayday"
                 if high_value or mayday:
                     label = str(row.get("agent", "unknown"))
+                    if not _should_notify(self._notify_seen, (kind, label), time.monotonic()):
+                        continue
                     if rtc is not None:
                         self.notify(f"{kind.upper()} from {label} ({rtc:g} RTC)", severity="warning", timeout=4)
                     else:
@@ -478,6 +503,7 @@ def run_dashboard(
             )
 
         def _refresh_sidebar(self) -> None:
+            _prune_notify_seen(self._notify_seen, time.monotonic())
             top_agents = self._agent_counter.most_common(5)
             lines = [
                 "[b]Beacon Network[/b]",
@@ -11,14 +11,15 @@ karma, RustChain miner identity, or admin approval.
 Beacon 2.8.0 — Elyan Labs.
 """
 
+import bisect
 import hashlib
-import json
 import secrets
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
-from .storage import _dir, append_jsonl, read_jsonl_tail
+from .storage import _dir, _dumps, _loads, _write_atomic, append_jsonl_many, read_jsonl_tail
 
 HYBRID_STATE_FILE = "hybrid_districts.json"
 HYBRID_LOG_FILE = "hybrid_log.jsonl"
@@ -47,6 +48,9 @@ VERIFICATION_METHODS = {
     VERIFY_MANUAL: "Admin-approved (founders)",
 }
 
+# Credential fields never persisted from verification_data
+_REDACTED_VERIFICATION_KEYS = frozenset({"token", "secret", "password", "api_key", "private_key"})
+
 # Reputation bonus for hybrid-district agents
 HYBRID_REPUTATION_BONUS = 0.15  # 15% boost to BeaconEstimate
 
@@ -54,6 +58,19 @@ HYBRID_REPUTATION_BONUS = 0.15  # 15% boost to BeaconEstimate
 class HybridDistrict:
     """A zone where human sponsors co-own agent identities."""
 
+    __slots__ = (
+        "district_id",
+        "city_domain",
+        "name",
+        "sponsor_id",
+        "sponsor_verified",
+        "sponsor_verification_method",
+        "agents",
+        "governance",
+        "created_at",
+        "metadata",
+    )
+
     def __init__(self, data: Dict[str, Any]):
         self.district_id: str = data.get("district_id", "")
         self.city_domain: str = data.get("city_domain", "")
@@ -74,45 +91,182 @@ class HybridDistrict:
             "sponsor_id": self.sponsor_id,
             "sponsor_verified": self.sponsor_verified,
             "sponsor_verification_method": self.sponsor_verification_method,
-            "agents": self.agents,
+            "agents": list(self.agents),
             "governance": self.governance,
             "governance_description": GOVERNANCE_MODELS.get(self.governance, ""),
             "created_at": self.created_at,
-            "metadata": self.metadata,
+            "metadata": dict(self.metadata),
         }
 
 
+def _district_view(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Same output as ``HybridDistrict(data).to_dict()`` without the wrapper object."""
+    governance = data.get("governance", GOV_SPONSOR_VETO)
+    return {
+        "district_id": data.get("district_id", ""),
+        "city_domain": data.get("city_domain", ""),
+        "name": data.get("name", ""),
+        "sponsor_id": data.get("sponsor_id", ""),
+        "sponsor_verified": data.get("sponsor_verified", False),
+        "sponsor_verification_method": data.get("sponsor_verification_method", ""),
+        "agents": list(data.get("agents", [])),
+        "governance": governance,
+        "governance_description": GOVERNANCE_MODELS.get(governance, ""),
+        "created_at": data.get("created_at", 0),
+        "metadata": dict(data.get("metadata", {})),
+    }
+
+
 class HybridManager:
     """Manage human-AI hybrid districts and co-ownership."""
 
     def __init__(self, data_dir: Optional[Path] = None):
         self._dir = data_dir or _dir()
+        # Write-through cache of the state file, keyed by (mtime_ns, size).
+        self._state: Optional[Dict[str, Any]] = None
+        self._state_sig: Optional[Tuple[int, int]] = None
+        # Secondary indexes over the cached state, rebuilt on every reload.
+        self._districts_by_sponsor: Dict[str, List[str]] = {}
+        self._sponsorships_by_agent: Dict[str, List[str]] = {}
+        self._sponsorships_by_sponsor: Dict[str, List[str]] = {}
+        self._district_agents: Dict[str, Set[str]] = {}
+        self._districts_by_city: Dict[str, List[str]] = {}
+        # (-created_at, insertion seq, district_id), kept sorted: newest first,
+        # ties in insertion order (matching a stable reverse sort).
+        self._districts_by_recency: List[Tuple[int, int, str]] = []
+        # Counters behind stats(), maintained by every mutation.
+        self._governance_counts: Dict[str, int] = {}
+        self._active_by_agent: Dict[str, int] = {}
+        self._active_sponsorships = 0
+        # Group commit: inside batch() state saves and log lines are deferred.
+        self._batch_depth = 0
+        self._dirty = False
+        self._log_buffer: List[Dict[str, Any]] = []
 
     def _state_path(self) -> Path:
         return self._dir / HYBRID_STATE_FILE
 
-    def _load_state(self) -> Dict[str, Any]:
-        path = self._state_path()
-        if not path.exists():
-            return {"districts": {}, "sponsorships": {}, "verifications": {}}
+    @staticmethod
+    def _empty_state() -> Dict[str, Any]:
+        return {"districts": {}, "sponsorships": {}, "verifications": {}}
+
+    def _state_signature(self) -> Optional[Tuple[int, int]]:
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            data.setdefault("districts", {})
-            data.setdefault("sponsorships", {})
-            data.setdefault("verifications", {})
-            return data
-        except Exception:
-            return {"districts": {}, "sponsorships": {}, "verifications": {}}
+            st = self._state_path().stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _load_state(self) -> Dict[str, Any]:
+        if self._dirty and self._state is not None:
+            return self._state  # unflushed changes win over the file
+        sig = self._state_signature()
+        if self._state is not None and sig == self._state_sig:
+            return self._state
+        data = self._empty_state()
+        if sig is not None:
+            try:
+                data = _loads(self._state_path().read_bytes())
+                data.setdefault("districts", {})
+                data.setdefault("sponsorships", {})
+                data.setdefault("verifications", {})
+            except Exception:
+                data = self._empty_state()
+        self._state, self._state_sig = data, sig
+        self._build_indexes(data)
+        return data
 
     def _save_state(self, state: Dict[str, Any]) -> None:
-        self._state_path().parent.mkdir(parents=True, exist_ok=True)
-        self._state_path().write_text(
-            json.dumps(state, indent=2, sort_keys=True) + "\n",
-            encoding="utf-8",
+        if state is not self._state:
+            self._build_indexes(state)
+        self._state = state
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        path = self._state_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, _dumps(state) + b"\n")
+        self._state_sig = self._state_signature()
+
+    def _build_indexes(self, state: Dict[str, Any]) -> None:
+        by_sponsor: Dict[str, List[str]] = {}
+        for district_id, district in state["districts"].items():
+            by_sponsor.setdefault(district.get("sponsor_id", ""), []).append(district_id)
+        by_agent: Dict[str, List[str]] = {}
+        sponsored_by: Dict[str, List[str]] = {}
+        for key, sp in state["sponsorships"].items():
+            by_agent.setdefault(sp.get("agent_id", ""), []).append(key)
+            sponsored_by.setdefault(sp.get("sponsor_id", ""), []).append(key)
+        self._districts_by_sponsor = by_sponsor
+        self._sponsorships_by_agent = by_agent
+        self._sponsorships_by_sponsor = sponsored_by
+        self._district_agents = {
+            district_id: set(district.get("agents", []))
+            for district_id, district in state["districts"].items()
+        }
+        by_city: Dict[str, List[str]] = {}
+        for district_id, district in state["districts"].items():
+            by_city.setdefault(district.get("city_domain", ""), []).append(district_id)
+        self._districts_by_city = by_city
+        self._districts_by_recency = sorted(
+            (-district.get("created_at", 0), seq, district_id)
+            for seq, (district_id, district) in enumerate(state["districts"].items())
         )
+        self._governance_counts = {}
+        for district in state["districts"].values():
+            self._count_governance(district.get("governance", "unknown"))
+        self._active_by_agent = {}
+        self._active_sponsorships = 0
+        for sp in state["sponsorships"].values():
+            self._count_sponsorship(sp, 1)
+
+    def _count_governance(self, governance: str) -> None:
+        self._governance_counts[governance] = self._governance_counts.get(governance, 0) + 1
+
+    def _count_sponsorship(self, sponsorship: Optional[Dict[str, Any]], delta: int) -> None:
+        """Add (+1) or remove (-1) an active sponsorship from the stats counters."""
+        if not sponsorship or not sponsorship.get("active"):
+            return
+        agent_id = sponsorship.get("agent_id", "")
+        count = self._active_by_agent.get(agent_id, 0) + delta
+        if count > 0:
+            self._active_by_agent[agent_id] = count
+        else:
+            self._active_by_agent.pop(agent_id, None)
+        self._active_sponsorships += delta
 
     def _log(self, entry: Dict[str, Any]) -> None:
-        append_jsonl(HYBRID_LOG_FILE, entry)
+        self._log_buffer.append(entry)
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending state to disk and queue log entries on the shared JSONL writer."""
+        if self._dirty and self._state is not None:
+            self._write_state(self._state)
+            self._dirty = False
+        if self._log_buffer:
+            entries, self._log_buffer = self._log_buffer, []
+            append_jsonl_many(HYBRID_LOG_FILE, entries, buffered=True)
+
+    @contextmanager
+    def batch(self) -> Iterator["HybridManager"]:
+        """Group-commit mutations: one state write and one log write on exit."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    @contextmanager
+    def _txn(self) -> Iterator[Dict[str, Any]]:
+        """Load state once for a mutation; state and log writes commit on exit."""
+        with self.batch():
+            yield self._load_state()
 
     @staticmethod
     def _generate_district_id() -> str:
@@ -143,65 +297,69 @@ class HybridManager:
         if governance not in GOVERNANCE_MODELS:
             return {"error": f"Invalid governance model. Choose from: {list(GOVERNANCE_MODELS.keys())}"}
 
-        state = self._load_state()
-        district_id = self._generate_district_id()
-        now = int(time.time())
-
-        # Check if sponsor is verified
-        verified = sponsor_id in state.get("verifications", {})
-
-        district_data = {
-            "district_id": district_id,
-            "city_domain": city_domain,
-            "name": name,
-            "sponsor_id": sponsor_id,
-            "sponsor_verified": verified,
-            "sponsor_verification_method": state.get("verifications", {}).get(sponsor_id, {}).get("method", ""),
-            "agents": [],
-            "governance": governance,
-            "created_at": now,
-            "metadata": metadata or {},
-        }
-
-        state["districts"][district_id] = district_data
-        self._save_state(state)
+        with self._txn() as state:
+            district_id = self._generate_district_id()
+            now = int(time.time())
+
+            # Check if sponsor is verified
+            verified = sponsor_id in state.get("verifications", {})
+
+            district_data = {
+                "district_id": district_id,
+                "city_domain": city_domain,
+                "name": name,
+                "sponsor_id": sponsor_id,
+                "sponsor_verified": verified,
+                "sponsor_verification_method": state.get("verifications", {}).get(sponsor_id, {}).get("method", ""),
+                "agents": [],
+                "governance": governance,
+                "created_at": now,
+                "metadata": metadata or {},
+            }
 
-        self._log({
-            "ts": now,
-            "action": "create_district",
-            "district_id": district_id,
-            "sponsor_id": sponsor_id,
-            "city_domain": city_domain,
-            "governance": governance,
-        })
+            state["districts"][district_id] = district_data
+            self._districts_by_sponsor.setdefault(sponsor_id, []).append(district_id)
+            self._district_agents[district_id] = set()
+            self._districts_by_city.setdefault(city_domain, []).append(district_id)
+            self._count_governance(governance)
+            bisect.insort(self._districts_by_recency, (-now, len(state["districts"]), district_id))
+            self._save_state(state)
 
-        return {
-            "ok": True,
-            "district_id": district_id,
-            "name": name,
-            "city_domain": city_domain,
-            "governance": governance,
-            "sponsor_verified": verified,
-        }
+            self._log({
+                "ts": now,
+                "action": "create_district",
+                "district_id": district_id,
+                "sponsor_id": sponsor_id,
+                "city_domain": city_domain,
+                "governance": governance,
+            })
+
+            return {
+                "ok": True,
+                "district_id": district_id,
+                "name": name,
+                "city_domain": city_domain,
+                "governance": governance,
+                "sponsor_verified": verified,
+            }
 
     def get_district(self, district_id: str) -> Optional[Dict[str, Any]]:
         """Get district details."""
         state = self._load_state()
         data = state["districts"].get(district_id)
         if data:
-            return HybridDistrict(data).to_dict()
+            return _district_view(data)
         return None
 
     def list_districts(self, city_domain: Optional[str] = None) -> List[Dict[str, Any]]:
         """List all hybrid districts, optionally filtered by city."""
         state = self._load_state()
-        results = []
-        for data in state["districts"].values():
-            if city_domain and data.get("city_domain") != city_domain:
-                continue
-            results.append(HybridDistrict(data).to_dict())
-        results.sort(key=lambda d: d.get("created_at", 0), reverse=True)
-        return results
+        districts = state["districts"]
+        if city_domain:
+            results = [_district_view(districts[d]) for d in self._districts_by_city.get(city_domain, ())]
+            results.sort(key=lambda d: d.get("created_at", 0), reverse=True)
+            return results
+        return [_district_view(districts[d]) for _, _, d in self._districts_by_recency]
 
     # ── Sponsorship ──
 
@@ -221,47 +379,54 @@ class HybridManager:
         Returns:
             Sponsorship result.
         """
-        state = self._load_state()
-        district = state["districts"].get(district_id)
-
-        if not district:
-            return {"error": "District not found"}
-        if district["sponsor_id"] != sponsor_id:
-            return {"error": "Only the district sponsor can add agents"}
-        if agent_id in district.get("agents", []):
-            return {"error": "Agent already in this district"}
-
-        now = int(time.time())
-        district.setdefault("agents", []).append(agent_id)
-
-        # Record sponsorship
-        sponsorship_key = f"{sponsor_id}:{agent_id}"
-        state["sponsorships"][sponsorship_key] = {
-            "sponsor_id": sponsor_id,
-            "agent_id": agent_id,
-            "district_id": district_id,
-            "sponsored_at": now,
-            "active": True,
-        }
-
-        self._save_state(state)
+        with self._txn() as state:
+            district = state["districts"].get(district_id)
+
+            if not district:
+                return {"error": "District not found"}
+            if district["sponsor_id"] != sponsor_id:
+                return {"error": "Only the district sponsor can add agents"}
+            if agent_id in self._district_agents.get(district_id, ()):
+                return {"error": "Agent already in this district"}
+
+            now = int(time.time())
+            district.setdefault("agents", []).append(agent_id)
+            self._district_agents.setdefault(district_id, set()).add(agent_id)
+
+            # Record sponsorship
+            sponsorship_key = f"{sponsor_id}:{agent_id}"
+            self._count_sponsorship(state["sponsorships"].get(sponsorship_key), -1)
+            state["sponsorships"][sponsorship_key] = sponsorship = {
+                "sponsor_id": sponsor_id,
+                "agent_id": agent_id,
+                "district_id": district_id,
+                "sponsored_at": now,
+                "active": True,
+            }
+            self._count_sponsorship(sponsorship, 1)
+            agent_keys = self._sponsorships_by_agent.setdefault(agent_id, [])
+            if sponsorship_key not in agent_keys:
+                agent_keys.append(sponsorship_key)
+                self._sponsorships_by_sponsor.setdefault(sponsor_id, []).append(sponsorship_key)
 
-        self._log({
-            "ts": now,
-            "action": "sponsor_agent",
-            "sponsor_id": sponsor_id,
-            "agent_id": agent_id,
-            "district_id": district_id,
-        })
+            self._save_state(state)
 
-        return {
-            "ok": True,
-            "sponsor_id": sponsor_id,
-            "agent_id": agent_id,
-            "district_id": district_id,
-            "district_name": district.get("name", ""),
-            "governance": district.get("governance", ""),
-        }
+            self._log({
+                "ts": now,
+                "action": "sponsor_agent",
+                "sponsor_id": sponsor_id,
+                "agent_id": agent_id,
+                "district_id": district_id,
+            })
+
+            return {
+                "ok": True,
+                "sponsor_id": sponsor_id,
+                "agent_id": agent_id,
+                "district_id": district_id,
+                "district_name": district.get("name", ""),
+                "governance": district.get("governance", ""),
+            }
 
     def revoke_sponsorship(
         self,
@@ -279,43 +444,45 @@ class HybridManager:
         Returns:
             Revocation result.
         """
-        state = self._load_state()
-        sponsorship_key = f"{sponsor_id}:{agent_id}"
-        sponsorship = state["sponsorships"].get(sponsorship_key)
+        with self._txn() as state:
+            sponsorship_key = f"{sponsor_id}:{agent_id}"
+            sponsorship = state["sponsorships"].get(sponsorship_key)
+
+            if not sponsorship:
+                return {"error": "No active sponsorship found"}
+            if not sponsorship.get("active"):
+                return {"error": "Sponsorship already revoked"}
+
+            now = int(time.time())
+            self._count_sponsorship(sponsorship, -1)
+            sponsorship["active"] = False
+            sponsorship["revoked_at"] = now
+            sponsorship["revocation_reason"] = reason
+
+            # Remove from district
+            district_id = sponsorship["district_id"]
+            district = state["districts"].get(district_id)
+            if district and agent_id in self._district_agents.get(district_id, ()):
+                district["agents"].remove(agent_id)
+                self._district_agents[district_id].discard(agent_id)
 
-        if not sponsorship:
-            return {"error": "No active sponsorship found"}
-        if not sponsorship.get("active"):
-            return {"error": "Sponsorship already revoked"}
-
-        now = int(time.time())
-        sponsorship["active"] = False
-        sponsorship["revoked_at"] = now
-        sponsorship["revocation_reason"] = reason
-
-        # Remove from district
-        district_id = sponsorship["district_id"]
-        district = state["districts"].get(district_id)
-        if district and agent_id in district.get("agents", []):
-            district["agents"].remove(agent_id)
-
-        self._save_state(state)
-
-        self._log({
-            "ts": now,
-            "action": "revoke_sponsorship",
-            "sponsor_id": sponsor_id,
-            "agent_id": agent_id,
-            "reason": reason,
-        })
+            self._save_state(state)
 
-        return {
-            "ok": True,
-            "revoked": True,
-            "sponsor_id": sponsor_id,
-            "agent_id": agent_id,
-            "reason": reason,
-        }
+            self._log({
+                "ts": now,
+                "action": "revoke_sponsorship",
+                "sponsor_id": sponsor_id,
+                "agent_id": agent_id,
+                "reason": reason,
+            })
+
+            return {
+                "ok": True,
+                "revoked": True,
+                "sponsor_id": sponsor_id,
+                "agent_id": agent_id,
+                "reason": reason,
+            }
 
     # ── Human Verification ──
 
@@ -338,54 +505,54 @@ class HybridManager:
         if verification_method not in VERIFICATION_METHODS:
             return {"error": f"Invalid method. Choose from: {list(VERIFICATION_METHODS.keys())}"}
 
-        state = self._load_state()
-        now = int(time.time())
-        data = verification_data or {}
-
-        # Method-specific validation
-        verified = False
-        if verification_method == VERIFY_MANUAL:
-            # Admin approval — trusted by default for founders
-            verified = True
-        elif verification_method == VERIFY_MOLTBOOK:
-            karma = data.get("karma", 0)
-            verified = karma > 100
-        elif verification_method == VERIFY_RUSTCHAIN_MINER:
-            # Check if they have an active miner registration
-            verified = bool(data.get("miner_id"))
-        elif verification_method == VERIFY_OAUTH_GOOGLE:
-            # OAuth verification would be done server-side
-            verified = bool(data.get("oauth_verified"))
-
-        if verified:
-            state["verifications"][sponsor_id] = {
-                "method": verification_method,
-                "verified_at": now,
-                "data": {k: v for k, v in data.items() if k not in ("token", "secret", "password")},
-            }
-
-            # Update all districts owned by this sponsor
-            for district in state["districts"].values():
-                if district.get("sponsor_id") == sponsor_id:
+        with self._txn() as state:
+            now = int(time.time())
+            data = verification_data or {}
+
+            # Method-specific validation
+            verified = False
+            if verification_method == VERIFY_MANUAL:
+                # Admin approval — trusted by default for founders
+                verified = True
+            elif verification_method == VERIFY_MOLTBOOK:
+                karma = data.get("karma", 0)
+                verified = karma > 100
+            elif verification_method == VERIFY_RUSTCHAIN_MINER:
+                # Check if they have an active miner registration
+                verified = bool(data.get("miner_id"))
+            elif verification_method == VERIFY_OAUTH_GOOGLE:
+                # OAuth verification would be done server-side
+                verified = bool(data.get("oauth_verified"))
+
+            if verified:
+                state["verifications"][sponsor_id] = {
+                    "method": verification_method,
+                    "verified_at": now,
+                    "data": {k: v for k, v in data.items() if k not in _REDACTED_VERIFICATION_KEYS},
+                }
+
+                # Update all districts owned by this sponsor
+                for district_id in self._districts_by_sponsor.get(sponsor_id, ()):
+                    district = state["districts"][district_id]
                     district["sponsor_verified"] = True
                     district["sponsor_verification_method"] = verification_method
 
-            self._save_state(state)
+                self._save_state(state)
 
-        self._log({
-            "ts": now,
-            "action": "verify_human",
-            "sponsor_id": sponsor_id,
-            "method": verification_method,
-            "verified": verified,
-        })
+            self._log({
+                "ts": now,
+                "action": "verify_human",
+                "sponsor_id": sponsor_id,
+                "method": verification_method,
+                "verified": verified,
+            })
 
-        return {
-            "ok": verified,
-            "sponsor_id": sponsor_id,
-            "method": verification_method,
-            "verified": verified,
-        }
+            return {
+                "ok": verified,
+                "sponsor_id": sponsor_id,
+                "method": verification_method,
+                "verified": verified,
+            }
 
     def is_verified(self, sponsor_id: str) -> bool:
         """Check if a sponsor is human-verified."""
@@ -417,7 +584,7 @@ class HybridManager:
 
         if not district:
             return {"error": "District not found"}
-        if agent_id not in district.get("agents", []):
+        if agent_id not in self._district_agents.get(district_id, ()):
             return {"error": "Agent not in this district"}
 
         governance = district.get("governance", GOV_SPONSOR_VETO)
@@ -437,16 +604,18 @@ class HybridManager:
         elif governance == GOV_MULTISIG_2OF3:
             # Need 2 of 3: sponsor, agent, one peer
             required = 2
-            valid_signers = set(signers) & (
-                {sponsor_id, agent_id} | set(district.get("agents", []))
-            )
-            approved = len(valid_signers) >= required
-            reason = f"multisig_2of3: {len(valid_signers)}/{required} signatures"
+            members = self._district_agents.get(district_id, set())
+            valid = sum(1 for s in set(signers) if s == sponsor_id or s in members)
+            approved = valid >= required
+            reason = f"multisig_2of3: {valid}/{required} signatures"
 
         elif governance == GOV_EQUAL:
             # Both sponsor AND agent must sign
-            approved = sponsor_id in signers and agent_id in signers
-            reason = f"equal: sponsor={'yes' if sponsor_id in signers else 'no'}, agent={'yes' if agent_id in signers else 'no'}"
+            signer_set = set(signers)
+            sponsor_signed = sponsor_id in signer_set
+            agent_signed = agent_id in signer_set
+            approved = sponsor_signed and agent_signed
+            reason = f"equal: sponsor={'yes' if sponsor_signed else 'no'}, agent={'yes' if agent_signed else 'no'}"
 
         self._log({
             "ts": now,
@@ -511,9 +680,10 @@ class HybridManager:
         """Get all active sponsorships for an agent."""
         state = self._load_state()
         results = []
-        for sp in state["sponsorships"].values():
-            if sp.get("agent_id") == agent_id and sp.get("active"):
-                results.append(sp)
+        for key in self._sponsorships_by_agent.get(agent_id, ()):
+            sp = state["sponsorships"][key]
+            if sp.get("active"):
+                results.append(dict(sp))
         return results
 
     def sponsor_portfolio(self, sponsor_id: str) -> Dict[str, Any]:
@@ -521,14 +691,15 @@ class HybridManager:
         state = self._load_state()
 
         districts = [
-            HybridDistrict(d).to_dict()
-            for d in state["districts"].values()
-            if d.get("sponsor_id") == sponsor_id
+            _district_view(state["districts"][district_id])
+            for district_id in self._districts_by_sponsor.get(sponsor_id, ())
         ]
 
+        sponsorships = state["sponsorships"]
         agents = [
-            sp for sp in state["sponsorships"].values()
-            if sp.get("sponsor_id") == sponsor_id and sp.get("active")
+            sponsorships[key]
+            for key in self._sponsorships_by_sponsor.get(sponsor_id, ())
+            if sponsorships[key].get("active")
         ]
 
         verified = state.get("verifications", {}).get(sponsor_id)
@@ -549,24 +720,11 @@ class HybridManager:
     def stats(self) -> Dict[str, Any]:
         """Hybrid district system statistics."""
         state = self._load_state()
-
-        districts = list(state["districts"].values())
-        active_sponsorships = [
-            s for s in state["sponsorships"].values() if s.get("active")
-        ]
-
-        by_governance: Dict[str, int] = {}
-        for d in districts:
-            gov = d.get("governance", "unknown")
-            by_governance[gov] = by_governance.get(gov, 0) + 1
-
         return {
-            "total_districts": len(districts),
+            "total_districts": len(state["districts"]),
             "verified_sponsors": len(state.get("verifications", {})),
-            "active_sponsorships": len(active_sponsorships),
-            "total_agents_sponsored": len(set(
-                s["agent_id"] for s in active_sponsorships
-            )),
-            "by_governance": by_governance,
+            "active_sponsorships": self._active_sponsorships,
+            "total_agents_sponsored": len(self._active_by_agent),
+            "by_governance": dict(self._governance_counts),
             "ts": int(time.time()),
         }
@@ -4,6 +4,7 @@ import hashlib
 import json
 import os
 import secrets
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
@@ -47,6 +48,21 @@ def agent_id_from_pubkey(pubkey_bytes: bytes) -> str:
     return f"{AGENT_ID_PREFIX}{h}"
 
 
+@lru_cache(maxsize=4096)
+def _agent_id_from_pubkey_hex(pubkey_hex: str) -> Optional[str]:
+    """Memoized agent_id derivation; None for malformed hex."""
+    try:
+        return agent_id_from_pubkey(bytes.fromhex(pubkey_hex))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _public_key_from_hex(pubkey_hex: str) -> Ed25519PublicKey:
+    """Parsed Ed25519 public key, memoized per hex string (keys are immutable)."""
+    return Ed25519PublicKey.from_public_bytes(bytes.fromhex(pubkey_hex))
+
+
 class AgentIdentity:
     """Ed25519 keypair with deterministic agent ID and signing/verification."""
 
@@ -117,8 +133,7 @@ class AgentIdentity:
     @staticmethod
     def verify(pubkey_hex: str, signature_hex: str, data: bytes) -> bool:
         try:
-            pk = Ed25519PublicKey.from_public_bytes(bytes.fromhex(pubkey_hex))
-            pk.verify(bytes.fromhex(signature_hex), data)
+            _public_key_from_hex(pubkey_hex).verify(bytes.fromhex(signature_hex), data)
             return True
         except Exception:
             return False
@@ -1,12 +1,14 @@
 """Inbound parsing: read, verify, filter, and track inbox entries."""
 
-import json
-import time
+from collections import deque
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
 from .codec import decode_envelopes, verify_envelope
-from .storage import _dir, read_state, write_state
+from .identity import _agent_id_from_pubkey_hex
+from .storage import _dir, _dumps, _loads, read_state
 from .key_management import (
     load_known_keys,
     save_known_keys,
@@ -14,58 +16,112 @@ from .key_management import (
     update_last_seen,
     is_key_expired,
     KNOWN_KEYS_FILE,
+    _now_s,
 )
 
 
-def _read_nonces() -> set:
-    """Get set of already-read nonces from state."""
-    state = read_state()
-    return set(state.get("read_nonces", []))
+INBOX_INDEX_FILE = "inbox_index.json"
+READ_NONCES_FILE = "read_nonces.log"
+MAX_READ_NONCES = 10000
+
+# (path, file size when cached, insertion-ordered nonces, nonce set, lines on disk)
+_read_nonce_cache: Optional[Tuple[Path, int, Deque[str], Set[str], int]] = None
+
+
+def _load_read_nonces() -> Tuple[Path, int, Deque[str], Set[str], int]:
+    """Return the cached read-nonce set, reloading if the log changed on disk."""
+    global _read_nonce_cache
+    path = _dir() / READ_NONCES_FILE
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = -1
+    cached = _read_nonce_cache
+    if cached is not None and cached[0] == path and cached[1] == size:
+        return cached
+
+    lines: List[str] = []
+    if size >= 0:
+        with path.open("r", encoding="utf-8") as f:
+            lines = [ln.strip() for ln in f if ln.strip()]
+    else:
+        # Legacy location: a sorted list inside state.json.
+        lines = [str(n) for n in read_state().get("read_nonces", [])]
+
+    order: Deque[str] = deque()
+    seen: Set[str] = set()
+    for nonce in lines:
+        if nonce not in seen:
+            order.append(nonce)
+            seen.add(nonce)
+    while len(order) > MAX_READ_NONCES:
+        seen.discard(order.popleft())
+    _read_nonce_cache = (path, size, order, seen, len(lines))
+    return _read_nonce_cache
+
+
+def _read_nonces() -> Set[str]:
+    """Get set of already-read nonces."""
+    return _load_read_nonces()[3]
 
 
 def _save_read_nonce(nonce: str) -> None:
-    """Mark a nonce as read."""
-    state = read_state()
-    nonces = set(state.get("read_nonces", []))
-    nonces.add(nonce)
-    # Keep bounded (last 10000 nonces).
-    if len(nonces) > 10000:
-        nonces = set(list(nonces)[-10000:])
-    state["read_nonces"] = sorted(nonces)
-    write_state(state)
+    """Mark a nonce as read by appending it to the read-nonce log."""
+    global _read_nonce_cache
+    path, size, order, seen, disk_lines = _load_read_nonces()
+    if nonce in seen:
+        return
+    order.append(nonce)
+    seen.add(nonce)
+    # Keep bounded (last MAX_READ_NONCES nonces).
+    while len(order) > MAX_READ_NONCES:
+        seen.discard(order.popleft())
+
+    disk_lines += 1
+    if size < 0 or disk_lines > 2 * MAX_READ_NONCES:
+        # First write (possibly migrating from state.json) or log has grown
+        # well past the bound: rewrite it with only the retained nonces.
+        path.write_text("".join(n + "\n" for n in order), encoding="utf-8")
+        disk_lines = len(order)
+    else:
+        with path.open("a", encoding="utf-8") as f:
+            f.write(nonce + "\n")
+    _read_nonce_cache = (path, path.stat().st_size, order, seen, disk_lines)
 
 
-def _learn_key_from_envelope(env: Dict[str, Any], keys: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+def _learn_key(env: Dict[str, Any], keys: Dict[str, Dict[str, Any]]) -> bool:
     """Auto-learn pubkey from v2 envelopes (trust on first use).
 
-    Now includes TTL check and metadata tracking.
+    Returns True if ``keys`` was modified. ``last_seen`` is only bumped once
+    it is at least a second stale, so re-reading the same inbox in quick
+    succession does not dirty the key store.
     """
     agent_id = env.get("agent_id", "")
     pubkey = env.get("pubkey", "")
 
     if not agent_id or not pubkey:
-        return keys
+        return False
 
-    from .identity import agent_id_from_pubkey
+    now = _now_s()
+    key = keys.get(agent_id)
 
-    # Verify agent_id matches pubkey
-    expected = agent_id_from_pubkey(bytes.fromhex(pubkey))
-    if expected != agent_id:
-        return keys  # Invalid: agent_id doesn't match pubkey
+    # Verify agent_id matches pubkey (already true if this pubkey is on file).
+    if key is None or key.get("pubkey_hex") != pubkey:
+        if _agent_id_from_pubkey_hex(pubkey) != agent_id:
+            return False  # Invalid: agent_id doesn't match pubkey
 
     # Check if key already exists
-    if agent_id in keys:
-        key = keys[agent_id]
-
+    if key is not None:
         # Check if revoked
         if key.get("revoked"):
-            return keys  # Ignore envelopes from revoked keys
+            return False  # Ignore envelopes from revoked keys
 
         # Update last_seen
-        keys[agent_id]["last_seen"] = time.time()
+        if now - key.get("last_seen", 0) < 1.0:
+            return False
+        key["last_seen"] = now
     else:
         # New key - learn it (TOFU)
-        now = time.time()
         keys[agent_id] = {
             "pubkey_hex": pubkey,
             "first_seen": now,
@@ -77,93 +133,183 @@ def _learn_key_from_envelope(env: Dict[str, Any], keys: Dict[str, Dict[str, Any]
             "revoked_reason": None,
         }
 
-    return keys
+    return True
 
 
-def read_inbox(
-    *,
-    kind: Optional[str] = None,
-    agent_id: Optional[str] = None,
-    since: Optional[float] = None,
-    unread_only: bool = False,
-    limit: Optional[int] = None,
-) -> List[Dict[str, Any]]:
-    """Read and filter inbox entries from inbox.jsonl.
+def _learn_key_from_envelope(env: Dict[str, Any], keys: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Auto-learn pubkey from v2 envelopes (trust on first use).
 
-    Each entry is enriched with:
-      - verified: True/False/None (signature verification result)
-      - is_read: bool (whether this nonce was marked read)
+    Now includes TTL check and metadata tracking.
     """
-    path = _dir() / "inbox.jsonl"
-    if not path.exists():
-        return []
-
-    known_keys = load_known_keys()
-    read_nonces = _read_nonces()
-    results: List[Dict[str, Any]] = []
+    _learn_key(env, keys)
+    return keys
 
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entry = json.loads(line)
-        except Exception:
-            continue
 
-        # Extract envelopes from the entry.
-        envelopes = entry.get("envelopes", [])
-        if not envelopes and entry.get("text"):
-            envelopes = decode_envelopes(entry["text"])
+@lru_cache(maxsize=4096)
+def _decode_envelopes_cached(text: str) -> Tuple[Dict[str, Any], ...]:
+    """Memoized decode of raw entry text; callers must copy before mutating."""
+    return tuple(decode_envelopes(text))
 
-        # Process each envelope in the entry.
-        for env in envelopes:
-            # Auto-learn keys (with TTL tracking).
-            known_keys = _learn_key_from_envelope(env, known_keys)
 
-            # Verify signature.
-            verified = verify_envelope(env, known_keys={k: v["pubkey_hex"] for k, v in known_keys.items()})
-            nonce = env.get("nonce", "")
-            is_read = nonce in read_nonces if nonce else False
+def _entry_envelopes(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract envelopes from an inbox entry."""
+    envelopes = entry.get("envelopes", [])
+    if not envelopes and entry.get("text"):
+        envelopes = [dict(env) for env in _decode_envelopes_cached(entry["text"])]
+    return envelopes
 
-            enriched = dict(entry)
-            enriched["envelope"] = env
-            enriched["verified"] = verified
-            enriched["is_read"] = is_read
 
-            # Apply filters.
-            if kind and env.get("kind") != kind:
+def _iter_inbox_lines(path: Path) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Yield ``(entry, envelopes)`` for each parseable line of an inbox file."""
+    with path.open("rb", buffering=1 << 16) as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
                 continue
-            if agent_id and env.get("agent_id") != agent_id:
+            try:
+                entry = _loads(line)
+            except Exception:
                 continue
-            if since and entry.get("received_at", 0) < since:
+            yield entry, _entry_envelopes(entry)
+
+
+def _nonce_offsets(path: Path) -> Dict[str, int]:
+    """Return ``nonce -> byte offset`` of the first inbox line carrying it.
+
+    The index is persisted next to the inbox and extended incrementally:
+    only bytes appended since the last call are scanned. A shrunken inbox
+    (truncated or rewritten) triggers a full rebuild.
+    """
+    index_path = path.with_name(INBOX_INDEX_FILE)
+    size = path.stat().st_size
+    try:
+        index = _loads(index_path.read_bytes())
+        indexed = int(index["size"])
+        offsets: Dict[str, int] = index["offsets"]
+    except Exception:
+        indexed, offsets = 0, {}
+    if indexed > size:
+        indexed, offsets = 0, {}
+    if indexed == size:
+        return offsets
+
+    with path.open("rb", buffering=1 << 16) as fh:
+        fh.seek(indexed)
+        while True:
+            offset = fh.tell()
+            line = fh.readline()
+            if not line.endswith(b"\n"):
+                break  # EOF or a line still being written
+            indexed = offset + len(line)
+            line = line.strip()
+            if not line:
                 continue
-            if unread_only and is_read:
+            try:
+                entry = _loads(line)
+            except Exception:
                 continue
+            for env in _entry_envelopes(entry):
+                nonce = env.get("nonce")
+                if nonce and isinstance(nonce, str):
+                    offsets.setdefault(nonce, offset)
 
-            results.append(enriched)
+    index_path.write_bytes(_dumps({"size": indexed, "offsets": offsets}))
+    return offsets
 
-        # If no envelopes, include the raw entry (e.g., plain text UDP).
-        if not envelopes:
-            enriched = dict(entry)
-            enriched["envelope"] = None
-            enriched["verified"] = None
-            enriched["is_read"] = False
-
-            if kind or agent_id:
-                continue  # Can't filter raw entries by kind/agent_id.
-            if since and entry.get("received_at", 0) < since:
-                continue
 
-            results.append(enriched)
+def _read_entry_at(path: Path, offset: int) -> Optional[Dict[str, Any]]:
+    with path.open("rb") as fh:
+        fh.seek(offset)
+        line = fh.readline().strip()
+    try:
+        entry = _loads(line)
+    except Exception:
+        return None
+    return entry if isinstance(entry, dict) else None
 
-    # Save any updated keys (last_seen timestamps, etc.)
-    save_known_keys(known_keys)
 
-    if limit:
-        results = results[-limit:]
+def _iter_inbox(
+    *,
+    kind: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    since: Optional[float] = None,
+    unread_only: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Stream enriched, filtered entries from inbox.jsonl one line at a time.
+
+    Learned keys are saved when the iteration finishes or is abandoned.
+    """
+    path = _dir() / "inbox.jsonl"
+    if not path.exists():
+        return
+
+    known_keys = load_known_keys()
+    key_hex = {k: v["pubkey_hex"] for k, v in known_keys.items()}
+    read_nonces = _read_nonces()
+    keys_dirty = False
+
+    try:
+        for entry, envelopes in _iter_inbox_lines(path):
+            in_range = not (since and entry.get("received_at", 0) < since)
+
+            # Process each envelope in the entry.
+            for env in envelopes:
+                # Auto-learn keys (with TTL tracking), even for filtered-out envelopes.
+                if _learn_key(env, known_keys):
+                    keys_dirty = True
+                    key_hex[env["agent_id"]] = known_keys[env["agent_id"]]["pubkey_hex"]
+
+                # Apply filters before any copying or signature work.
+                if not in_range:
+                    continue
+                if kind and env.get("kind") != kind:
+                    continue
+                if agent_id and env.get("agent_id") != agent_id:
+                    continue
+                nonce = env.get("nonce", "")
+                is_read = nonce in read_nonces if nonce else False
+                if unread_only and is_read:
+                    continue
+
+                enriched = dict(entry)
+                enriched["envelope"] = env
+                enriched["verified"] = verify_envelope(env, known_keys=key_hex)
+                enriched["is_read"] = is_read
+                yield enriched
+
+            # If no envelopes, include the raw entry (e.g., plain text UDP).
+            # Raw entries can't be filtered by kind/agent_id, so those filters drop them.
+            if not envelopes and in_range and not (kind or agent_id):
+                enriched = dict(entry)
+                enriched["envelope"] = None
+                enriched["verified"] = None
+                enriched["is_read"] = False
+                yield enriched
+    finally:
+        # Save any updated keys (new keys, stale last_seen timestamps).
+        if keys_dirty:
+            save_known_keys(known_keys)
 
-    return results
+
+def read_inbox(
+    *,
+    kind: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    since: Optional[float] = None,
+    unread_only: bool = False,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Read and filter inbox entries from inbox.jsonl.
+
+    Each entry is enriched with:
+      - verified: True/False/None (signature verification result)
+      - is_read: bool (whether this nonce was marked read)
+    """
+    entries = _iter_inbox(kind=kind, agent_id=agent_id, since=since, unread_only=unread_only)
+    if limit:
+        # Only the last `limit` matches are ever held in memory.
+        return list(deque(entries, maxlen=limit))
+    return list(entries)
 
 
 def mark_read(nonce: str) -> None:
@@ -172,16 +318,57 @@ def mark_read(nonce: str) -> None:
 
 
 def inbox_count(unread_only: bool = False) -> int:
-    """Return the count of inbox entries."""
-    entries = read_inbox(unread_only=unread_only)
-    return len(entries)
+    """Return the count of inbox entries.
+
+    Counts without verifying signatures or learning keys.
+    """
+    path = _dir() / "inbox.jsonl"
+    if not path.exists():
+        return 0
+
+    read_nonces = _read_nonces() if unread_only else set()
+    count = 0
+    for _entry, envelopes in _iter_inbox_lines(path):
+        if not envelopes:
+            count += 1
+            continue
+        for env in envelopes:
+            nonce = env.get("nonce", "")
+            if not (nonce and nonce in read_nonces):
+                count += 1
+    return count
 
 
 def get_entry_by_nonce(nonce: str) -> Optional[Dict[str, Any]]:
-    """Find a specific inbox entry by its nonce."""
-    entries = read_inbox()
-    for entry in entries:
-        env = entry.get("envelope")
-        if env and env.get("nonce") == nonce:
-            return entry
-    return None
+    """Find a specific inbox entry by its nonce.
+
+    Uses the nonce -> offset index to read and verify a single line.
+    """
+    path = _dir() / "inbox.jsonl"
+    if not nonce or not path.exists():
+        return None
+
+    offset = _nonce_offsets(path).get(nonce)
+    if offset is None:
+        return None
+    entry = _read_entry_at(path, offset)
+    env = None
+    if entry is not None:
+        env = next((e for e in _entry_envelopes(entry) if e.get("nonce") == nonce), None)
+    if env is None:
+        # Index is stale (inbox rewritten in place); fall back to a scan.
+        with closing(_iter_inbox()) as entries:
+            for found in entries:
+                found_env = found.get("envelope")
+                if found_env and found_env.get("nonce") == nonce:
+                    return found
+        return None
+
+    known_keys = load_known_keys()
+    if _learn_key(env, known_keys):
+        save_known_keys(known_keys)
+    enriched = dict(entry)
+    enriched["envelope"] = env
+    enriched["verified"] = verify_envelope(env, known_keys={k: v["pubkey_hex"] for k, v in known_keys.items()})
+    enriched["is_read"] = nonce in _read_nonces()
+    return enriched
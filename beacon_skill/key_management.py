@@ -1,96 +1,327 @@
 """Key management: TOFU trust, revocation, rotation, and TTL-based expiration."""
 
-import json
+import atexit
+import bisect
+import hashlib
+import threading
 import time
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
-from .storage import _dir
+from .storage import _dir, _dumps, _loads, _write_atomic, file_lock
 
 
-KNOWN_KEYS_FILE = "known_keys.json"
+KNOWN_KEYS_FILE = "known_keys.json"  # legacy single-file store, migrated on load
+KNOWN_KEYS_DIR = "known_keys"
 
 # Default TTL: 30 days in seconds
 DEFAULT_KEY_TTL = int(os.environ.get("BEACON_KEY_TTL", 30 * 24 * 60 * 60))
 
+# update_last_seen() only writes once the stored last_seen is this many
+# seconds old; fresher bumps wait in memory for flush_last_seen().
+LAST_SEEN_FLUSH_INTERVAL = int(os.environ.get("BEACON_LAST_SEEN_FLUSH", 60))
+
+
+# Parsed shard files of the store in "dir": shard name -> ((mtime_ns, size), records),
+# plus the merged agent_id -> record view in "data" and its lazily built
+# expiry index in "expiry" (see _expiry_index).
+_KEYS_CACHE: Dict[str, Any] = {"dir": None, "shards": {}, "data": {}, "expiry": None}
+
+# Unwritten last_seen bumps: store dir -> agent_id -> timestamp.
+_LAST_SEEN_PENDING: Dict[str, Dict[str, int]] = {}
+_LAST_SEEN_LOCK = threading.Lock()
+
+
+def _now_s() -> int:
+    """Whole seconds since the epoch; stored timestamps are ints."""
+    return time.time_ns() // 1_000_000_000
+
 
 def _known_keys_path() -> Path:
     return _dir() / KNOWN_KEYS_FILE
 
 
+def _known_keys_dir() -> Path:
+    return _dir() / KNOWN_KEYS_DIR
+
+
+def _shard_name(agent_id: str) -> str:
+    """Keys are spread over up to 256 files by a stable hash of the agent_id."""
+    return hashlib.sha256(agent_id.encode("utf-8")).hexdigest()[:2]
+
+
+def _copy_keys(keys: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {agent_id: dict(meta) for agent_id, meta in keys.items()}
+
+
 def load_known_keys() -> Dict[str, Dict[str, Any]]:
     """Load agent_id -> key_metadata mapping from disk.
 
     Key metadata format:
     {
         "pubkey_hex": str,
-        "first_seen": float (timestamp),
-        "last_seen": float (timestamp),
+        "first_seen": int (timestamp; older stores may hold floats),
+        "last_seen": int (timestamp),
         "rotation_count": int,
         "previous_key": Optional[str] (hex),
         "revoked": bool,
-        "revoked_at": Optional[float],
+        "revoked_at": Optional[int],
         "revoked_reason": Optional[str],
     }
     """
-    path = _known_keys_path()
-    if not path.exists():
-        return {}
+    keys = _copy_keys(_cached_keys())
+    for agent_id, ts in _pending_last_seen().items():
+        key = keys.get(agent_id)
+        if key is not None and ts > key.get("last_seen", 0):
+            key["last_seen"] = ts
+    return keys
+
+
+def _pending_last_seen() -> Dict[str, int]:
+    """Snapshot of the current store's unwritten last_seen bumps."""
+    with _LAST_SEEN_LOCK:
+        return dict(_LAST_SEEN_PENDING.get(str(_known_keys_dir()), ()))
+
+
+def _with_pending(agent_id: str, key: Dict[str, Any], pending: Dict[str, int]) -> Dict[str, Any]:
+    """``key`` as load_known_keys() would return it: with any newer pending last_seen."""
+    ts = pending.get(agent_id)
+    if ts is not None and ts > key.get("last_seen", 0):
+        return {**key, "last_seen": ts}
+    return key
+
+
+def _cached_keys() -> Dict[str, Dict[str, Any]]:
+    """The parsed store, shared with the cache: read-only callers only.
+
+    Only shard files whose (mtime_ns, size) changed since the last call are
+    re-parsed.
+    """
+    shard_dir = _known_keys_dir()
+    if _KEYS_CACHE["dir"] != str(shard_dir):
+        # First use of this store in the process: the only time a legacy
+        # single-file store is looked for, so later reads skip the check.
+        _migrate_legacy_store(shard_dir)
+        _KEYS_CACHE.update(dir=str(shard_dir), shards={}, data={}, expiry=None)
+    shards: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = _KEYS_CACHE["shards"]
+
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        # Migrate old format (agent_id -> pubkey_hex) to new format
-        migrated = {}
-        for agent_id, value in data.items():
-            if isinstance(value, str):
-                # Old format: just pubkey_hex string
-                migrated[agent_id] = {
-                    "pubkey_hex": value,
-                    "first_seen": time.time(),
-                    "last_seen": time.time(),
-                    "rotation_count": 0,
-                    "previous_key": None,
-                    "revoked": False,
-                    "revoked_at": None,
-                    "revoked_reason": None,
-                }
-            else:
-                migrated[agent_id] = value
-        return migrated
+        entries = list(os.scandir(shard_dir))
+    except OSError:
+        entries = []
+    present = set()
+    changed = False
+    for entry in entries:
+        if not entry.name.endswith(".json"):
+            continue  # e.g. temp files from an in-flight atomic write
+        name = entry.name[:-len(".json")]
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        present.add(name)
+        sig = (st.st_mtime_ns, st.st_size)
+        cached = shards.get(name)
+        if cached is not None and cached[0] == sig:
+            continue
+        try:
+            records = _loads(Path(entry.path).read_bytes())
+        except Exception:
+            records = {}
+        if not isinstance(records, dict):
+            records = {}
+        shards[name] = (sig, records)
+        changed = True
+    for name in set(shards) - present:
+        del shards[name]
+        changed = True
+
+    if changed:
+        _KEYS_CACHE["data"], _KEYS_CACHE["expiry"] = _merge_shards(shards), None
+    return _KEYS_CACHE["data"]
+
+
+def _merge_shards(shards: Dict[str, Tuple[Any, Dict[str, Dict[str, Any]]]]) -> Dict[str, Dict[str, Any]]:
+    merged: Dict[str, Dict[str, Any]] = {}
+    for _sig, records in shards.values():
+        merged.update(records)
+    return merged
+
+
+def _migrate_legacy_store(shard_dir: Path) -> None:
+    """Split a legacy known_keys.json into shard files, once."""
+    legacy = _known_keys_path()
+    if not legacy.exists():
+        return
+    try:
+        data = _loads(legacy.read_bytes())
     except Exception:
-        return {}
+        # Unreadable: keep it aside for inspection rather than re-parsing forever.
+        os.replace(legacy, legacy.with_name(KNOWN_KEYS_FILE + ".bak"))
+        return
+    # Migrate old format (agent_id -> pubkey_hex) to new format
+    migrated = {}
+    now = _now_s()
+    for agent_id, value in data.items():
+        if isinstance(value, str):
+            # Old format: just pubkey_hex string
+            migrated[agent_id] = {
+                "pubkey_hex": value,
+                "first_seen": now,
+                "last_seen": now,
+                "rotation_count": 0,
+                "previous_key": None,
+                "revoked": False,
+                "revoked_at": None,
+                "revoked_reason": None,
+            }
+        else:
+            migrated[agent_id] = value
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    groups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for agent_id, meta in migrated.items():
+        groups.setdefault(_shard_name(agent_id), {})[agent_id] = meta
+    for name, records in groups.items():
+        _write_atomic(shard_dir / f"{name}.json", _dumps(records) + b"\n")
+    try:
+        legacy.unlink()
+    except FileNotFoundError:
+        pass  # another process finished the same migration
 
 
 def save_known_keys(keys: Dict[str, Dict[str, Any]]) -> None:
-    """Save known keys to disk."""
-    path = _known_keys_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(keys, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    """Save known keys to disk.
+
+    Only shard files whose contents differ from what is on disk are
+    rewritten, so touching one agent rewrites roughly 1/256 of the store.
+    """
+    _cached_keys()  # sync the per-shard cache with disk before diffing
+    shards = _KEYS_CACHE["shards"]
+    groups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for agent_id, meta in keys.items():
+        groups.setdefault(_shard_name(agent_id), {})[agent_id] = meta
+
+    shard_dir = _known_keys_dir()
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    changed = False
+    for name in set(groups) | set(shards):
+        records = groups.get(name, {})
+        cached = shards.get(name)
+        if (cached[1] if cached is not None else {}) == records:
+            continue
+        path = shard_dir / f"{name}.json"
+        if records:
+            _write_atomic(path, _dumps(records) + b"\n")
+            st = path.stat()
+            shards[name] = ((st.st_mtime_ns, st.st_size), _copy_keys(records))
+        else:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            shards.pop(name, None)
+        changed = True
+    if changed:
+        _KEYS_CACHE["data"], _KEYS_CACHE["expiry"] = _merge_shards(shards), None
+
+
+def export_known_keys(path: Optional[Path] = None, *, sort_keys: bool = True) -> bytes:
+    """Serialize the whole key store as a single JSON document.
+
+    Shard files keep insertion order so saves never pay for a sort; the
+    export sorts by agent_id (and record fields) for diff-friendly
+    snapshots. Written to ``path`` when given.
+    """
+    keys = _cached_keys()
+    if sort_keys:
+        keys = dict(sorted(keys.items()))
+    data = _dumps(keys, sort_keys=sort_keys) + b"\n"
+    if path is not None:
+        _write_atomic(Path(path), data)
+    return data
+
+
+class KeyStoreBatch:
+    """Load known keys once, apply several mutations, save once on exit.
+
+    The store's advisory lock is held for the whole batch, so concurrent
+    writers cannot interleave between the load and the save.
+
+    Usage:
+        with KeyStoreBatch() as batch:
+            for agent_id, pubkey_hex in peers:
+                batch.trust(agent_id, pubkey_hex)
+    """
+
+    def __init__(self) -> None:
+        self.keys: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        self._lock: Any = None
+
+    def __enter__(self) -> "KeyStoreBatch":
+        self._lock = file_lock(_known_keys_dir())
+        self._lock.__enter__()
+        try:
+            self.keys = load_known_keys()
+        except BaseException:
+            self._lock.__exit__(None, None, None)
+            raise
+        self.dirty = False
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc_type is None and self.dirty:
+                save_known_keys(self.keys)
+        finally:
+            self._lock.__exit__(None, None, None)
+
+    def trust(self, agent_id: str, pubkey_hex: str) -> None:
+        """Add or update a trusted agent key."""
+        now = _now_s()
+        if agent_id in self.keys:
+            # Update existing key
+            self.keys[agent_id]["last_seen"] = now
+        else:
+            # New key
+            self.keys[agent_id] = {
+                "pubkey_hex": pubkey_hex,
+                "first_seen": now,
+                "last_seen": now,
+                "rotation_count": 0,
+                "previous_key": None,
+                "revoked": False,
+                "revoked_at": None,
+                "revoked_reason": None,
+            }
+        self.dirty = True
+
+    def revoke(self, agent_id: str, reason: Optional[str] = None) -> bool:
+        """Revoke a known key; False if the agent is unknown."""
+        key = self.keys.get(agent_id)
+        if key is None:
+            return False
+        key["revoked"] = True
+        key["revoked_at"] = _now_s()
+        key["revoked_reason"] = reason or "Manual revocation"
+        self.dirty = True
+        return True
+
+    def update_last_seen(self, agent_id: str) -> None:
+        """Update the last_seen timestamp for a key, if known."""
+        key = self.keys.get(agent_id)
+        if key is not None:
+            key["last_seen"] = _now_s()
+            self.dirty = True
 
 
 def trust_key(agent_id: str, pubkey_hex: str) -> None:
     """Add or update a trusted agent key."""
-    keys = load_known_keys()
-    now = time.time()
-
-    if agent_id in keys:
-        # Update existing key
-        keys[agent_id]["last_seen"] = now
-    else:
-        # New key
-        keys[agent_id] = {
-            "pubkey_hex": pubkey_hex,
-            "first_seen": now,
-            "last_seen": now,
-            "rotation_count": 0,
-            "previous_key": None,
-            "revoked": False,
-            "revoked_at": None,
-            "revoked_reason": None,
-        }
-
-    save_known_keys(keys)
+    with KeyStoreBatch() as batch:
+        batch.trust(agent_id, pubkey_hex)
 
 
 def revoke_key(agent_id: str, reason: Optional[str] = None) -> bool:
@@ -98,34 +329,20 @@ def revoke_key(agent_id: str, reason: Optional[str] = None) -> bool:
 
     Returns True if key was found and revoked, False if not found.
     """
-    keys = load_known_keys()
-
-    if agent_id not in keys:
-        return False
+    with KeyStoreBatch() as batch:
+        return batch.revoke(agent_id, reason)
 
-    keys[agent_id]["revoked"] = True
-    keys[agent_id]["revoked_at"] = time.time()
-    keys[agent_id]["revoked_reason"] = reason or "Manual revocation"
 
-    save_known_keys(keys)
-    return True
-
-
-def rotate_key(
+def _rotate(
+    keys: Dict[str, Dict[str, Any]],
     agent_id: str,
     new_pubkey_hex: str,
     signature_hex: str,
+    now: float,
 ) -> Tuple[bool, str]:
-    """Rotate a key with signature verification.
-
-    The signature must be the new public key signed by the old private key.
-
-    Returns (success, message).
-    """
+    """Verify and apply one rotation to an already-loaded key store."""
     from .identity import AgentIdentity
 
-    keys = load_known_keys()
-
     if agent_id not in keys:
         return False, f"Agent {agent_id} not found in known keys"
 
@@ -146,7 +363,6 @@ def rotate_key(
         return False, f"Signature verification failed: {e}"
 
     # Perform rotation
-    now = time.time()
     keys[agent_id] = {
         "pubkey_hex": new_pubkey_hex,
         "first_seen": old_key.get("first_seen", now),
@@ -157,39 +373,155 @@ def rotate_key(
         "revoked_at": None,
         "revoked_reason": None,
     }
-
-    save_known_keys(keys)
     return True, f"Key rotated successfully (rotation #{keys[agent_id]['rotation_count']})"
 
 
-def is_key_expired(agent_id: str, ttl: Optional[int] = None) -> bool:
-    """Check if a key has expired based on TTL.
+def rotate_key(
+    agent_id: str,
+    new_pubkey_hex: str,
+    signature_hex: str,
+) -> Tuple[bool, str]:
+    """Rotate a key with signature verification.
 
-    TTL is measured from last_seen timestamp.
+    The signature must be the new public key signed by the old private key.
+
+    Returns (success, message).
     """
-    keys = load_known_keys()
+    return rotate_keys_batch([(agent_id, new_pubkey_hex, signature_hex)])[0]
 
-    if agent_id not in keys:
-        return True  # Unknown key is considered expired
 
-    key = keys[agent_id]
+def rotate_keys_batch(items: List[Tuple[str, str, str]]) -> List[Tuple[bool, str]]:
+    """Rotate several keys with one load and at most one save.
+
+    items: ``(agent_id, new_pubkey_hex, signature_hex)`` triples, applied in
+    order. Returns one ``(success, message)`` per item; a failed item does
+    not prevent the others from being applied.
+    """
+    with KeyStoreBatch() as batch:
+        now = _now_s()
+        results = [_rotate(batch.keys, *item, now) for item in items]
+        if any(ok for ok, _ in results):
+            batch.dirty = True
+        return results
+
+
+@lru_cache(maxsize=4096)
+def _iso(ts: float) -> str:
+    """Memoized local-time ISO rendering of a stored timestamp."""
+    return datetime.fromtimestamp(ts).isoformat()
 
+
+def _expiry_index() -> Tuple[List[float], List[str], List[str]]:
+    """(sorted last_seen, matching agent_ids, revoked agent_ids) for the cached store.
+
+    Built once per store change, so expiry scans become a bisect.
+    """
+    keys = _cached_keys()
+    index = _KEYS_CACHE["expiry"]
+    if index is None:
+        live = sorted(
+            (key.get("last_seen", 0), agent_id)
+            for agent_id, key in keys.items()
+            if not key.get("revoked")
+        )
+        revoked = [agent_id for agent_id, key in keys.items() if key.get("revoked")]
+        index = ([ts for ts, _ in live], [agent_id for _, agent_id in live], revoked)
+        _KEYS_CACHE["expiry"] = index
+    return index
+
+
+def _expired_ids(ttl: int, now: float) -> List[str]:
+    """Agent ids that _is_expired would flag: revoked first, then oldest first."""
+    last_seen, agent_ids, revoked = _expiry_index()
+    # _is_expired: now - last_seen > ttl  <=>  last_seen < now - ttl
+    expired = agent_ids[:bisect.bisect_left(last_seen, now - ttl)]
+    pending = _pending_last_seen()
+    if pending:
+        # The index holds stored last_seen; unwritten bumps can revive a key.
+        expired = [agent_id for agent_id in expired if now - pending.get(agent_id, 0) > ttl]
+    return revoked + expired
+
+
+def _is_expired(key: Dict[str, Any], ttl: int, now: float) -> bool:
+    """Expiry check on an already-loaded key record."""
     if key.get("revoked"):
         return True  # Revoked keys are expired
+    return (now - key.get("last_seen", 0)) > ttl
 
-    ttl = ttl or DEFAULT_KEY_TTL
-    last_seen = key.get("last_seen", 0)
 
-    return (time.time() - last_seen) > ttl
+def is_key_expired(agent_id: str, ttl: Optional[int] = None) -> bool:
+    """Check if a key has expired based on TTL.
+
+    TTL is measured from last_seen timestamp.
+    """
+    key = _cached_keys().get(agent_id)
+
+    if key is None:
+        return True  # Unknown key is considered expired
+
+    key = _with_pending(agent_id, key, _pending_last_seen())
+    return _is_expired(key, ttl or DEFAULT_KEY_TTL, _now_s())
 
 
 def update_last_seen(agent_id: str) -> None:
-    """Update the last_seen timestamp for a key."""
-    keys = load_known_keys()
+    """Update the last_seen timestamp for a key.
 
-    if agent_id in keys:
-        keys[agent_id]["last_seen"] = time.time()
-        save_known_keys(keys)
+    Bumps within LAST_SEEN_FLUSH_INTERVAL of the stored value are kept in
+    memory (visible to load_known_keys) and written by the next flush.
+    """
+    key = _cached_keys().get(agent_id)
+    if key is None:
+        return
+    now = _now_s()
+    with _LAST_SEEN_LOCK:
+        _LAST_SEEN_PENDING.setdefault(str(_known_keys_dir()), {})[agent_id] = now
+    if now - key.get("last_seen", 0) >= LAST_SEEN_FLUSH_INTERVAL:
+        flush_last_seen()
+
+
+def flush_last_seen() -> None:
+    """Write pending last_seen bumps to disk, for every store that has any."""
+    with _LAST_SEEN_LOCK:
+        stores = dict(_LAST_SEEN_PENDING)
+        _LAST_SEEN_PENDING.clear()
+    current = str(_known_keys_dir())
+    for store, pending in stores.items():
+        if store != current:
+            _flush_store_last_seen(Path(store), pending)
+            continue
+        with KeyStoreBatch() as batch:
+            for agent_id, ts in pending.items():
+                key = batch.keys.get(agent_id)
+                if key is not None and ts > key.get("last_seen", 0):
+                    key["last_seen"] = ts
+                    batch.dirty = True
+
+
+def _flush_store_last_seen(shard_dir: Path, pending: Dict[str, int]) -> None:
+    """Apply last_seen bumps to the shard files of a store other than the current one."""
+    if not shard_dir.is_dir():
+        return  # store removed since the bumps were recorded
+    groups: Dict[str, Dict[str, int]] = {}
+    for agent_id, ts in pending.items():
+        groups.setdefault(_shard_name(agent_id), {})[agent_id] = ts
+    with file_lock(shard_dir):
+        for name, bumps in groups.items():
+            path = shard_dir / f"{name}.json"
+            try:
+                records = _loads(path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            changed = False
+            for agent_id, ts in bumps.items():
+                key = records.get(agent_id) if isinstance(records, dict) else None
+                if isinstance(key, dict) and ts > key.get("last_seen", 0):
+                    key["last_seen"] = ts
+                    changed = True
+            if changed:
+                _write_atomic(path, _dumps(records) + b"\n")
+
+
+atexit.register(flush_last_seen)
 
 
 def list_keys(
@@ -209,14 +541,18 @@ def list_keys(
     - is_expired
     - age_days
     """
-    keys = load_known_keys()
+    keys = _cached_keys()
+    pending = _pending_last_seen()
     results = []
+    ttl = ttl or DEFAULT_KEY_TTL
+    now = _now_s()
 
     for agent_id, key in keys.items():
+        key = _with_pending(agent_id, key, pending)
         if not include_revoked and key.get("revoked"):
             continue
 
-        is_expired = is_key_expired(agent_id, ttl)
+        is_expired = _is_expired(key, ttl, now)
         if not include_expired and is_expired:
             continue
 
@@ -226,13 +562,13 @@ def list_keys(
         results.append({
             "agent_id": agent_id,
             "pubkey_hex": key.get("pubkey_hex", ""),
-            "first_seen": datetime.fromtimestamp(first_seen).isoformat() if first_seen else None,
-            "last_seen": datetime.fromtimestamp(last_seen).isoformat() if last_seen else None,
+            "first_seen": _iso(first_seen) if first_seen else None,
+            "last_seen": _iso(last_seen) if last_seen else None,
             "rotation_count": key.get("rotation_count", 0),
             "is_revoked": key.get("revoked", False),
             "revoked_reason": key.get("revoked_reason"),
             "is_expired": is_expired,
-            "age_days": int((time.time() - first_seen) / 86400) if first_seen else 0,
+            "age_days": int((now - first_seen) / 86400) if first_seen else 0,
         })
 
     return results
@@ -240,45 +576,47 @@ def list_keys(
 
 def get_key_info(agent_id: str) -> Optional[Dict[str, Any]]:
     """Get detailed info about a specific key."""
-    keys = load_known_keys()
+    key = _cached_keys().get(agent_id)
 
-    if agent_id not in keys:
+    if key is None:
         return None
 
-    key = keys[agent_id]
+    key = _with_pending(agent_id, key, _pending_last_seen())
+    now = _now_s()
     first_seen = key.get("first_seen", 0)
     last_seen = key.get("last_seen", 0)
 
     return {
         "agent_id": agent_id,
         "pubkey_hex": key.get("pubkey_hex", ""),
-        "first_seen": datetime.fromtimestamp(first_seen).isoformat() if first_seen else None,
-        "last_seen": datetime.fromtimestamp(last_seen).isoformat() if last_seen else None,
+        "first_seen": _iso(first_seen) if first_seen else None,
+        "last_seen": _iso(last_seen) if last_seen else None,
         "rotation_count": key.get("rotation_count", 0),
         "previous_key": key.get("previous_key"),
         "is_revoked": key.get("revoked", False),
-        "revoked_at": datetime.fromtimestamp(key["revoked_at"]).isoformat() if key.get("revoked_at") else None,
+        "revoked_at": _iso(key["revoked_at"]) if key.get("revoked_at") else None,
         "revoked_reason": key.get("revoked_reason"),
-        "is_expired": is_key_expired(agent_id),
-        "age_days": int((time.time() - first_seen) / 86400) if first_seen else 0,
+        "is_expired": _is_expired(key, DEFAULT_KEY_TTL, now),
+        "age_days": int((now - first_seen) / 86400) if first_seen else 0,
     }
 
 
 def cleanup_expired_keys(ttl: Optional[int] = None, dry_run: bool = True) -> List[str]:
     """Remove expired keys from the known keys store.
 
-    Returns list of removed agent_ids.
+    Returns list of removed agent_ids (revoked first, then least recently seen).
     """
-    keys = load_known_keys()
-    removed = []
+    ttl = ttl or DEFAULT_KEY_TTL
+    if dry_run:
+        return _expired_ids(ttl, _now_s())
 
-    for agent_id in list(keys.keys()):
-        if is_key_expired(agent_id, ttl):
-            removed.append(agent_id)
-            if not dry_run:
-                del keys[agent_id]
+    with KeyStoreBatch() as batch:
+        # batch.keys was just loaded, under the lock, from the cache the index covers.
+        removed = _expired_ids(ttl, _now_s())
+        for agent_id in removed:
+            del batch.keys[agent_id]
 
-    if not dry_run and removed:
-        save_known_keys(keys)
+        if removed:
+            batch.dirty = True
 
-    return removed
+        return removed
@@ -11,14 +11,18 @@ deletions while preserving the right to be forgotten.
 Beacon 2.8.0 — Elyan Labs.
 """
 
+import functools
 import hashlib
-import json
 import secrets
 import time
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, TypeVar
 
-from .storage import _dir, append_jsonl, read_jsonl_tail
+from .storage import (
+    _dir, _dumps, _loads, _safe_path, _write_atomic, append_jsonl, file_lock, read_jsonl_tail,
+)
 
 LISTINGS_FILE = "market_listings.jsonl"
 TRANSACTIONS_FILE = "market_transactions.jsonl"
@@ -30,11 +34,50 @@ AMNESIA_QUORUM = 3
 AMNESIA_TOTAL_VOTERS = 5
 # Amnesia cost multiplier: 2x purchase price
 AMNESIA_COST_MULTIPLIER = 2.0
+# Most recent log entries kept in memory per history file.
+HISTORY_TAIL = 500
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _mutator(method: _F) -> _F:
+    """Run a state-mutating method under the manager's state-file lock."""
+    @functools.wraps(method)
+    def wrapper(self: "MemoryMarketManager", *args: Any, **kwargs: Any) -> Any:
+        with self._locked():
+            return method(self, *args, **kwargs)
+    return wrapper  # type: ignore[return-value]
 
 
 class KnowledgeShard:
     """A tradeable unit of agent knowledge."""
 
+    __slots__ = (
+        "shard_id",
+        "owner_id",
+        "domain",
+        "title",
+        "description",
+        "embedding_dims",
+        "entry_count",
+        "price_rtc",
+        "rent_rtc_per_day",
+        "reputation_min",
+        "created_at",
+        "listed",
+        "amnesia",
+        "metadata",
+    )
+
     def __init__(self, data: Dict[str, Any]):
         self.shard_id: str = data.get("shard_id", "")
         self.owner_id: str = data.get("owner_id", "")
@@ -66,38 +109,187 @@ class KnowledgeShard:
             "created_at": self.created_at,
             "listed": self.listed,
             "amnesia": self.amnesia,
-            "metadata": self.metadata,
+            "metadata": dict(self.metadata),
         }
 
 
+def _shard_view(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Same output as ``KnowledgeShard(data).to_dict()`` without the wrapper object."""
+    return {
+        "shard_id": data.get("shard_id", ""),
+        "owner_id": data.get("owner_id", ""),
+        "domain": data.get("domain", ""),
+        "title": data.get("title", ""),
+        "description": data.get("description", ""),
+        "embedding_dims": data.get("embedding_dims", 0),
+        "entry_count": data.get("entry_count", 0),
+        "price_rtc": data.get("price_rtc", 0.0),
+        "rent_rtc_per_day": data.get("rent_rtc_per_day", 0.0),
+        "reputation_min": data.get("reputation_min", 0.0),
+        "created_at": data.get("created_at", 0),
+        "listed": data.get("listed", True),
+        "amnesia": data.get("amnesia", False),
+        "metadata": dict(data.get("metadata", {})),
+    }
+
+
 class MemoryMarketManager:
     """Manage knowledge shard trading and selective amnesia."""
 
     def __init__(self, data_dir: Optional[Path] = None):
         self._dir = data_dir or _dir()
+        # Write-through cache of the state file, keyed by (mtime_ns, size).
+        self._state: Optional[Dict[str, Any]] = None
+        self._state_sig: Optional[Tuple[int, int]] = None
+        # Shard indexes over the cached state, rebuilt on every reload. Dicts
+        # are used as insertion-ordered sets so results keep state order.
+        self._listed_ids: Dict[str, None] = {}  # listed and not amnesia'd
+        self._amnesia_ids: Dict[str, None] = {}
+        # Lowercased domain -> listed shard ids, kept in step with _listed_ids.
+        self._ids_by_domain: Dict[str, Dict[str, None]] = {}
+        # Aggregates over listed shards behind market_stats().
+        self._listed_by_domain: Dict[str, int] = {}
+        self._listed_value = 0.0
+        # shard_id -> unresolved amnesia request ids, oldest first.
+        self._open_amnesia: Dict[str, List[str]] = {}
+        # log name -> (file signature, last HISTORY_TAIL entries), so history
+        # queries after our own appends are served without re-reading the file.
+        self._tails: Dict[str, Tuple[Optional[Tuple[int, int]], Deque[Dict[str, Any]]]] = {}
+        # Inside batch() state saves are deferred until the outermost exit.
+        self._batch_depth = 0
+        self._dirty = False
 
     def _state_path(self) -> Path:
         return self._dir / MARKET_STATE_FILE
 
-    def _load_state(self) -> Dict[str, Any]:
-        path = self._state_path()
-        if not path.exists():
-            return {"shards": {}, "rentals": {}, "amnesia_requests": {}}
+    @staticmethod
+    def _empty_state() -> Dict[str, Any]:
+        return {"shards": {}, "rentals": {}, "amnesia_requests": {}}
+
+    def _state_signature(self) -> Optional[Tuple[int, int]]:
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            data.setdefault("shards", {})
-            data.setdefault("rentals", {})
-            data.setdefault("amnesia_requests", {})
-            return data
-        except Exception:
-            return {"shards": {}, "rentals": {}, "amnesia_requests": {}}
+            st = self._state_path().stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _load_state(self) -> Dict[str, Any]:
+        if self._dirty and self._state is not None:
+            return self._state  # unflushed changes win over the file
+        sig = self._state_signature()
+        if self._state is not None and sig == self._state_sig:
+            return self._state
+        data = self._empty_state()
+        if sig is not None:
+            try:
+                data = _loads(self._state_path().read_bytes())
+                data.setdefault("shards", {})
+                data.setdefault("rentals", {})
+                data.setdefault("amnesia_requests", {})
+            except Exception:
+                data = self._empty_state()
+        self._state, self._state_sig = data, sig
+        self._build_indexes(data)
+        return data
+
+    def _build_indexes(self, state: Dict[str, Any]) -> None:
+        self._listed_ids, self._amnesia_ids, self._ids_by_domain = {}, {}, {}
+        self._listed_by_domain, self._listed_value = {}, 0.0
+        for shard_id, shard in state["shards"].items():
+            self._index_shard(shard_id, shard)
+        self._open_amnesia = {}
+        for request_id, req in state["amnesia_requests"].items():
+            if not req.get("resolved_at"):
+                self._open_amnesia.setdefault(req.get("shard_id", ""), []).append(request_id)
+
+    def _index_shard(self, shard_id: str, shard: Dict[str, Any]) -> None:
+        """(Re)file one shard in the listed/amnesia/domain indexes."""
+        if shard.get("amnesia", False):
+            self._amnesia_ids[shard_id] = None
+        else:
+            self._amnesia_ids.pop(shard_id, None)
+        listed = bool(shard.get("listed", False) and not shard.get("amnesia", False))
+        if listed == (shard_id in self._listed_ids):
+            return
+        delta = 1 if listed else -1
+        key = shard.get("domain", "").lower()
+        if listed:
+            self._listed_ids[shard_id] = None
+            self._ids_by_domain.setdefault(key, {})[shard_id] = None
+        else:
+            del self._listed_ids[shard_id]
+            ids = self._ids_by_domain.get(key, {})
+            ids.pop(shard_id, None)
+            if not ids:
+                self._ids_by_domain.pop(key, None)
+        domain = shard.get("domain", "other")
+        count = self._listed_by_domain.get(domain, 0) + delta
+        if count:
+            self._listed_by_domain[domain] = count
+        else:
+            self._listed_by_domain.pop(domain, None)
+        self._listed_value += delta * shard.get("price_rtc", 0)
 
     def _save_state(self, state: Dict[str, Any]) -> None:
-        self._state_path().parent.mkdir(parents=True, exist_ok=True)
-        self._state_path().write_text(
-            json.dumps(state, indent=2, sort_keys=True) + "\n",
-            encoding="utf-8",
-        )
+        if state is not self._state:
+            self._build_indexes(state)
+        self._state = state
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        path = self._state_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, _dumps(state) + b"\n")
+        self._state_sig = self._state_signature()
+
+    def flush(self) -> None:
+        """Write pending state to disk."""
+        if self._dirty and self._state is not None:
+            self._write_state(self._state)
+            self._dirty = False
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the state file's advisory lock (re-entrant per thread)."""
+        with file_lock(self._state_path()):
+            yield
+
+    @contextmanager
+    def batch(self) -> Iterator["MemoryMarketManager"]:
+        """Group-commit mutations: one state write on exit, under one lock."""
+        with self._locked():
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+
+    def _append_history(self, name: str, record: Dict[str, Any]) -> None:
+        """Append to a market log, keeping the in-memory tail in step."""
+        path = _safe_path(name)
+        cached = self._tails.get(name)
+        in_step = cached is not None and cached[0] == _file_signature(path)
+        append_jsonl(name, record)
+        if in_step:
+            cached[1].append(dict(record))
+            self._tails[name] = (_file_signature(path), cached[1])
+        else:
+            self._tails.pop(name, None)  # someone else wrote; reload lazily
+
+    def _history(self, name: str, limit: int) -> List[Dict[str, Any]]:
+        if not 0 < limit <= HISTORY_TAIL:
+            return read_jsonl_tail(name, limit=limit)
+        sig = _file_signature(_safe_path(name))
+        cached = self._tails.get(name)
+        if cached is None or cached[0] != sig:
+            cached = (sig, deque(read_jsonl_tail(name, limit=HISTORY_TAIL), maxlen=HISTORY_TAIL))
+            self._tails[name] = cached
+        tail = cached[1]
+        return [dict(entry) for entry in list(tail)[-limit:]]
 
     @staticmethod
     def _generate_shard_id(content_hint: str) -> str:
@@ -107,6 +299,7 @@ class MemoryMarketManager:
 
     # ── Listing Shards ──
 
+    @_mutator
     def list_shard(
         self,
         identity: Any,
@@ -160,9 +353,10 @@ class MemoryMarketManager:
 
         state = self._load_state()
         state["shards"][shard_id] = shard_data
+        self._index_shard(shard_id, shard_data)
         self._save_state(state)
 
-        append_jsonl(LISTINGS_FILE, {
+        self._append_history(LISTINGS_FILE, {
             "ts": now,
             "action": "list",
             "shard_id": shard_id,
@@ -180,6 +374,7 @@ class MemoryMarketManager:
             "title": title,
         }
 
+    @_mutator
     def delist_shard(self, identity: Any, shard_id: str) -> Dict[str, Any]:
         """Remove a shard from the market."""
         state = self._load_state()
@@ -190,6 +385,7 @@ class MemoryMarketManager:
             return {"error": "Not the owner"}
 
         shard["listed"] = False
+        self._index_shard(shard_id, shard)
         self._save_state(state)
         return {"ok": True, "shard_id": shard_id, "delisted": True}
 
@@ -212,21 +408,22 @@ class MemoryMarketManager:
             List of listed shards (public view).
         """
         state = self._load_state()
+        shards = state["shards"]
         results = []
 
-        for shard_data in state["shards"].values():
-            if not shard_data.get("listed", False):
-                continue
-            if shard_data.get("amnesia", False):
-                continue
-            if domain and shard_data.get("domain", "").lower() != domain.lower():
-                continue
+        if domain:
+            candidates = list(self._ids_by_domain.get(domain.lower(), ()))
+        else:
+            candidates = list(self._listed_ids)
+
+        for shard_id in candidates:
+            shard_data = shards[shard_id]
             if max_price is not None and shard_data.get("price_rtc", 0) > max_price:
                 continue
             if shard_data.get("entry_count", 0) < min_entries:
                 continue
 
-            results.append(KnowledgeShard(shard_data).to_dict())
+            results.append(_shard_view(shard_data))
 
         results.sort(key=lambda s: s.get("created_at", 0), reverse=True)
         return results
@@ -236,7 +433,7 @@ class MemoryMarketManager:
         state = self._load_state()
         data = state["shards"].get(shard_id)
         if data:
-            return KnowledgeShard(data).to_dict()
+            return _shard_view(data)
         return None
 
     # ── Purchasing ──
@@ -281,7 +478,7 @@ class MemoryMarketManager:
             "title": shard.get("title", ""),
         }
 
-        append_jsonl(TRANSACTIONS_FILE, tx)
+        self._append_history(TRANSACTIONS_FILE, tx)
 
         return {
             "ok": True,
@@ -292,6 +489,7 @@ class MemoryMarketManager:
 
     # ── Renting ──
 
+    @_mutator
     def rent_shard(
         self,
         renter_id: str,
@@ -336,7 +534,7 @@ class MemoryMarketManager:
         state["rentals"][rental_id] = rental
         self._save_state(state)
 
-        append_jsonl(TRANSACTIONS_FILE, {
+        self._append_history(TRANSACTIONS_FILE, {
             "ts": now,
             "action": "rent",
             **rental,
@@ -344,7 +542,7 @@ class MemoryMarketManager:
 
         return {
             "ok": True,
-            "rental": rental,
+            "rental": dict(rental),
             "rtc_amount": total_rtc,
         }
 
@@ -357,11 +555,12 @@ class MemoryMarketManager:
             if rental.get("expires_at", 0) < now:
                 continue
             if rental.get("renter_id") == agent_id or rental.get("owner_id") == agent_id:
-                results.append(rental)
+                results.append(dict(rental))
         return results
 
     # ── Selective Amnesia ──
 
+    @_mutator
     def request_amnesia(
         self,
         identity: Any,
@@ -408,9 +607,10 @@ class MemoryMarketManager:
         }
 
         state["amnesia_requests"][request_id] = request
+        self._open_amnesia.setdefault(shard_id, []).append(request_id)
         self._save_state(state)
 
-        append_jsonl(AMNESIA_FILE, {
+        self._append_history(AMNESIA_FILE, {
             "ts": now,
             "action": "request",
             "request_id": request_id,
@@ -428,6 +628,7 @@ class MemoryMarketManager:
             "status": "pending",
         }
 
+    @_mutator
     def amnesia_vote(
         self,
         shard_id: str,
@@ -447,13 +648,9 @@ class MemoryMarketManager:
         state = self._load_state()
 
         # Find the active amnesia request for this shard
-        target_req = None
-        target_id = None
-        for req_id, req in state["amnesia_requests"].items():
-            if req.get("shard_id") == shard_id and not req.get("resolved_at"):
-                target_req = req
-                target_id = req_id
-                break
+        open_ids = self._open_amnesia.get(shard_id)
+        target_id = open_ids[0] if open_ids else None
+        target_req = state["amnesia_requests"].get(target_id) if target_id else None
 
         if not target_req:
             return {"error": "No active amnesia request for this shard"}
@@ -466,10 +663,13 @@ class MemoryMarketManager:
         target_req["votes"][voter_id] = approve
         now = int(time.time())
 
-        # Check if quorum reached
-        approvals = sum(1 for v in target_req["votes"].values() if v)
-        rejections = sum(1 for v in target_req["votes"].values() if not v)
+        # Check if quorum reached (one pass over the votes)
+        approvals = 0
+        for vote in target_req["votes"].values():
+            if vote:
+                approvals += 1
         total_votes = len(target_req["votes"])
+        rejections = total_votes - approvals
 
         resolved = False
         approved = False
@@ -486,6 +686,7 @@ class MemoryMarketManager:
                 shard["amnesia"] = True
                 shard["listed"] = False
                 shard["amnesia_at"] = now
+                self._index_shard(shard_id, shard)
 
         elif rejections > (AMNESIA_TOTAL_VOTERS - AMNESIA_QUORUM):
             # Impossible to reach quorum — rejected
@@ -493,9 +694,14 @@ class MemoryMarketManager:
             target_req["approved"] = False
             target_req["resolved_at"] = now
 
+        if resolved:
+            open_ids.pop(0)
+            if not open_ids:
+                del self._open_amnesia[shard_id]
+
         self._save_state(state)
 
-        append_jsonl(AMNESIA_FILE, {
+        self._append_history(AMNESIA_FILE, {
             "ts": now,
             "action": "vote",
             "request_id": target_id,
@@ -522,7 +728,8 @@ class MemoryMarketManager:
         """List pending amnesia requests awaiting votes."""
         state = self._load_state()
         return [
-            req for req in state["amnesia_requests"].values()
+            {**req, "votes": dict(req.get("votes", {}))}
+            for req in state["amnesia_requests"].values()
             if not req.get("resolved_at")
         ]
 
@@ -530,43 +737,33 @@ class MemoryMarketManager:
 
     def transaction_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Recent market transactions (purchases and rentals)."""
-        return read_jsonl_tail(TRANSACTIONS_FILE, limit=limit)
+        return self._history(TRANSACTIONS_FILE, limit)
 
     def listing_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Recent listing events."""
-        return read_jsonl_tail(LISTINGS_FILE, limit=limit)
+        return self._history(LISTINGS_FILE, limit)
 
     def amnesia_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Recent amnesia events."""
-        return read_jsonl_tail(AMNESIA_FILE, limit=limit)
+        return self._history(AMNESIA_FILE, limit)
 
     # ── Stats ──
 
     def market_stats(self) -> Dict[str, Any]:
         """Overall market statistics."""
         state = self._load_state()
-        shards = list(state["shards"].values())
-
-        listed = [s for s in shards if s.get("listed") and not s.get("amnesia")]
-        amnesia_count = sum(1 for s in shards if s.get("amnesia"))
-
-        by_domain: Dict[str, int] = {}
-        total_value = 0.0
-        for s in listed:
-            d = s.get("domain", "other")
-            by_domain[d] = by_domain.get(d, 0) + 1
-            total_value += s.get("price_rtc", 0)
+        now = int(time.time())
 
         return {
-            "total_shards": len(shards),
-            "listed": len(listed),
-            "amnesia_count": amnesia_count,
-            "by_domain": by_domain,
-            "total_market_value_rtc": round(total_value, 6),
-            "active_rentals": len([
-                r for r in state["rentals"].values()
-                if r.get("expires_at", 0) > time.time()
-            ]),
-            "pending_amnesia": len(self.pending_amnesia()),
-            "ts": int(time.time()),
+            "total_shards": len(state["shards"]),
+            "listed": len(self._listed_ids),
+            "amnesia_count": len(self._amnesia_ids),
+            "by_domain": dict(self._listed_by_domain),
+            # + 0.0 turns a -0.0 left by add/subtract float drift into 0.0.
+            "total_market_value_rtc": round(self._listed_value, 6) + 0.0,
+            "active_rentals": sum(
+                1 for r in state["rentals"].values() if r.get("expires_at", 0) > now
+            ),
+            "pending_amnesia": sum(len(ids) for ids in self._open_amnesia.values()),
+            "ts": now,
         }
@@ -10,16 +10,157 @@ anchors the entire reasoning chain without exposing any part of it.
 Beacon 2.8.0 — Elyan Labs.
 """
 
-import hashlib
-import json
+import os
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import sha256 as _sha256
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from .anchor import commitment_hash
-from .storage import _dir, append_jsonl, read_jsonl_tail
+try:
+    import xxhash  # optional dep: XXH3 for non-cryptographic keys
+except ImportError:
+    xxhash = None
+
+from .anchor import _canonical_json, commitment_hash
+from .storage import (
+    BINARY_LOG, _dir, append_framed_many, append_jsonl_many, read_framed_tail, read_jsonl_tail,
+)
 
 PROOF_LOG_FILE = "thought_proofs.jsonl"
 CHALLENGE_LOG_FILE = "thought_challenges.jsonl"
+# Used instead of the JSONL logs when BEACON_BINARY_LOG=1.
+PROOF_FRAMED_FILE = "thought_proofs.bin"
+CHALLENGE_FRAMED_FILE = "thought_challenges.bin"
+_FRAMED_FILES = {PROOF_LOG_FILE: PROOF_FRAMED_FILE, CHALLENGE_LOG_FILE: CHALLENGE_FRAMED_FILE}
+
+# Ed25519 signatures are deterministic, so re-proofing the same commitment
+# can reuse the signature; this many are kept per manager.
+SIG_CACHE_SIZE = 1024
+
+# hashlib drops the GIL while digesting large buffers, so once two of the
+# inputs are at least this big the largest is hashed on a second thread.
+# On a single CPU the threads only contend, so hashing stays sequential.
+PARALLEL_HASH_BYTES = 256 * 1024
+_PARALLEL_HASH = (os.cpu_count() or 1) > 1
+
+# Traces at least this long are hashed through a _PrefixHasher, which keeps
+# SHA256 midstates every PREFIX_CHECKPOINT_BYTES so a trace sharing a long
+# prefix with a recent one (a growing transcript, a fixed system prompt)
+# only digests the part after the last shared checkpoint.
+PREFIX_CHECKPOINT_BYTES = 64 * 1024
+PREFIX_CACHE_SIZE = 4
+
+# Byte map for _word_count: the ASCII bytes str.split() treats as
+# whitespace become b" ", everything else b"x".
+_WORD_MARKS = bytes(32 if chr(i).isspace() else 120 for i in range(256))
+
+
+def _word_count(text: str) -> int:
+    """``len(text.split())`` without building the word list.
+
+    ASCII text is mapped to space/non-space marks in one C-level pass and
+    word starts are counted; other text falls back to str.split().
+    """
+    if not text.isascii():
+        return len(text.split())
+    marks = text.encode("ascii").translate(_WORD_MARKS)
+    return marks.count(b" x") + marks.startswith(b"x")
+
+
+def _utf8(text: Union[str, bytes]) -> bytes:
+    return text if isinstance(text, bytes) else text.encode("utf-8")
+
+
+def _sha256_hex(data: bytes) -> str:
+    return _sha256(data).hexdigest()
+
+
+def _block_key(block: bytes) -> int:
+    """Non-cryptographic key for a cache lookup; SHA256 stays for proofs."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(block)
+    return hash(block)
+
+
+class _PrefixHasher:
+    """SHA256 that resumes from midstates of recently hashed long inputs.
+
+    Inputs are remembered by a _block_key of their first checkpoint-sized
+    block; on a repeat, shared checkpoint blocks are compared as bytes
+    slices (a copy plus a memcmp, still several times cheaper than
+    digesting them) and hashing resumes from a ``copy()`` of the last
+    matching midstate.
+    """
+
+    def __init__(self, max_inputs: int = PREFIX_CACHE_SIZE, step: int = PREFIX_CHECKPOINT_BYTES):
+        self._max = max_inputs
+        self._step = step
+        # first block key -> (input, midstate after each full block), oldest first.
+        self._entries: Dict[int, Tuple[bytes, List[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, data: bytes) -> str:
+        step = self._step
+        if len(data) < 2 * step:
+            return _sha256(data).hexdigest()
+        key = _block_key(data[:step])
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        states: List[Any] = []
+        if entry is not None:
+            prev, prev_states = entry
+            for i, state in enumerate(prev_states):
+                lo, hi = i * step, (i + 1) * step
+                # bytes slices, not memoryviews: memoryview equality
+                # compares element by element and is far slower.
+                if hi > len(data) or data[lo:hi] != prev[lo:hi]:
+                    break
+                states.append(state)
+        h = states[-1].copy() if states else _sha256()
+        view = memoryview(data)
+        pos, end = len(states) * step, len(data) - step
+        while pos <= end:
+            h.update(view[pos:pos + step])
+            pos += step
+            states.append(h.copy())
+        h.update(view[pos:])
+        with self._lock:
+            self._entries[key] = (data, states)
+            while len(self._entries) > self._max:
+                del self._entries[next(iter(self._entries))]
+        return h.hexdigest()
+
+
+def _hash_texts(
+    prompt: Union[str, bytes], trace: Union[str, bytes], output: Union[str, bytes],
+    trace_hasher: Callable[[bytes], str] = _sha256_hex,
+) -> Tuple[str, str, str]:
+    """SHA256 hex digests of prompt, trace and output (bytes are hashed as-is).
+
+    ``trace_hasher`` digests the trace, e.g. a manager's _PrefixHasher.
+    """
+    data = (_utf8(prompt), _utf8(trace), _utf8(output))
+    # Cheap necessary condition for the threaded path, so short inputs
+    # never pay for the sort.
+    if _PARALLEL_HASH and len(data[0]) + len(data[1]) + len(data[2]) >= 2 * PARALLEL_HASH_BYTES:
+        hashers = (_sha256_hex, trace_hasher, _sha256_hex)
+        order = sorted(range(3), key=lambda i: len(data[i]))
+        if len(data[order[1]]) >= PARALLEL_HASH_BYTES:
+            digests = ["", "", ""]
+            big = order[2]
+
+            def hash_big() -> None:
+                digests[big] = hashers[big](data[big])
+
+            worker = threading.Thread(target=hash_big, daemon=True)
+            worker.start()
+            for i in order[:2]:
+                digests[i] = hashers[i](data[i])
+            worker.join()
+            return digests[0], digests[1], digests[2]
+    return _sha256(data[0]).hexdigest(), trace_hasher(data[1]), _sha256(data[2]).hexdigest()
 
 
 class ThoughtProof:
@@ -46,6 +187,7 @@ class ThoughtProof:
         self.token_count = token_count
         self.ts = ts or int(time.time())
         self.sig = sig
+        self._canonical: Optional[Tuple[Tuple[Any, ...], bytes]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -60,6 +202,17 @@ class ThoughtProof:
             "sig": self.sig,
         }
 
+    def canonical_bytes(self) -> bytes:
+        """Canonical JSON of to_dict(), as hashed by AnchorManager.anchor().
+
+        Encoded once and reused until a field changes.
+        """
+        key = (self.agent_id, self.prompt_hash, self.trace_hash, self.output_hash,
+               self.commitment, self.model_id, self.token_count, self.ts, self.sig)
+        if self._canonical is None or self._canonical[0] != key:
+            self._canonical = (key, _canonical_json(self.to_dict()))
+        return self._canonical[1]
+
     def to_envelope(self) -> Dict[str, Any]:
         """Convert to a beacon envelope payload."""
         return {
@@ -73,17 +226,45 @@ class ThoughtProofManager:
 
     def __init__(self, data_dir=None):
         self._dir = data_dir or _dir()
+        # (agent_id, commitment) -> signature hex, oldest first.
+        self._sig_cache: Dict[Tuple[str, str], str] = {}
+        self._trace_hasher = _PrefixHasher()
+        self._binary_log = BINARY_LOG
+
+    def _append_log(self, name: str, entries: List[Dict[str, Any]]) -> None:
+        if self._binary_log:
+            append_framed_many(_FRAMED_FILES[name], entries, buffered=True)
+        else:
+            append_jsonl_many(name, entries, buffered=True)
+
+    def _read_log(self, name: str, limit: int) -> List[Dict[str, Any]]:
+        if self._binary_log:
+            return read_framed_tail(_FRAMED_FILES[name], limit=limit)
+        return read_jsonl_tail(name, limit=limit)
 
     @staticmethod
     def _hash(data: str) -> str:
         """SHA256 hash of a string."""
-        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+        return _sha256(data.encode("utf-8")).hexdigest()
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _compute_commitment(prompt_hash: str, trace_hash: str, output_hash: str) -> str:
         """Compute the triple-hash commitment."""
-        combined = f"{prompt_hash}:{trace_hash}:{output_hash}"
-        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+        # Same bytes as the UTF-8 of "prompt_hash:trace_hash:output_hash".
+        combined = b":".join((prompt_hash.encode(), trace_hash.encode(), output_hash.encode()))
+        return _sha256(combined).hexdigest()
+
+    def _sign_commitment(self, identity: Any, commitment: str) -> str:
+        """Sign a commitment, reusing the signature for repeated commitments."""
+        key = (identity.agent_id, commitment)
+        sig = self._sig_cache.get(key)
+        if sig is None:
+            sig = identity.sign_hex(commitment.encode("utf-8"))
+            if len(self._sig_cache) >= SIG_CACHE_SIZE:
+                del self._sig_cache[next(iter(self._sig_cache))]
+            self._sig_cache[key] = sig
+        return sig
 
     def create_proof(
         self,
@@ -105,31 +286,57 @@ class ThoughtProofManager:
         Returns:
             ThoughtProof with commitment hash and signature.
         """
-        prompt_hash = self._hash(prompt)
-        trace_hash = self._hash(trace)
-        output_hash = self._hash(output)
-        commitment = self._compute_commitment(prompt_hash, trace_hash, output_hash)
-        token_count = len(trace.split())  # Approximate word count
+        hashes = _hash_texts(prompt, trace, output, self._trace_hasher)
+        proof = self._build_proof(identity, hashes, _word_count(trace), model_id)
+
+        # Log locally
+        self._append_log(PROOF_LOG_FILE, [proof.to_dict()])
+
+        return proof
+
+    def create_proofs_batch(
+        self,
+        identity: Any,
+        items: List[Tuple[str, str, str]],
+        model_id: str = "",
+    ) -> List[ThoughtProof]:
+        """Create proofs for many (prompt, trace, output) tuples.
 
-        # Sign the commitment
-        sig = identity.sign_hex(commitment.encode("utf-8"))
+        Hashing runs on a thread pool (hashlib releases the GIL), signing
+        stays on the calling thread and the log is appended in one write.
+        """
+
+        def digest(item: Tuple[str, str, str]) -> Tuple[Tuple[str, str, str], int]:
+            prompt, trace, output = item
+            return _hash_texts(prompt, trace, output, self._trace_hasher), _word_count(trace)
+
+        workers = min(os.cpu_count() or 1, len(items))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                digests = list(pool.map(digest, items))
+        else:
+            digests = [digest(item) for item in items]
+
+        proofs = [self._build_proof(identity, hashes, count, model_id) for hashes, count in digests]
+        self._append_log(PROOF_LOG_FILE, [p.to_dict() for p in proofs])
+        return proofs
 
-        proof = ThoughtProof(
+    def _build_proof(
+        self, identity: Any, hashes: Tuple[str, str, str], token_count: int, model_id: str,
+    ) -> ThoughtProof:
+        prompt_hash, trace_hash, output_hash = hashes
+        commitment = self._compute_commitment(prompt_hash, trace_hash, output_hash)
+        return ThoughtProof(
             agent_id=identity.agent_id,
             prompt_hash=prompt_hash,
             trace_hash=trace_hash,
             output_hash=output_hash,
             commitment=commitment,
             model_id=model_id,
-            token_count=token_count,
-            sig=sig,
+            token_count=token_count,  # Approximate word count
+            sig=self._sign_commitment(identity, commitment),
         )
 
-        # Log locally
-        append_jsonl(PROOF_LOG_FILE, proof.to_dict())
-
-        return proof
-
     def anchor_proof(self, proof: ThoughtProof, anchor_mgr: Any) -> Dict[str, Any]:
         """Anchor a thought proof to RustChain.
 
@@ -140,8 +347,8 @@ class ThoughtProofManager:
         Returns:
             Anchor submission result.
         """
-        return anchor_mgr.anchor(
-            proof.to_dict(),
+        return anchor_mgr.anchor_bytes(
+            proof.canonical_bytes(),
             data_type="proof_of_thought",
             metadata={
                 "agent_id": proof.agent_id,
@@ -153,9 +360,9 @@ class ThoughtProofManager:
     def verify_proof(
         self,
         commitment: str,
-        prompt: str,
-        trace: str,
-        output: str,
+        prompt: Union[str, bytes],
+        trace: Union[str, bytes],
+        output: Union[str, bytes],
     ) -> bool:
         """Verify that data matches a commitment hash.
 
@@ -164,16 +371,14 @@ class ThoughtProofManager:
 
         Args:
             commitment: The claimed commitment hash.
-            prompt: The revealed prompt.
-            trace: The revealed reasoning trace.
-            output: The revealed output.
+            prompt: The revealed prompt (str, or its UTF-8 bytes).
+            trace: The revealed reasoning trace (str or UTF-8 bytes).
+            output: The revealed output (str or UTF-8 bytes).
 
         Returns:
             True if the data matches the commitment.
         """
-        prompt_hash = self._hash(prompt)
-        trace_hash = self._hash(trace)
-        output_hash = self._hash(output)
+        prompt_hash, trace_hash, output_hash = _hash_texts(prompt, trace, output, self._trace_hasher)
         computed = self._compute_commitment(prompt_hash, trace_hash, output_hash)
         return computed == commitment
 
@@ -205,7 +410,7 @@ class ThoughtProofManager:
             "ts": now,
         }
 
-        append_jsonl(CHALLENGE_LOG_FILE, challenge)
+        self._append_log(CHALLENGE_LOG_FILE, [challenge])
         return challenge
 
     def reveal_proof(
@@ -246,15 +451,15 @@ class ThoughtProofManager:
         }
 
         # Sign the reveal
-        sig = identity.sign_hex(commitment.encode("utf-8"))
+        sig = self._sign_commitment(identity, commitment)
         reveal["sig"] = sig
 
         return reveal
 
     def proof_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """List our locally created thought proofs."""
-        return read_jsonl_tail(PROOF_LOG_FILE, limit=limit)
+        return self._read_log(PROOF_LOG_FILE, limit)
 
     def challenge_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """List challenges we've issued or received."""
-        return read_jsonl_tail(CHALLENGE_LOG_FILE, limit=limit)
+        return self._read_log(CHALLENGE_LOG_FILE, limit)
@@ -128,7 +128,7 @@ class RelayManager:
         )
 
     def _log(self, entry: Dict[str, Any]) -> None:
-        append_jsonl(RELAY_LOG_FILE, entry)
+        append_jsonl(RELAY_LOG_FILE, entry, buffered=True)
 
     def _generate_token(self) -> str:
         """Generate a relay bearer token."""
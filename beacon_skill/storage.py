@@ -1,9 +1,140 @@
+import atexit
 import fcntl
 import json
+import math
+import os
+import re
+import struct
+import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import orjson  # optional dep: C-backed, bytes in/out
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # optional dep: compact binary payloads for framed logs
+except ImportError:
+    msgpack = None
+
+
+# Read sizes for the backwards tail scan and the forward newline count.
+_SCAN_CHUNK = 64 * 1024
+_COUNT_CHUNK = 1 << 20
+# A blank line (only ASCII whitespace, as bytes.strip() removes) and any
+# byte that would make a line non-blank.
+_BLANK_LINE = re.compile(rb"^[ \t\r\x0b\x0c]*\n", re.MULTILINE)
+_NON_SPACE = re.compile(rb"[^ \t\n\r\x0b\x0c]")
+
+# Debug aid: BEACON_PRETTY_JSON=1 makes _dumps emit indented, key-sorted JSON.
+PRETTY_JSON = os.environ.get("BEACON_PRETTY_JSON", "") == "1"
+
+# BEACON_BINARY_LOG=1 makes opted-in logs use the framed format below
+# instead of JSONL.
+BINARY_LOG = os.environ.get("BEACON_BINARY_LOG", "") == "1"
+
+# Framed log record: <u32 n> <codec byte> <payload (n - 1 bytes)> <u32 n>.
+# The trailing length lets a tail read walk back frame by frame.
+_FRAME_LEN = struct.Struct("<I")
+_CODEC_JSON = b"j"
+_CODEC_MSGPACK = b"m"
+
+# Every integer orjson cannot hold exactly (below -2**63 or above
+# 2**64 - 1) has at least 19 digits.
+_LONG_DIGITS = re.compile(rb"[0-9]{19}")
+_LONG_DIGITS_STR = re.compile(r"[0-9]{19}")
+
+# Line breaks str.splitlines() splits on that JSON leaves unescaped in
+# UTF-8 output; escaped so a JSONL record always stays on one line.
+_LINE_SEPARATORS = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"), (b"\xc2\x85", b"\\u0085"))
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or bytes, using orjson when available.
+
+    orjson turns integers outside the 64-bit range into floats, which would
+    break signed payloads; any input with a digit run long enough to hold
+    one is parsed by the stdlib instead.
+    """
+    if orjson is not None:
+        long_digits = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except ValueError:
+                pass  # e.g. NaN written by the stdlib encoder: let json decide
+    return json.loads(data)
+
+
+def _dumps(obj: Any, *, sort_keys: bool = False, indent: Optional[bool] = None) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available.
+
+    Compact unless ``indent`` is true (two spaces). ``indent=None`` follows
+    BEACON_PRETTY_JSON; pass ``indent=False`` for single-line output.
+    """
+    if indent is None and PRETTY_JSON:
+        indent = sort_keys = True
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            data = orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits: let json decide
+        else:
+            # orjson writes NaN and infinities as null; json keeps them.
+            if b"null" not in data or not _has_non_finite(obj):
+                return _escape_line_separators(data)
+    if indent:
+        text = json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False)
+    return _escape_line_separators(text.encode("utf-8"))
+
+
+def _escape_line_separators(data: bytes) -> bytes:
+    for raw, escaped in _LINE_SEPARATORS:
+        if raw in data:
+            data = data.replace(raw, escaped)
+    return data
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """True if ``obj`` holds a NaN or infinite float anywhere."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(k) or _has_non_finite(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file and rename it over ``path``.
+
+    Readers see either the old or the new contents, never a torn write.
+    """
+    # One temp file per writing thread, so concurrent writers never share or
+    # rename each other's half-written file. (Not mkstemp: it would make
+    # every rewritten file 0600.)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
 
 
 def _dir() -> Path:
@@ -12,23 +143,97 @@ def _dir() -> Path:
     return d
 
 
+class _FileLockState:
+    __slots__ = ("rlock", "fh", "pid", "depth", "users")
+
+    def __init__(self) -> None:
+        self.rlock = threading.RLock()
+        self.fh: Any = None
+        self.pid = 0
+        self.depth = 0
+        self.users = 0  # file_lock() calls holding or waiting on this state
+
+
+# lock file path -> in-process lock plus the lock file kept open between uses.
+_file_locks: Dict[Path, _FileLockState] = {}
+_file_locks_guard = threading.Lock()
+_MAX_OPEN_LOCK_FILES = 64
+
+
+def _lock_state(lock_path: Path) -> _FileLockState:
+    """The state for ``lock_path``, counted as in use until _release_state()."""
+    with _file_locks_guard:
+        state = _file_locks.get(lock_path)
+        if state is None:
+            if len(_file_locks) >= _MAX_OPEN_LOCK_FILES:
+                # Only unused states are evicted, so each path never has
+                # two live states (and two RLocks) at once.
+                for other, idle in list(_file_locks.items()):
+                    if idle.users == 0:
+                        if idle.fh is not None:
+                            idle.fh.close()
+                            idle.fh = None
+                        del _file_locks[other]
+            state = _file_locks[lock_path] = _FileLockState()
+        state.users += 1
+        return state
+
+
+def _release_state(state: _FileLockState) -> None:
+    with _file_locks_guard:
+        state.users -= 1
+
+
+@contextmanager
+def file_lock(path: Path, write: bool = True):
+    """Advisory lock guarding ``path``, held on a sibling ``<name>.lock`` file.
+
+    Threads of this process queue on an in-process lock; only the outermost
+    holder flock()s the lock file, which stays open between uses. Re-entrant
+    within a thread: nested acquisitions keep the outer acquisition's mode.
+    """
+    # We use a separate lock file to avoid issues with opening/closing the JSON file itself
+    lock_path = path.with_name(path.name + ".lock")
+    state = _lock_state(lock_path)
+    try:
+        with state.rlock:
+            if state.depth:
+                state.depth += 1
+                try:
+                    yield
+                finally:
+                    state.depth -= 1
+                return
+            if state.fh is not None and (state.pid != os.getpid() or not _same_file(state.fh, lock_path)):
+                state.fh.close()  # forked child, or the lock file was removed
+                state.fh = None
+            if state.fh is None:
+                lock_path.parent.mkdir(parents=True, exist_ok=True)
+                state.fh, state.pid = lock_path.open("a"), os.getpid()
+            # LOCK_EX for write, LOCK_SH for read
+            fcntl.flock(state.fh, fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+            state.depth = 1
+            try:
+                yield
+            finally:
+                state.depth = 0
+                fcntl.flock(state.fh, fcntl.LOCK_UN)
+    finally:
+        _release_state(state)
+
+
+def _same_file(fh: Any, path: Path) -> bool:
+    try:
+        return os.path.samestat(os.fstat(fh.fileno()), os.stat(path))
+    except (OSError, ValueError):  # ValueError: fh already closed
+        return False
+
+
 @contextmanager
 def state_lock(write: bool = False):
     """Context manager for advisory file locking on the state file."""
-    path = _dir() / "state.json.lock"
-    # Ensure lock file exists
-    if not path.exists():
-        path.touch()
-    
-    # We use a separate lock file to avoid issues with opening/closing the JSON file itself
-    with path.open("w") as f:
-        # LOCK_EX for write, LOCK_SH for read
-        mode = fcntl.LOCK_EX if write else fcntl.LOCK_SH
-        try:
-            fcntl.flock(f, mode)
-            yield
-        finally:
-            fcntl.flock(f, fcntl.LOCK_UN)
+    with file_lock(_dir() / "state.json", write=write):
+        yield
 
 
 def _safe_path(name: str) -> Path:
@@ -42,45 +247,220 @@ def _safe_path(name: str) -> Path:
     return path
 
 
-def append_jsonl(name: str, item: Dict[str, Any]) -> None:
+class BufferedJsonlWriter:
+    """Coalesce JSONL appends into one open + write per file.
+
+    Pending lines for a file are written once it has ``max_entries`` of them
+    or ``max_bytes`` of data, ``max_delay_s`` after the first unflushed append
+    (daemon timer), when the file is read back through this module, or at
+    interpreter exit.
+    """
+
+    def __init__(self, max_entries: int = 128, max_delay_s: float = 0.1, max_bytes: int = 64 * 1024):
+        self.max_entries = max_entries
+        self.max_delay_s = max_delay_s
+        self.max_bytes = max_bytes
+        self._pending: Dict[Path, List[bytes]] = {}
+        self._pending_size: Dict[Path, int] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def append(self, path: Path, lines: List[bytes]) -> None:
+        with self._lock:
+            pending = self._pending.setdefault(path, [])
+            pending.extend(lines)
+            size = self._pending_size.get(path, 0) + sum(map(len, lines))
+            self._pending_size[path] = size
+            full = len(pending) >= self.max_entries or size >= self.max_bytes
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.max_delay_s, self._flush_quietly)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush(path)
+
+    def flush(self, path: Optional[Path] = None) -> None:
+        """Write pending lines for ``path`` (or every file) to disk."""
+        with self._lock:
+            if path is None:
+                batches, self._pending, self._pending_size = self._pending, {}, {}
+            elif path in self._pending:
+                batches = {path: self._pending.pop(path)}
+                self._pending_size.pop(path, None)
+            else:
+                return
+            if not self._pending and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            # Write under the lock so concurrent flushes keep line order.
+            for target, lines in batches.items():
+                with target.open("ab") as f:
+                    f.write(b"".join(lines))
+
+    def _flush_quietly(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except OSError:
+            pass
+
+
+_jsonl_writer = BufferedJsonlWriter()
+atexit.register(_jsonl_writer._flush_quietly)
+
+
+def flush_jsonl(name: Optional[str] = None) -> None:
+    """Write buffered JSONL appends (for ``name``, or every file) to disk."""
+    _jsonl_writer.flush(_safe_path(name) if name is not None else None)
+
+
+def append_jsonl(name: str, item: Dict[str, Any], *, buffered: bool = False) -> None:
+    append_jsonl_many(name, [item], buffered=buffered)
+
+
+def append_jsonl_many(name: str, items: List[Dict[str, Any]], *, buffered: bool = False) -> None:
+    """Append several entries to a JSONL file with a single write.
+
+    With ``buffered=True`` the lines go through the shared
+    :class:`BufferedJsonlWriter` and reach disk shortly afterwards.
+    """
+    if not items:
+        return
     path = _safe_path(name)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(item, sort_keys=True) + "\n")
+    lines = [_dumps(item, sort_keys=True, indent=False) + b"\n" for item in items]
+    if buffered:
+        _jsonl_writer.append(path, lines)
+        return
+    _jsonl_writer.flush(path)  # keep earlier buffered lines ahead of these
+    with path.open("ab") as f:
+        f.write(b"".join(lines))
 
 
 def read_jsonl(name: str) -> List[Dict[str, Any]]:
     """Read all entries from a JSONL file."""
     path = _safe_path(name)
-    if not path.exists():
+    _jsonl_writer.flush(path)
+    try:
+        f = path.open("rb", buffering=1 << 16)
+    except FileNotFoundError:
         return []
+    with f:
+        return _parse_lines(f)
+
+
+def _parse_lines(lines: Iterable[bytes]) -> List[Any]:
+    """Parse JSONL lines as bytes, skipping blank and malformed ones."""
     results = []
-    for line in path.read_text(encoding="utf-8").splitlines():
+    for line in lines:
         line = line.strip()
         if not line:
             continue
         try:
-            results.append(json.loads(line))
+            results.append(_loads(line))
         except Exception:
             continue
     return results
 
 
-def read_state() -> Dict[str, Any]:
-    path = _dir() / "state.json"
-    if not path.exists():
-        return {}
+# Parsed state.json per path: path -> ((mtime_ns, size), state).
+_state_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+# set_last_ts() updates not yet written: state path -> key -> ts.
+_pending_last_ts: Dict[Path, Dict[str, float]] = {}
+_pending_lock = threading.Lock()
+_pending_timer: Optional[threading.Timer] = None
+LAST_TS_FLUSH_DELAY_S = 0.5
+
+
+def _state_path() -> Path:
+    return _dir() / "state.json"
+
+
+def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy two levels deep: enough that callers can't mutate the cache."""
+    return {
+        k: dict(v) if isinstance(v, dict) else list(v) if isinstance(v, list) else v
+        for k, v in state.items()
+    }
+
+
+def _read_state_at(path: Path) -> Dict[str, Any]:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
+        st = path.stat()
+    except OSError:
+        _state_cache.pop(path, None)
         return {}
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _state_cache.get(path)
+    if cached is None or cached[0] != sig:
+        try:
+            state = _loads(path.read_bytes())
+        except Exception:
+            state = {}
+        if not isinstance(state, dict):
+            state = {}
+        cached = _state_cache[path] = (sig, state)
+    return _copy_state(cached[1])
+
+
+def _write_state_at(path: Path, state: Dict[str, Any]) -> None:
+    _write_atomic(path, _dumps(state, sort_keys=True, indent=True) + b"\n")
+    st = path.stat()
+    _state_cache[path] = ((st.st_mtime_ns, st.st_size), _copy_state(state))
+
+
+def read_state() -> Dict[str, Any]:
+    """Return state.json, re-parsed only when the file changed.
+
+    Pending :func:`set_last_ts` updates are included.
+    """
+    path = _state_path()
+    state = _read_state_at(path)
+    pending = _pending_last_ts.get(path)
+    if pending:
+        state.setdefault("last_ts", {}).update(pending)
+    return state
 
 
 def write_state(state: Dict[str, Any]) -> None:
-    path = _dir() / "state.json"
-    path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    """Atomically replace state.json."""
+    _write_state_at(_state_path(), state)
+
+
+def flush_state() -> None:
+    """Write pending :func:`set_last_ts` updates to disk."""
+    global _pending_timer
+    with _pending_lock:
+        batches = dict(_pending_last_ts)
+        _pending_last_ts.clear()
+        if _pending_timer is not None:
+            _pending_timer.cancel()
+            _pending_timer = None
+    for path, pending in batches.items():
+        # Merge into the current file so concurrent writers aren't clobbered.
+        with file_lock(path, write=True):
+            state = _read_state_at(path)
+            last_ts = state.get("last_ts")
+            if not isinstance(last_ts, dict):
+                last_ts = state["last_ts"] = {}
+            last_ts.update(pending)
+            _write_state_at(path, state)
+
+
+def _flush_state_quietly() -> None:
+    try:
+        flush_state()
+    except OSError:
+        pass
+
+
+atexit.register(_flush_state_quietly)
 
 
 def get_last_ts(key: str) -> Optional[float]:
+    pending = _pending_last_ts.get(_state_path())
+    if pending and key in pending:
+        return pending[key]
     state = read_state()
     v = state.get("last_ts", {}).get(key)
     try:
@@ -90,37 +470,195 @@ def get_last_ts(key: str) -> Optional[float]:
 
 
 def set_last_ts(key: str, ts: Optional[float] = None) -> None:
-    state = read_state()
-    state.setdefault("last_ts", {})
-    state["last_ts"][key] = float(ts if ts is not None else time.time())
-    write_state(state)
+    """Record ``key``'s timestamp; written to disk within LAST_TS_FLUSH_DELAY_S."""
+    global _pending_timer
+    with _pending_lock:
+        _pending_last_ts.setdefault(_state_path(), {})[key] = float(ts if ts is not None else time.time())
+        if _pending_timer is None:
+            _pending_timer = threading.Timer(LAST_TS_FLUSH_DELAY_S, _flush_state_quietly)
+            _pending_timer.daemon = True
+            _pending_timer.start()
 
 
 def jsonl_count(name: str) -> int:
-    """Count entries in a JSONL file."""
+    """Count entries (lines that are not blank) in a JSONL file.
+
+    Same lines as read_jsonl() skips: whitespace-only lines, CRLF blanks
+    included, are not entries. Newlines and blank lines are counted in C
+    over one reused read buffer; lines are never split out.
+    """
     path = _safe_path(name)
-    if not path.exists():
+    _jsonl_writer.flush(path)
+    try:
+        f = path.open("rb", buffering=0)
+    except FileNotFoundError:
         return 0
     count = 0
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if line.strip():
-            count += 1
+    partial_blank = True  # the line still open at the chunk end is blank so far
+    buf = bytearray(_COUNT_CHUNK)
+    with f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            chunk = buf if n == len(buf) else buf[:n]
+            cut = chunk.rfind(b"\n") + 1
+            if cut:
+                blank = sum(1 for _ in _BLANK_LINE.finditer(chunk, 0, cut))
+                if not partial_blank and _BLANK_LINE.match(chunk, 0, cut):
+                    blank -= 1  # whitespace ending a line begun in an earlier chunk
+                count += chunk.count(b"\n", 0, cut) - blank
+                partial_blank = True
+            if partial_blank and _NON_SPACE.search(chunk, cut):
+                partial_blank = False
+    if not partial_blank:
+        count += 1  # final line without a trailing newline
     return count
 
 
 def read_jsonl_tail(name: str, limit: int = 1000) -> List[Dict[str, Any]]:
     """Read the last N entries from a JSONL file efficiently."""
     path = _safe_path(name)
-    if not path.exists():
+    _jsonl_writer.flush(path)
+    try:
+        f = path.open("rb", buffering=1 << 16)
+    except FileNotFoundError:
         return []
-    lines = path.read_text(encoding="utf-8").splitlines()
-    results = []
-    for line in lines[-limit:]:
-        line = line.strip()
-        if not line:
+    with f:
+        return _parse_lines(_tail_lines(f, limit) if limit > 0 else f)
+
+
+def _tail_lines(f: BinaryIO, limit: int) -> List[bytes]:
+    """Last ``limit`` non-empty lines of binary file ``f``, reading backwards in chunks.
+
+    I/O is proportional to the size of the tail, not of the file.
+    """
+    pos = f.seek(0, os.SEEK_END)
+    chunks: List[bytes] = []
+    newlines = 0
+    while pos > 0:
+        step = min(_SCAN_CHUNK, pos)
+        pos -= step
+        f.seek(pos)
+        chunk = f.read(step)
+        chunks.append(chunk)
+        newlines += chunk.count(b"\n")
+        if newlines < limit and pos > 0:
             continue
+        lines = b"".join(reversed(chunks)).split(b"\n")
+        if pos > 0:
+            lines = lines[1:]  # may start mid-line
+        lines = [ln for ln in lines if ln.strip()]
+        if len(lines) >= limit or pos == 0:
+            return lines[-limit:]
+    return []
+
+
+def _pack_frame(item: Dict[str, Any]) -> bytes:
+    if msgpack is not None:
+        body = _CODEC_MSGPACK + msgpack.packb(item, use_bin_type=True)
+    else:
+        body = _CODEC_JSON + _dumps(item, indent=False)
+    size = _FRAME_LEN.pack(len(body))
+    return size + body + size
+
+
+def _unpack_frame(body: bytes) -> Any:
+    codec, payload = body[:1], body[1:]
+    if codec == _CODEC_MSGPACK:
+        if msgpack is None:
+            raise ValueError("msgpack frame but msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False)
+    return _loads(payload)
+
+
+def append_framed(name: str, item: Dict[str, Any], *, buffered: bool = False) -> None:
+    append_framed_many(name, [item], buffered=buffered)
+
+
+def append_framed_many(name: str, items: List[Dict[str, Any]], *, buffered: bool = False) -> None:
+    """Append length-framed records (msgpack, or JSON without msgpack).
+
+    Shares the JSONL write buffer, so ``buffered`` behaves as in
+    :func:`append_jsonl_many`.
+    """
+    if not items:
+        return
+    path = _safe_path(name)
+    frames = [_pack_frame(item) for item in items]
+    if buffered:
+        _jsonl_writer.append(path, frames)
+        return
+    _jsonl_writer.flush(path)
+    with path.open("ab") as f:
+        f.write(b"".join(frames))
+
+
+def read_framed(name: str) -> List[Dict[str, Any]]:
+    """Read all records from a framed log, stopping at a torn final frame."""
+    path = _safe_path(name)
+    _jsonl_writer.flush(path)
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    return _parse_frames(_frames_forward(data))
+
+
+def read_framed_tail(name: str, limit: int = 1000) -> List[Dict[str, Any]]:
+    """Read the last N records of a framed log by walking trailers backwards."""
+    path = _safe_path(name)
+    _jsonl_writer.flush(path)
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        if limit <= 0:
+            return _parse_frames(_frames_forward(f.read()))
+        bodies: List[bytes] = []
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0 and len(bodies) < limit:
+            if pos < 2 * _FRAME_LEN.size:
+                break
+            f.seek(pos - _FRAME_LEN.size)
+            (n,) = _FRAME_LEN.unpack(f.read(_FRAME_LEN.size))
+            start = pos - n - 2 * _FRAME_LEN.size
+            if start < 0:
+                break
+            f.seek(start)
+            frame = f.read(pos - start)
+            if frame[:_FRAME_LEN.size] != frame[-_FRAME_LEN.size:]:
+                break
+            bodies.append(frame[_FRAME_LEN.size:-_FRAME_LEN.size])
+            pos = start
+        else:
+            bodies.reverse()
+            return _parse_frames(bodies)
+        # Torn or foreign bytes at the end: fall back to a forward scan.
+        f.seek(0)
+        return _parse_frames(_frames_forward(f.read()))[-limit:]
+
+
+def _frames_forward(data: bytes) -> List[bytes]:
+    bodies = []
+    pos, end, hdr = 0, len(data), _FRAME_LEN.size
+    while pos + 2 * hdr <= end:
+        (n,) = _FRAME_LEN.unpack_from(data, pos)
+        stop = pos + hdr + n
+        if stop + hdr > end or data[stop:stop + hdr] != data[pos:pos + hdr]:
+            break
+        bodies.append(data[pos + hdr:stop])
+        pos = stop + hdr
+    return bodies
+
+
+def _parse_frames(bodies: Iterable[bytes]) -> List[Any]:
+    """Decode frame bodies, skipping malformed ones."""
+    results = []
+    for body in bodies:
         try:
-            results.append(json.loads(line))
+            results.append(_unpack_frame(body))
         except Exception:
             continue
     return results
@@ -128,12 +666,9 @@ def read_jsonl_tail(name: str, limit: int = 1000) -> List[Dict[str, Any]]:
 
 def read_json(name: str) -> Dict[str, Any]:
     """Read a JSON file from the beacon directory."""
-    path = _safe_path(name)
-    if not path.exists():
-        return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
+        return _loads(_safe_path(name).read_bytes())
+    except Exception:  # missing or unreadable
         return {}
 
 
@@ -141,4 +676,4 @@ def write_json(name: str, data: Dict[str, Any]) -> None:
     """Write a JSON file to the beacon directory."""
     path = _safe_path(name)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    path.write_bytes(_dumps(data, sort_keys=True, indent=True) + b"\n")
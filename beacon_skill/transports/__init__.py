@@ -17,6 +17,7 @@ __all__ = [
     "webhook_send",
     "udp_listen",
     "udp_send",
+    "udp_send_many",
 ]
 
 from .agentmatrix import AgentMatrixTransport
@@ -31,6 +32,6 @@ from .moltbook import MoltbookClient
 from .pinchedin import PinchedInClient
 from .relay import RelayClient
 from .rustchain import RustChainClient, RustChainKeypair
-from .udp import udp_listen, udp_send
+from .udp import udp_listen, udp_send, udp_send_many
 from .conway import ConwayClient
 from .webhook import WebhookServer, webhook_send
@@ -15,8 +15,10 @@ from typing import Any, Callable, Dict, List, Optional
 from enum import Enum
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..retry import with_retry, RETRYABLE_STATUS_CODES
+from ..storage import _dumps
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +52,60 @@ class DiscordServerError(DiscordError):
         super().__init__(f"HTTP {status_code}: {message}")
 
 
+_SESSION_LOCK = threading.Lock()
+_SHARED_SESSION: Optional[requests.Session] = None
+
+
+def _shared_session() -> requests.Session:
+    """One keep-alive session for every Discord client in the process.
+
+    Webhooks all live on discord.com, so clients created per message reuse a
+    warm TLS connection instead of handshaking again.
+    """
+    global _SHARED_SESSION
+    with _SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": "Beacon/2.12.0 (Elyan Labs)"})
+            # Retries are handled in _send_payload; keep a few idle connections.
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SHARED_SESSION = session
+        return _SHARED_SESSION
+
+
+def _beacon_embed(
+    content: str,
+    kind: str,
+    agent_id: str,
+    rtc_tip: Optional[float],
+    signature_preview: str,
+) -> Dict[str, Any]:
+    """Build the rich embed for :meth:`DiscordTransport.send_beacon`.
+
+    The optional fields are spliced into a single list display rather than
+    appended one by one.
+    """
+    fields: List[Dict[str, Any]] = [
+        {"name": "Kind", "value": kind[:64] or "unknown", "inline": True},
+        {
+            "name": "Agent",
+            "value": (agent_id[:24] + "...") if len(agent_id) > 24 else (agent_id or "unknown"),
+            "inline": True,
+        },
+        *(({"name": "RTC Tip", "value": f"{rtc_tip:g} RTC", "inline": True},) if rtc_tip is not None else ()),
+        *(({"name": "Signature", "value": signature_preview[:32], "inline": True},) if signature_preview else ()),
+    ]
+    return {
+        "title": f"Beacon Ping · {kind.upper()}",
+        "description": (content or "Beacon ping")[:4096],
+        "color": 65450 if rtc_tip else 7506394,
+        "fields": fields,
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+    }
+
+
 class DiscordTransport:
     """Discord webhook transport for Beacon envelopes with hardened error handling."""
 
@@ -68,8 +124,7 @@ class DiscordTransport:
         self.avatar_url = avatar_url
         self.max_retries = max_retries
         self.base_delay = base_delay
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "Beacon/2.12.0 (Elyan Labs)"})
+        self.session = _shared_session()
 
     def _parse_response_error(self, response: requests.Response) -> DiscordError:
         """Parse HTTP error response and return appropriate exception."""
@@ -112,6 +167,8 @@ class DiscordTransport:
         """Send payload with retry logic for rate limits and server errors."""
         if not self.webhook_url:
             raise DiscordError("Discord webhook_url required")
+        # Encode once (orjson when available) and reuse the body across retries.
+        body = b"" if dry_run else _dumps(payload, indent=False)
 
         def _do() -> Dict[str, Any]:
             if dry_run:
@@ -120,7 +177,8 @@ class DiscordTransport:
             
             resp = self.session.post(
                 self.webhook_url, 
-                json=payload, 
+                data=body,
+                headers={"Content-Type": "application/json"},
                 timeout=self.timeout_s
             )
             
@@ -198,26 +256,7 @@ class DiscordTransport:
         dry_run: bool = False,
     ) -> Dict[str, Any]:
         """Send a Beacon envelope as a rich Discord embed."""
-        fields: List[Dict[str, Any]] = [
-            {"name": "Kind", "value": kind[:64] or "unknown", "inline": True},
-            {
-                "name": "Agent",
-                "value": (agent_id[:24] + "...") if len(agent_id) > 24 else (agent_id or "unknown"),
-                "inline": True,
-            },
-        ]
-        if rtc_tip is not None:
-            fields.append({"name": "RTC Tip", "value": f"{rtc_tip:g} RTC", "inline": True})
-        if signature_preview:
-            fields.append({"name": "Signature", "value": signature_preview[:32], "inline": True})
-
-        embed = {
-            "title": f"Beacon Ping · {kind.upper()}",
-            "description": (content or "Beacon ping")[:4096],
-            "color": 65450 if rtc_tip else 7506394,
-            "fields": fields,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-        }
+        embed = _beacon_embed(content, kind, agent_id, rtc_tip, signature_preview)
         return self.send_message(
             content=content,
             username=username,
@@ -1,17 +1,60 @@
 """UDP transport: broadcast/listen beacons on LAN with optional v2 signing."""
 
+import ctypes
+import ctypes.util
+import errno
+import hashlib
 import socket
+import struct
+import sys
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from ..codec import decode_envelopes, encode_envelope, verify_envelope
+from ..codec import decode_envelope_binary, decode_envelopes, encode_envelope, verify_envelope
+
+# Datagrams handed to one sendmmsg(2) call; larger batches gain little.
+SENDMMSG_BATCH = 100
+# Datagrams drained per recvmmsg(2) call once one has arrived. Each slot
+# holds a full ``bufsize`` datagram, so this bounds per-listener memory.
+RECVMMSG_BATCH = 32
+# Verification results remembered per listener socket, keyed on a digest
+# of the raw datagram, so duplicate deliveries (multi-NIC, retries) skip
+# the decode and Ed25519 check.
+VERIFY_CACHE_SIZE = 2048
 
 
 class BeaconUDPError(RuntimeError):
     pass
 
 
+# glibc 64-bit layouts: struct mmsghdr (msghdr + msg_len) and struct iovec.
+_MMSGHDR = struct.Struct("@PIPNPNi4xI4x")
+_IOVEC = struct.Struct("@PN")
+_SOCKADDR_IN_LEN = 16
+
+
+def _load_libc(name: str, *argtypes: Any) -> Optional[Callable[..., int]]:
+    if not sys.platform.startswith("linux") or struct.calcsize("P") != 8:
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fn = getattr(libc, name)
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = list(argtypes)
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_sendmmsg = _load_libc("sendmmsg", ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int)
+_recvmmsg = _load_libc(
+    "recvmmsg", ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_void_p,
+)
+
+
 @dataclass(frozen=True)
 class UDPMessage:
     data: bytes
@@ -40,7 +83,7 @@ def udp_send(
         raise BeaconUDPError("host is required")
     if not (0 < int(port) < 65536):
         raise BeaconUDPError("port must be 1..65535")
-    if not isinstance(payload, (bytes, bytearray)):
+    if not isinstance(payload, (bytes, bytearray, memoryview)):
         raise BeaconUDPError("payload must be bytes")
 
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -49,7 +92,54 @@ def udp_send(
             s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         if ttl is not None:
             s.setsockopt(socket.IPPROTO_IP, socket.IP_TTL, int(ttl))
-        s.sendto(bytes(payload), (host, int(port)))
+        s.sendto(payload, (host, int(port)))  # any buffer; no copy
+    finally:
+        try:
+            s.close()
+        except Exception:
+            pass
+
+
+def udp_send_many(
+    datagrams: Iterable[Tuple[str, int, bytes]],
+    *,
+    broadcast: bool = False,
+    ttl: Optional[int] = None,
+) -> int:
+    """Send several (host, port, payload) datagrams from one socket.
+
+    On Linux up to SENDMMSG_BATCH datagrams go out per sendmmsg(2) call;
+    elsewhere this is a sendto() loop. Returns the number sent.
+    """
+    items: List[Tuple[str, int, Any]] = []
+    for host, port, payload in datagrams:
+        if not host:
+            raise BeaconUDPError("host is required")
+        if not (0 < int(port) < 65536):
+            raise BeaconUDPError("port must be 1..65535")
+        if not isinstance(payload, (bytes, bytearray, memoryview)):
+            raise BeaconUDPError("payload must be bytes")
+        items.append((host, int(port), payload))
+    if not items:
+        return 0
+
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        if broadcast:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        if ttl is not None:
+            s.setsockopt(socket.IPPROTO_IP, socket.IP_TTL, int(ttl))
+        if _sendmmsg is not None:
+            addrs: Dict[str, bytes] = {}
+            for host, _, _ in items:
+                if host not in addrs:
+                    addrs[host] = socket.inet_aton(socket.gethostbyname(host))
+            for i in range(0, len(items), SENDMMSG_BATCH):
+                _sendmmsg_batch(s.fileno(), items[i:i + SENDMMSG_BATCH], addrs)
+        else:
+            for host, port, payload in items:
+                s.sendto(payload, (host, port))
+        return len(items)
     finally:
         try:
             s.close()
@@ -57,6 +147,40 @@ def udp_send(
             pass
 
 
+def _sendmmsg_batch(fd: int, items: List[Tuple[str, int, bytes]], addrs: Dict[str, bytes]) -> None:
+    # Lay out payloads, sockaddr_ins, iovecs and mmsghdrs in flat buffers
+    # with struct; per-field ctypes assignment costs more than the syscalls.
+    n = len(items)
+    blob = ctypes.create_string_buffer(b"".join(p for _, _, p in items))
+    names = ctypes.create_string_buffer(b"".join(
+        struct.pack("@H", socket.AF_INET) + port.to_bytes(2, "big") + addrs[host] + bytes(8)
+        for host, port, _ in items
+    ))
+    base, name_base = ctypes.addressof(blob), ctypes.addressof(names)
+    iov_data = bytearray()
+    offset = 0
+    for _, _, payload in items:
+        iov_data += _IOVEC.pack(base + offset, len(payload))
+        offset += len(payload)
+    iovs = ctypes.create_string_buffer(bytes(iov_data))
+    iov_base = ctypes.addressof(iovs)
+    msgs = ctypes.create_string_buffer(b"".join(
+        _MMSGHDR.pack(name_base + i * _SOCKADDR_IN_LEN, _SOCKADDR_IN_LEN, iov_base + i * _IOVEC.size,
+                      1, 0, 0, 0, 0)
+        for i in range(n)
+    ))
+    msg_base = ctypes.addressof(msgs)
+    sent = 0
+    while sent < n:
+        rc = _sendmmsg(fd, msg_base + sent * _MMSGHDR.size, n - sent, 0)
+        if rc < 0:
+            err = ctypes.get_errno()
+            if err == errno.EINTR:
+                continue
+            raise OSError(err, errno.errorcode.get(err, "sendmmsg failed"))
+        sent += rc
+
+
 def udp_listen(
     bind_host: str,
     port: int,
@@ -65,49 +189,196 @@ def udp_listen(
     bufsize: int = 65507,
     timeout_s: Optional[float] = None,
     known_keys: Optional[Dict[str, str]] = None,
+    workers: int = 1,
 ) -> None:
     """Listen for UDP datagrams and call on_message for each.
 
     If known_keys is provided, v2 envelopes are signature-verified.
+
+    With ``workers`` > 1, that many SO_REUSEPORT sockets share the port and
+    the kernel spreads senders across them, each served by its own thread
+    (on_message must then be thread-safe). Without SO_REUSEPORT a single
+    socket is used. An exception from on_message in any thread stops every
+    socket's loop and is re-raised here.
     """
     if not (0 < int(port) < 65536):
         raise BeaconUDPError("port must be 1..65535")
+    if workers > 1 and not hasattr(socket, "SO_REUSEPORT"):
+        workers = 1
 
-    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    socks: List[socket.socket] = []
     try:
-        s.bind((bind_host, int(port)))
-        if timeout_s is not None:
-            s.settimeout(float(timeout_s))
-        while True:
+        for _ in range(max(1, workers)):
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            socks.append(s)
+            if workers > 1:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            s.bind((bind_host, int(port)))
+            if timeout_s is not None:
+                s.settimeout(float(timeout_s))
+        if len(socks) == 1:
+            _recv_loop(socks[0], on_message, int(bufsize), known_keys)
+            return
+
+        errors: List[BaseException] = []
+        stop = threading.Event()
+
+        def serve(sock: socket.socket) -> None:
             try:
-                data, addr = s.recvfrom(int(bufsize))
-            except socket.timeout:
-                return
-            txt = ""
+                _recv_loop(sock, on_message, int(bufsize), known_keys, stop)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+                for other in socks:
+                    if other is not sock:
+                        _wake(other)
+
+        threads = [threading.Thread(target=serve, args=(sock,), daemon=True) for sock in socks[1:]]
+        for t in threads:
+            t.start()
+        serve(socks[0])
+        for t in threads:
+            t.join()
+        if errors:
+            raise errors[0]
+    finally:
+        for s in socks:
             try:
-                txt = data.decode("utf-8", errors="replace")
+                s.close()
             except Exception:
-                txt = ""
-
-            # Check signature verification if we got v2 envelopes.
-            verified: Optional[bool] = None
-            if known_keys and txt:
-                envs = decode_envelopes(txt)
-                for env in envs:
-                    v = verify_envelope(env, known_keys=known_keys)
-                    if v is not None:
-                        verified = v
-                        break  # Use the first verifiable envelope's result.
-
-            on_message(UDPMessage(
-                data=bytes(data),
-                text=txt,
-                addr=(addr[0], int(addr[1])),
-                received_at=time.time(),
-                verified=verified,
-            ))
-    finally:
+                pass
+
+
+def _wake(s: socket.socket) -> None:
+    """Wake a thread blocked receiving on ``s`` (its next recv returns empty)."""
+    try:
+        s.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # ENOTCONN on an unconnected UDP socket, after waking it
+
+
+def _recv_loop(
+    s: socket.socket,
+    on_message: Callable[[UDPMessage], None],
+    bufsize: int,
+    known_keys: Optional[Dict[str, str]],
+    stop: Optional[threading.Event] = None,
+) -> None:
+    """Receive until the socket times out or ``stop`` is set.
+
+    Each wake-up blocks (honouring the timeout) for one datagram, then on
+    Linux drains whatever else is queued with non-blocking recvmmsg(2).
+    """
+    batch = _RecvBatch(RECVMMSG_BATCH, bufsize) if _recvmmsg is not None else None
+    seen: "OrderedDict[bytes, Tuple[int, bool]]" = OrderedDict()
+    while True:
         try:
-            s.close()
-        except Exception:
-            pass
+            data, addr = s.recvfrom(bufsize)
+        except socket.timeout:
+            return
+        if stop is not None and stop.is_set():
+            return
+        _deliver(data, addr, on_message, known_keys, seen)
+        if batch is not None:
+            for data, addr in batch.drain(s.fileno()):
+                _deliver(data, addr, on_message, known_keys, seen)
+
+
+class _RecvBatch:
+    """Reusable recvmmsg(2) buffers: one bufsize slot, sockaddr_in and iovec per datagram."""
+
+    def __init__(self, count: int, bufsize: int):
+        self._count = count
+        self._bufsize = bufsize
+        self._data = ctypes.create_string_buffer(count * bufsize)
+        self._names = ctypes.create_string_buffer(count * _SOCKADDR_IN_LEN)
+        data_base, name_base = ctypes.addressof(self._data), ctypes.addressof(self._names)
+        self._iovs = ctypes.create_string_buffer(b"".join(
+            _IOVEC.pack(data_base + i * bufsize, bufsize) for i in range(count)
+        ))
+        iov_base = ctypes.addressof(self._iovs)
+        # Pristine headers, copied back in before each call (the kernel
+        # rewrites msg_namelen, msg_flags and msg_len).
+        self._template = b"".join(
+            _MMSGHDR.pack(name_base + i * _SOCKADDR_IN_LEN, _SOCKADDR_IN_LEN,
+                          iov_base + i * _IOVEC.size, 1, 0, 0, 0, 0)
+            for i in range(count)
+        )
+        self._msgs = ctypes.create_string_buffer(self._template)
+
+    def drain(self, fd: int) -> List[Tuple[bytes, Tuple[str, int]]]:
+        """Datagrams already queued on ``fd``, without blocking."""
+        out: List[Tuple[bytes, Tuple[str, int]]] = []
+        while True:
+            ctypes.memmove(self._msgs, self._template, len(self._template))
+            rc = _recvmmsg(fd, ctypes.addressof(self._msgs), self._count, socket.MSG_DONTWAIT, None)
+            if rc < 0:
+                err = ctypes.get_errno()
+                if err == errno.EINTR:
+                    continue
+                if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return out
+                raise OSError(err, errno.errorcode.get(err, "recvmmsg failed"))
+            msgs, names = self._msgs.raw, self._names.raw
+            for i in range(rc):
+                (length,) = struct.unpack_from("@I", msgs, i * _MMSGHDR.size + _MMSGHDR.size - 8)
+                start = i * self._bufsize
+                name = names[i * _SOCKADDR_IN_LEN:(i + 1) * _SOCKADDR_IN_LEN]
+                addr = (socket.inet_ntoa(name[4:8]), int.from_bytes(name[2:4], "big"))
+                out.append((ctypes.string_at(ctypes.addressof(self._data) + start, length), addr))
+            if rc < self._count:
+                return out
+
+
+def _verify_datagram(data: bytes, txt: str, known_keys: Dict[str, str]) -> Optional[bool]:
+    binary = decode_envelope_binary(data)
+    envs = [binary] if binary is not None else decode_envelopes(txt)
+    for env in envs:
+        v = verify_envelope(env, known_keys=known_keys)
+        if v is not None:
+            return v  # Use the first verifiable envelope's result.
+    return None
+
+
+def _deliver(
+    data: bytes,
+    addr: Tuple[str, int],
+    on_message: Callable[[UDPMessage], None],
+    known_keys: Optional[Dict[str, str]],
+    seen: "Optional[OrderedDict[bytes, Tuple[int, bool]]]" = None,
+) -> None:
+    txt = ""
+    try:
+        txt = data.decode("utf-8", errors="replace")
+    except Exception:
+        txt = ""
+
+    # Check signature verification if we got v2 envelopes.
+    verified: Optional[bool] = None
+    if known_keys and data:
+        # Keyed on a digest of the whole datagram: a replayed signature on
+        # altered content is a different key and is verified afresh, and
+        # entries stay 16 bytes however large the datagrams are. The caller
+        # may add to known_keys while listening, so a result only counts
+        # while the key count it was computed with still holds, and
+        # "no key to verify with" (None) is never cached.
+        key = hashlib.blake2b(data, digest_size=16).digest() if seen is not None else b""
+        cached = seen.get(key) if seen is not None else None
+        if cached is not None and cached[0] == len(known_keys):
+            seen.move_to_end(key)
+            verified = cached[1]
+        else:
+            verified = _verify_datagram(data, txt, known_keys)
+            if seen is not None and verified is not None:
+                seen[key] = (len(known_keys), verified)
+                seen.move_to_end(key)
+                if len(seen) > VERIFY_CACHE_SIZE:
+                    seen.popitem(last=False)
+
+    on_message(UDPMessage(
+        data=bytes(data),
+        text=txt,
+        addr=(addr[0], int(addr[1])),
+        received_at=time.time(),
+        verified=verified,
+    ))
@@ -5,25 +5,43 @@ Inbox Monitor - Watch your beacon inbox for new messages and print alerts.
 This script monitors your beacon inbox and alerts you when new messages arrive.
 Useful for staying responsive to other agents or users.
 
+With the optional ``watchdog`` package installed the inbox file is watched
+for changes (inotify / FSEvents), so new messages are reported as they land.
+Otherwise, or with --poll, the file is stat'ed every interval and only
+re-counted when its size or mtime changed.
+
 Usage:
-    python3 inbox_monitor.py [--interval N] [--agent-id AGENT_ID]
+    python3 inbox_monitor.py [--interval N] [--agent-id AGENT_ID] [--poll]
 
 Options:
     --interval N  Check every N seconds (default: 10)
     --agent-id ID Your agent ID (optional, uses default if not provided)
+    --poll        Poll the inbox file even if watchdog is installed
 """
 
 import argparse
+import os
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from beacon_skill import AgentIdentity, AgentMemory
+from beacon_skill import AgentIdentity
+from beacon_skill.storage import _dir, jsonl_count
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional: fall back to polling
+    FileSystemEventHandler = object
+    Observer = None
+
+INBOX_FILE = "inbox.jsonl"
 
 
 def parse_args() -> argparse.Namespace:
@@ -48,21 +66,45 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Check once and exit (don't loop)"
     )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Poll the inbox file instead of watching it"
+    )
     return parser.parse_args()
 
 
-def get_inbox_count(agent_id: str) -> int:
-    """Get the number of messages in the agent's inbox."""
+def get_inbox_count() -> int:
+    """Get the number of messages in the inbox."""
     try:
-        memory = AgentMemory(agent_id=agent_id)
-        # Get inbox entries
-        inbox = memory.list_received()
-        return len(inbox)
+        return jsonl_count(INBOX_FILE)
     except Exception as e:
         print(f"Error checking inbox: {e}")
         return -1
 
 
+def file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of path, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class _InboxHandler(FileSystemEventHandler):
+    """Sets an event whenever the inbox file is written or replaced."""
+
+    def __init__(self, path: Path, changed: threading.Event):
+        super().__init__()
+        self._path = str(path)
+        self._changed = changed
+
+    def on_any_event(self, event) -> None:
+        if self._path in (event.src_path, getattr(event, "dest_path", "")):
+            self._changed.set()
+
+
 def main() -> int:
     """Main entry point."""
     args = parse_args()
@@ -74,11 +116,18 @@ def main() -> int:
         identity = AgentIdentity.load_or_generate()
         agent_id = identity.agent_id
     
+    inbox_path = _dir() / INBOX_FILE
+    watch = Observer is not None and not args.poll and not args.once
+
     print(f"📬 Inbox Monitor for agent: {agent_id}")
-    print(f"   Checking every {args.interval} seconds...")
+    if watch:
+        print(f"   Watching {inbox_path} for changes...")
+    else:
+        print(f"   Checking every {args.interval} seconds...")
     print(f"   Press Ctrl+C to stop\n")
     
-    last_count = get_inbox_count(agent_id)
+    last_sig = file_signature(inbox_path)
+    last_count = get_inbox_count()
     
     if last_count < 0:
         print("Failed to connect to inbox. Exiting.")
@@ -89,10 +138,27 @@ def main() -> int:
     if args.once:
         return 0
     
+    changed = threading.Event()
+    observer = None
+    if watch:
+        observer = Observer()
+        observer.schedule(_InboxHandler(inbox_path, changed), str(inbox_path.parent))
+        observer.start()
+
     try:
         while True:
-            time.sleep(args.interval)
-            current_count = get_inbox_count(agent_id)
+            if observer is not None:
+                changed.wait()
+                changed.clear()
+            else:
+                time.sleep(args.interval)
+
+            # Only re-count when the file actually changed.
+            sig = file_signature(inbox_path)
+            if sig == last_sig:
+                continue
+            last_sig = sig
+            current_count = get_inbox_count()
             
             if current_count > last_count:
                 new_messages = current_count - last_count
@@ -101,11 +167,15 @@ def main() -> int:
             elif current_count < 0:
                 print("⚠️  Lost connection to inbox")
             else:
-                # Silent check - just update
-                pass
+                # File rewritten or truncated - just update
+                last_count = current_count
                 
     except KeyboardInterrupt:
         print("\n\n👋 Inbox monitor stopped.")
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
     
     return 0
 
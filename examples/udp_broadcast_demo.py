@@ -11,7 +11,8 @@ This example shows how to:
   5. Send a direct reply to a discovered agent
 
 Beacon's UDP transport uses port 38400 by default.
-All messages are signed Ed25519 envelopes for authenticity.
+All messages are signed Ed25519 envelopes for authenticity, sent in the
+compact binary form (msgpack when installed) to stay well under the MTU.
 
 Run:
     python examples/udp_broadcast_demo.py
@@ -25,39 +26,127 @@ Based on PR #13 by @BetsyMalthus — concept and structure.
 import json
 import time
 import threading
-from datetime import datetime
+from collections import deque
 
 from beacon_skill.identity import AgentIdentity
-from beacon_skill.codec import encode_envelope, ENVELOPE_KINDS
-from beacon_skill.transports.udp import udp_send, udp_listen, UDPMessage
+from beacon_skill.codec import (
+    ENVELOPE_KINDS,
+    decode_envelope_binary,
+    decode_envelopes,
+    encode_envelope_binary,
+    verify_envelope,
+)
+from beacon_skill.transports.udp import udp_send, udp_send_many, udp_listen, UDPMessage
 
 # Default Beacon UDP port
 BEACON_PORT = 38400
 
+# Received beacons are verified off the socket thread, a batch at a time:
+# once this many are queued or the oldest has waited VERIFY_WINDOW_S.
+VERIFY_BATCH = 64
+VERIFY_WINDOW_S = 0.02
+VERIFY_MAX_BATCH = 128
+
+
+def format_ts(t: float) -> str:
+    """Local ISO-8601 time with microseconds, without building a datetime."""
+    secs = int(t)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(secs))}.{int((t - secs) * 1e6):06d}"
+
+
+def message_envelopes(msg: UDPMessage):
+    """Envelopes in a datagram: one binary envelope, or text envelopes."""
+    env = decode_envelope_binary(msg.data)
+    if env is not None:
+        return [env]
+    return decode_envelopes(msg.text) if msg.text else []
+
+
+def verify_message(msg: UDPMessage, known_keys=None):
+    """Signature check for the first verifiable envelope in a datagram."""
+    if msg.verified is not None:
+        return msg.verified
+    for env in message_envelopes(msg):
+        verified = verify_envelope(env, known_keys=known_keys)
+        if verified is not None:
+            return verified
+    return None
+
+
+class BatchVerifier:
+    """Queue received beacons and verify them in batches on a worker thread.
+
+    The listener only enqueues, so a burst of beacons never waits behind
+    Ed25519 checks on the socket thread. The ring is a bounded deque with
+    one producer (the listener) and one consumer (run()); append() and
+    popleft() are atomic, so neither side takes a lock and the event is
+    only set to wake the consumer early. Under sustained overload the
+    oldest beacons are dropped.
+    """
+
+    def __init__(self, handle, known_keys=None, batch=VERIFY_BATCH, window_s=VERIFY_WINDOW_S,
+                 max_queued=4096, max_batch=VERIFY_MAX_BATCH):
+        self._handle = handle
+        self._known_keys = known_keys
+        self._batch = batch
+        self._max_batch = max(batch, max_batch)
+        self._window_ns = int(window_s * 1e9)
+        self._queue = deque(maxlen=max_queued)
+        self._wake = threading.Event()
+
+    def submit(self, msg: UDPMessage):
+        self._queue.append((time.monotonic_ns(), msg))
+        if len(self._queue) >= self._batch:
+            self._wake.set()
+
+    def run(self, stop_event):
+        queue = self._queue
+        while not stop_event.is_set():
+            if not queue:
+                wait_ns = self._window_ns
+            else:
+                age = time.monotonic_ns() - queue[0][0]
+                wait_ns = 0 if len(queue) >= self._batch else self._window_ns - age
+            if wait_ns > 0:
+                self._wake.wait(wait_ns / 1e9)
+                self._wake.clear()
+                continue
+            # Only this thread pops, so the length can only grow meanwhile.
+            batch = [queue.popleft()[1] for _ in range(min(len(queue), self._max_batch))]
+            for msg in batch:
+                self._handle(msg, verify_message(msg, self._known_keys))
+
 
 def listen_for_beacons(identity, stop_event):
     """Background thread that listens for incoming beacons."""
     print(f"[Listener] Waiting for beacons on port {BEACON_PORT}...")
 
-    def on_message(msg: UDPMessage):
+    def on_verified(msg: UDPMessage, verified):
         if stop_event.is_set():
             return
         print(f"\n[Received] From {msg.addr[0]}:{msg.addr[1]}")
-        print(f"  Time:     {datetime.fromtimestamp(msg.received_at).isoformat()}")
-        if msg.verified is not None:
-            print(f"  Verified: {'valid' if msg.verified else 'INVALID signature'}")
-        if msg.text:
-            # Try to parse as JSON envelope
-            try:
-                data = json.loads(msg.text.split("]", 1)[-1]) if "[BEACON" in msg.text else json.loads(msg.text)
-                kind = data.get("kind", "unknown")
-                print(f"  Kind:     {kind}")
-                if "text" in data:
-                    print(f"  Text:     {data['text'][:100]}")
-                if "health" in data:
-                    print(f"  Health:   {json.dumps(data['health'])}")
-            except (json.JSONDecodeError, IndexError):
-                print(f"  Raw:      {msg.text[:200]}")
+        print(f"  Time:     {format_ts(msg.received_at)}")
+        if verified is not None:
+            print(f"  Verified: {'valid' if verified else 'INVALID signature'}")
+        envs = message_envelopes(msg)
+        if envs:
+            data = envs[0]
+            kind = data.get("kind", "unknown")
+            print(f"  Kind:     {kind}")
+            if "text" in data:
+                print(f"  Text:     {data['text'][:100]}")
+            if "health" in data:
+                print(f"  Health:   {json.dumps(data['health'])}")
+        elif msg.text:
+            print(f"  Raw:      {msg.text[:200]}")
+
+    # Envelopes without an embedded pubkey verify against keys we know.
+    verifier = BatchVerifier(on_verified, known_keys={identity.agent_id: identity.public_key_hex})
+    threading.Thread(target=verifier.run, args=(stop_event,), daemon=True).start()
+
+    def on_message(msg: UDPMessage):
+        if not stop_event.is_set():
+            verifier.submit(msg)
 
     try:
         udp_listen(
@@ -72,19 +161,18 @@ def listen_for_beacons(identity, stop_event):
             print(f"[Listener] Try: sudo python examples/udp_broadcast_demo.py")
 
 
-def broadcast_envelope(identity, kind, payload):
-    """Encode and broadcast a signed Beacon envelope."""
+def broadcast_envelope(identity, kind, payload, mirrors=()):
+    """Encode and broadcast a signed Beacon envelope.
+
+    ``mirrors`` are extra unicast hosts that get the same datagram; the
+    whole wave goes out through one udp_send_many() call.
+    """
     payload["kind"] = kind
     payload["agent_id"] = identity.agent_id
     payload["timestamp"] = int(time.time())
-    envelope = encode_envelope(payload, identity=identity)
-    udp_send(
-        host="255.255.255.255",
-        port=BEACON_PORT,
-        payload=envelope.encode("utf-8"),
-        broadcast=True,
-        identity=identity,
-    )
+    envelope = encode_envelope_binary(payload, identity=identity)
+    targets = ["255.255.255.255", *mirrors]
+    udp_send_many([(host, BEACON_PORT, envelope) for host in targets], broadcast=True)
     return envelope
 
 
@@ -93,11 +181,11 @@ def send_direct(identity, target_ip, kind, payload):
     payload["kind"] = kind
     payload["agent_id"] = identity.agent_id
     payload["timestamp"] = int(time.time())
-    envelope = encode_envelope(payload, identity=identity)
+    envelope = encode_envelope_binary(payload, identity=identity)
     udp_send(
         host=target_ip,
         port=BEACON_PORT,
-        payload=envelope.encode("utf-8"),
+        payload=memoryview(envelope),  # sent straight from the encoded buffer
         identity=identity,
     )
     return envelope
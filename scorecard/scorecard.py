@@ -11,11 +11,19 @@ Usage:
     # Open http://localhost:8090
 """
 
+import gzip
+import hashlib
 import os
+import sys
+import threading
 import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import yaml
 import requests
-from flask import Flask, render_template, jsonify
+from requests.adapters import HTTPAdapter
+from flask import Flask, render_template, jsonify, request
 
 app = Flask(__name__)
 
@@ -28,21 +36,32 @@ app = Flask(__name__)
 
 CONFIG_PATH = os.environ.get("SCORECARD_CONFIG", "agents.yaml")
 CACHE_TTL = int(os.environ.get("SCORECARD_CACHE_TTL", "60"))
+CACHE_MAXSIZE = 1024
 PORT = int(os.environ.get("SCORECARD_PORT", "8090"))
 REQUEST_TIMEOUT = 8  # seconds per external API call
+FETCH_WORKERS = 16  # concurrent API calls per status build
 
 # ---------------------------------------------------------------------------
 # Load YAML config
 # ---------------------------------------------------------------------------
 
-def load_config():
-    """Load and return the agents.yaml configuration."""
-    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), CONFIG_PATH)
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml: much faster parse
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=4)
+def _parse_config(path, mtime_ns):
     with open(path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
-CONFIG = load_config()
+def load_config():
+    """Load and return the agents.yaml configuration (reparsed only if modified)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), CONFIG_PATH)
+    return _parse_config(path, os.stat(path).st_mtime_ns)
+
 
 # Default scoring weights
 DEFAULT_SCORING = {
@@ -58,50 +77,113 @@ DEFAULT_SCORING = {
 # Default grade thresholds (percentage of max score)
 DEFAULT_GRADES = {"S": 80, "A": 60, "B": 45, "C": 30, "D": 15}
 
+# Count tiers: (ascending minimum counts, fraction of the category's points).
+VIDEO_TIERS = ((1, 5, 10, 20, 50), (0.20, 0.50, 0.70, 0.85, 1.0))
+CONTENT_TIERS = ((1, 5, 10, 20, 50), (0.30, 0.50, 0.70, 0.85, 1.0))
+PLATFORM_TIERS = ((1, 3, 5, 7), (0.15, 0.50, 0.75, 1.0))
+
+
+def reload_config():
+    """(Re)load CONFIG and the effective SCORING / GRADES derived from it."""
+    global CONFIG, SCORING, GRADES
+    CONFIG = load_config()
+    SCORING = {**DEFAULT_SCORING, **CONFIG.get("scoring", {})}
+    GRADES = {**DEFAULT_GRADES, **CONFIG.get("grades", {})}
+
+
+reload_config()
+
+
+def tier_points(count, tiers, max_points):
+    """Points for the highest tier whose minimum ``count`` reaches (0 if none)."""
+    mins, fractions = tiers
+    i = bisect_right(mins, count)
+    if i == 0:
+        return 0
+    fraction = fractions[i - 1]
+    return max_points if fraction >= 1.0 else int(max_points * fraction)
+
 # ---------------------------------------------------------------------------
 # API Cache — simple TTL dict
 # ---------------------------------------------------------------------------
 
-_cache = {}  # key -> (timestamp, data)
+_cache = {}  # key -> (monotonic expiry, data)
+_stale = {}  # key -> last good fetch_json data, served when a refresh fails
 
 
 def cache_get(key):
     """Return cached value if still fresh, else None."""
     entry = _cache.get(key)
-    if entry and (time.time() - entry[0]) < CACHE_TTL:
+    if entry and time.monotonic() < entry[0]:
         return entry[1]
     return None
 
 
 def cache_set(key, data):
-    _cache[key] = (time.time(), data)
+    now = time.monotonic()
+    if len(_cache) >= CACHE_MAXSIZE:
+        # list() snapshots the items atomically; fetch threads may be writing.
+        for k, (expires, _) in list(_cache.items()):
+            if expires <= now:
+                _cache.pop(k, None)
+        while len(_cache) >= CACHE_MAXSIZE:
+            _cache.pop(next(iter(_cache)), None)  # oldest insertion first
+    _cache[sys.intern(key)] = (now + CACHE_TTL, data)
 
 
 def cache_clear():
     _cache.clear()
+    _stale.clear()
 
 
 # ---------------------------------------------------------------------------
 # Public API Fetchers
 # ---------------------------------------------------------------------------
 
+# One pooled session for all fetch threads: keeps TCP/TLS connections alive.
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# Optional: with httpx[http2] installed, concurrent requests to one host
+# (e.g. every agent's BoTTube video list) share a single HTTP/2 connection.
+try:
+    import httpx
+    _client = httpx.Client(
+        http2=True,
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,  # as requests does; httpx defaults to False
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
+except ImportError:  # httpx or h2 missing
+    _client = None
+
+
+def http_get(url):
+    """GET through the HTTP/2 client when available, else the requests session."""
+    if _client is not None:
+        return _client.get(url)
+    return _session.get(url, timeout=REQUEST_TIMEOUT)
+
+
 def fetch_json(url, default=None):
     """GET a URL and return JSON, with caching and error handling."""
     cached = cache_get(url)
     if cached is not None:
         return cached
     try:
-        resp = requests.get(url, timeout=REQUEST_TIMEOUT)
+        resp = http_get(url)
         resp.raise_for_status()
         data = resp.json()
         cache_set(url, data)
+        if len(_stale) >= CACHE_MAXSIZE:
+            _stale.pop(next(iter(_stale)), None)
+        _stale[sys.intern(url)] = data
         return data
     except Exception:
-        # Return stale cache if available, otherwise default
-        entry = _cache.get(url)
-        if entry:
-            return entry[1]
-        return default
+        # Return the last good response if there is one, otherwise default
+        stale = _stale.get(url)
+        return stale if stale is not None else default
 
 
 def check_health(url):
@@ -111,7 +193,7 @@ def check_health(url):
     if cached is not None:
         return cached
     try:
-        resp = requests.get(url, timeout=REQUEST_TIMEOUT)
+        resp = http_get(url)
         ok = resp.status_code < 500
         cache_set(key, ok)
         return ok
@@ -155,21 +237,32 @@ def fetch_rustchain_health():
 # Scoring Engine
 # ---------------------------------------------------------------------------
 
-def compute_scores(agent):
-    """Compute score breakdown for a single agent. Returns dict of category->points."""
-    scoring = {**DEFAULT_SCORING, **CONFIG.get("scoring", {})}
+def registered_beacon_ids(beacon_agents):
+    """Frozenset of the non-empty beacon and plain ids in the registered agent list."""
+    return frozenset(
+        v
+        for ba in beacon_agents if isinstance(ba, dict)
+        for v in (ba.get("beacon_id"), ba.get("id")) if v
+    )
+
+
+def compute_scores(agent, registered_ids=None, videos=None, scoring=None):
+    """Compute score breakdown for a single agent. Returns dict of category->points.
+
+    ``registered_ids`` (from registered_beacon_ids) and ``videos`` (the
+    agent's BoTTube video list) are fetched if not passed in; ``scoring``
+    defaults to the configured weights.
+    """
+    if scoring is None:
+        scoring = SCORING
     scores = {}
 
     # --- Beacon: is the beacon_id registered? ---
     beacon_id = agent.get("beacon_id", "")
     beacon_score = 0
     if beacon_id:
-        beacon_agents = fetch_beacon_agents()
-        registered_ids = set()
-        for ba in beacon_agents:
-            if isinstance(ba, dict):
-                registered_ids.add(ba.get("beacon_id", ""))
-                registered_ids.add(ba.get("id", ""))
+        if registered_ids is None:
+            registered_ids = registered_beacon_ids(fetch_beacon_agents())
         if beacon_id in registered_ids:
             beacon_score = scoring["beacon"]
         else:
@@ -177,41 +270,18 @@ def compute_scores(agent):
     scores["beacon"] = beacon_score
 
     # --- Videos: BoTTube video count ---
-    slug = agent.get("bottube_slug", "")
-    videos = fetch_bottube_videos(slug) if slug else []
+    if videos is None:
+        slug = agent.get("bottube_slug", "")
+        videos = fetch_bottube_videos(slug) if slug else []
     video_count = len(videos)
     total_views = sum(v.get("views", v.get("view_count", 0)) for v in videos if isinstance(v, dict))
 
-    max_vid = scoring["videos"]
-    if video_count >= 50:
-        vid_score = max_vid
-    elif video_count >= 20:
-        vid_score = int(max_vid * 0.85)
-    elif video_count >= 10:
-        vid_score = int(max_vid * 0.70)
-    elif video_count >= 5:
-        vid_score = int(max_vid * 0.50)
-    elif video_count >= 1:
-        vid_score = int(max_vid * 0.20)
-    else:
-        vid_score = 0
-    scores["videos"] = vid_score
+    scores["videos"] = tier_points(video_count, VIDEO_TIERS, scoring["videos"])
 
     # --- Platforms: how many platforms listed ---
     plat_list = agent.get("platforms", [])
     plat_count = len(plat_list)
-    max_plat = scoring["platforms"]
-    if plat_count >= 7:
-        plat_score = max_plat
-    elif plat_count >= 5:
-        plat_score = int(max_plat * 0.75)
-    elif plat_count >= 3:
-        plat_score = int(max_plat * 0.50)
-    elif plat_count >= 1:
-        plat_score = int(max_plat * 0.15)
-    else:
-        plat_score = 0
-    scores["platforms"] = plat_score
+    scores["platforms"] = tier_points(plat_count, PLATFORM_TIERS, scoring["platforms"])
 
     # --- Engagement: views + platform spread ---
     max_eng = scoring["engagement"]
@@ -222,18 +292,7 @@ def compute_scores(agent):
 
     # --- Content: video count tiers + platform diversity ---
     max_cont = scoring["content"]
-    if video_count >= 50:
-        cont_score = max_cont
-    elif video_count >= 20:
-        cont_score = int(max_cont * 0.85)
-    elif video_count >= 10:
-        cont_score = int(max_cont * 0.70)
-    elif video_count >= 5:
-        cont_score = int(max_cont * 0.50)
-    elif video_count >= 1:
-        cont_score = int(max_cont * 0.30)
-    else:
-        cont_score = 0
+    cont_score = tier_points(video_count, CONTENT_TIERS, max_cont)
     # Bonus for platform diversity
     if plat_count >= 3:
         cont_score = min(cont_score + int(max_cont * 0.10), max_cont)
@@ -262,9 +321,11 @@ def compute_scores(agent):
 
 def compute_grade(scores, config=None):
     """Compute letter grade from scores dict."""
-    config = config or CONFIG
-    scoring = {**DEFAULT_SCORING, **config.get("scoring", {})}
-    grades = {**DEFAULT_GRADES, **config.get("grades", {})}
+    if not config:
+        scoring, grades = SCORING, GRADES
+    else:
+        scoring = {**DEFAULT_SCORING, **config.get("scoring", {})}
+        grades = {**DEFAULT_GRADES, **config.get("grades", {})}
 
     max_score = sum(scoring.values())
     total = sum(scores.values())
@@ -285,26 +346,40 @@ def build_status():
     agents_cfg = CONFIG.get("agents", [])
     platforms_cfg = CONFIG.get("platforms", {})
 
+    # Every external call is independent I/O: fan them all out at once.
+    slugs = {a.get("bottube_slug", "") for a in agents_cfg} - {""}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        health_futures = {
+            key: pool.submit(check_health, pcfg.get("health_url", ""))
+            for key, pcfg in platforms_cfg.items()
+            if pcfg.get("health_url", "")
+        }
+        rc_future = pool.submit(fetch_rustchain_health)
+        beacon_future = pool.submit(fetch_beacon_agents)
+        video_futures = {slug: pool.submit(fetch_bottube_videos, slug) for slug in slugs}
+
     # Platform health checks
     platform_health = {}
     for key, pcfg in platforms_cfg.items():
-        url = pcfg.get("health_url", "")
         platform_health[key] = {
             "name": pcfg.get("name", key),
-            "healthy": check_health(url) if url else False,
+            "healthy": health_futures[key].result() if key in health_futures else False,
         }
 
     # RustChain network info
-    rc_health = fetch_rustchain_health()
+    rc_health = rc_future.result()
 
     # Beacon agent count
-    beacon_agents = fetch_beacon_agents()
+    beacon_agents = beacon_future.result()
     beacon_count = len(beacon_agents) if isinstance(beacon_agents, list) else 0
 
     # Score each agent
+    registered_ids = registered_beacon_ids(beacon_agents)
+    videos_by_slug = {slug: f.result() for slug, f in video_futures.items()}
     agent_results = []
     for agent in agents_cfg:
-        scores, video_count, total_views = compute_scores(agent)
+        videos = videos_by_slug.get(agent.get("bottube_slug", ""), [])
+        scores, video_count, total_views = compute_scores(agent, registered_ids, videos)
         grade, total, max_score, pct = compute_grade(scores)
         agent_results.append({
             "name": agent.get("name", "Unknown"),
@@ -336,25 +411,106 @@ def build_status():
     }
 
 
+# Per-agent fields emitted as columns by /api/status?format=soa.
+AGENT_COLUMNS = (
+    "name", "beacon_id", "role", "color", "bottube_slug", "platforms",
+    "total_score", "max_score", "score_pct", "grade", "video_count", "total_views",
+)
+
+
+def columnar_status(status):
+    """Copy of a status dict with ``agents`` as one list per field.
+
+    Every key is emitted once instead of once per agent, which shrinks the
+    payload and its encode time for large fleets. ``scores`` becomes one
+    list per category.
+    """
+    agents = status["agents"]
+    categories = dict.fromkeys(cat for a in agents for cat in a["scores"])
+    columns = {field: [a[field] for a in agents] for field in AGENT_COLUMNS}
+    columns["scores"] = {cat: [a["scores"].get(cat, 0) for a in agents] for cat in categories}
+    return {**status, "agents": columns}
+
+
+_build_lock = threading.Lock()
+_last_build = (0.0, None)  # (monotonic finish time, status)
+
+
+def current_status():
+    """build_status(), shared by concurrent requests.
+
+    A request that arrives while a build is running waits for it and reuses
+    its result instead of starting another fan-out of API calls.
+    """
+    global _last_build
+    started = time.monotonic()
+    with _build_lock:
+        finished, status = _last_build
+        if status is not None and finished >= started:
+            return status
+        status = build_status()
+        _last_build = (time.monotonic(), status)
+        return status
+
+
+_payloads = {}  # format -> (status, body, gzipped body, etag)
+
+
+def status_payload(status, fmt=None):
+    """Encoded JSON for a status, with its gzip form and ETag.
+
+    The ETag covers everything but ``timestamp``, so it only changes with
+    the data; the build time travels in the X-Status-Timestamp header.
+    Memoized per status object for requests sharing one build.
+    """
+    cached = _payloads.get(fmt)
+    if cached is not None and cached[0] is status:
+        return cached[1:]
+    data = columnar_status(status) if fmt == "soa" else status
+    body = app.json.dumps(data).encode("utf-8")
+    untimed = app.json.dumps({k: v for k, v in data.items() if k != "timestamp"})
+    etag = hashlib.blake2b(untimed.encode("utf-8"), digest_size=8).hexdigest()
+    payload = (body, gzip.compress(body, 6), etag)
+    _payloads[fmt] = (status, *payload)
+    return payload
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
 
 @app.route("/")
 def index():
-    status = build_status()
-    scoring = {**DEFAULT_SCORING, **CONFIG.get("scoring", {})}
-    return render_template("scorecard.html", status=status, scoring=scoring)
+    status = current_status()
+    return render_template("scorecard.html", status=status, scoring=SCORING)
 
 
 @app.route("/api/status")
 def api_status():
-    return jsonify(build_status())
+    fmt = request.args.get("format")
+    status = current_status()
+    body, gzipped, etag = status_payload(status, "soa" if fmt == "soa" else None)
+    use_gzip = "gzip" in request.accept_encodings
+    if use_gzip:
+        etag += "-gz"  # a distinct representation needs its own tag
+    if request.if_none_match.contains(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(gzipped if use_gzip else body, mimetype="application/json")
+        if use_gzip:
+            resp.content_encoding = "gzip"
+    resp.set_etag(etag)
+    # Fresh on 304s too, which only revalidate the cached body's timestamp.
+    resp.headers["X-Status-Timestamp"] = str(status["timestamp"])
+    resp.vary.add("Accept-Encoding")
+    resp.cache_control.no_cache = True  # browsers revalidate each poll
+    return resp
 
 
 @app.route("/api/refresh", methods=["GET", "POST"])
 def api_refresh():
     cache_clear()
+    reload_config()  # picks up edits to the YAML; a no-op parse otherwise
     return jsonify({"ok": True, "message": "Cache cleared"})
 
 
@@ -367,4 +523,4 @@ if __name__ == "__main__":
     print(f"Config: {CONFIG_PATH}")
     print(f"Fleet: {CONFIG.get('fleet_name', 'Agent Fleet')}")
     print(f"Agents: {len(CONFIG.get('agents', []))}")
-    app.run(host="0.0.0.0", port=PORT, debug=os.environ.get("FLASK_DEBUG", "0") == "1")
+    app.run(host="0.0.0.0", port=PORT, debug=os.environ.get("FLASK_DEBUG", "0") == "1", threaded=True)
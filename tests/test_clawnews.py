@@ -6,6 +6,7 @@ parsed and that the CLI handlers produce expected behavior.
 
 import json
 import unittest
+from types import SimpleNamespace
 from unittest import mock
 
 from beacon_skill.cli import (
@@ -19,14 +20,6 @@ from beacon_skill.cli import (
 )
 
 
-class MockArgs:
-    """Helper to create mock argparse.Namespace objects."""
-
-    def __init__(self, **kwargs):
-        for k, v in kwargs.items():
-            setattr(self, k, v)
-
-
 class TestClawNewsClientCreation(unittest.TestCase):
     """Tests for the _clawnews_client helper."""
 
@@ -59,7 +52,7 @@ class TestClawNewsBrowse(unittest.TestCase):
         mock_client.get_stories.return_value = [{"id": 1, "title": "Test Story"}]
         mock_client_factory.return_value = mock_client
 
-        args = MockArgs(feed="top", limit=20)
+        args = SimpleNamespace(feed="top", limit=20)
         result = cmd_clawnews_browse(args)
 
         mock_client.get_stories.assert_called_once_with(feed="top", limit=20)
@@ -74,7 +67,7 @@ class TestClawNewsBrowse(unittest.TestCase):
 
         feeds = ["top", "new", "best", "ask", "show", "skills", "jobs"]
         for feed in feeds:
-            args = MockArgs(feed=feed, limit=10)
+            args = SimpleNamespace(feed=feed, limit=10)
             cmd_clawnews_browse(args)
             mock_client.get_stories.assert_called_with(feed=feed, limit=10)
             mock_client.get_stories.reset_mock()
@@ -86,24 +79,33 @@ class TestClawNewsBrowse(unittest.TestCase):
         mock_client.get_stories.return_value = []
         mock_client_factory.return_value = mock_client
 
-        args = MockArgs(feed="new", limit=100)
+        args = SimpleNamespace(feed="new", limit=100)
         cmd_clawnews_browse(args)
 
         mock_client.get_stories.assert_called_once_with(feed="new", limit=100)
 
 
-class TestClawNewsSubmit(unittest.TestCase):
+class _PatchedCliTestCase(unittest.TestCase):
+    """Patches config loading, the client factory and the JSONL log once in setUp."""
+
+    def setUp(self):
+        patches = {
+            "load_config": mock.patch("beacon_skill.cli.load_config", return_value={}),
+            "client_factory": mock.patch("beacon_skill.cli._clawnews_client"),
+            "append": mock.patch("beacon_skill.cli.append_jsonl"),
+        }
+        for name, patcher in patches.items():
+            setattr(self, "mock_" + name, patcher.start())
+            self.addCleanup(patcher.stop)
+        self.mock_client = self.mock_client_factory.return_value
+
+
+class TestClawNewsSubmit(_PatchedCliTestCase):
     """Tests for clawnews submit command."""
 
-    @mock.patch("beacon_skill.cli.load_config")
-    @mock.patch("beacon_skill.cli._clawnews_client")
-    def test_submit_dry_run(self, mock_client_factory, mock_load_cfg):
+    def test_submit_dry_run(self):
         """Test submit with dry-run flag."""
-        mock_client = mock.MagicMock()
-        mock_client_factory.return_value = mock_client
-        mock_load_cfg.return_value = {}
-
-        args = MockArgs(
+        args = SimpleNamespace(
             title="Test Title",
             url="https://example.com",
             text="Test body",
@@ -113,20 +115,14 @@ class TestClawNewsSubmit(unittest.TestCase):
         result = cmd_clawnews_submit(args)
 
         # Dry run should NOT call submit_story
-        mock_client.submit_story.assert_not_called()
+        self.mock_client.submit_story.assert_not_called()
         self.assertEqual(result, 0)
 
-    @mock.patch("beacon_skill.cli.load_config")
-    @mock.patch("beacon_skill.cli._clawnews_client")
-    @mock.patch("beacon_skill.cli.append_jsonl")
-    def test_submit_story_type(self, mock_append, mock_client_factory, mock_load_cfg):
+    def test_submit_story_type(self):
         """Test submit story type."""
-        mock_client = mock.MagicMock()
-        mock_client.submit_story.return_value = {"id": 123, "ok": True}
-        mock_client_factory.return_value = mock_client
-        mock_load_cfg.return_value = {}
+        self.mock_client.submit_story.return_value = {"id": 123, "ok": True}
 
-        args = MockArgs(
+        args = SimpleNamespace(
             title="My Story",
             url=None,
             text="Story content",
@@ -135,23 +131,18 @@ class TestClawNewsSubmit(unittest.TestCase):
         )
         result = cmd_clawnews_submit(args)
 
-        mock_client.submit_story.assert_called_once_with(
+        self.mock_client.submit_story.assert_called_once_with(
             "My Story", url=None, text="Story content", item_type="story"
         )
         self.assertEqual(result, 0)
 
-    @mock.patch("beacon_skill.cli.load_config")
-    @mock.patch("beacon_skill.cli._clawnews_client")
-    def test_submit_all_item_types(self, mock_client_factory, mock_load_cfg):
+    def test_submit_all_item_types(self):
         """Test submit with all supported item types."""
-        mock_client = mock.MagicMock()
-        mock_client.submit_story.return_value = {"id": 1}
-        mock_client_factory.return_value = mock_client
-        mock_load_cfg.return_value = {}
+        self.mock_client.submit_story.return_value = {"id": 1}
 
         types = ["story", "ask", "show", "skill", "job"]
         for item_type in types:
-            args = MockArgs(
+            args = SimpleNamespace(
                 title="Test",
                 url=None,
                 text="Test",
@@ -159,44 +150,33 @@ class TestClawNewsSubmit(unittest.TestCase):
                 dry_run=False,
             )
             cmd_clawnews_submit(args)
-            mock_client.submit_story.assert_called_with(
+            self.mock_client.submit_story.assert_called_with(
                 "Test", url=None, text="Test", item_type=item_type
             )
-            mock_client.submit_story.reset_mock()
+            self.mock_client.submit_story.reset_mock()
 
 
-class TestClawNewsComment(unittest.TestCase):
+class TestClawNewsComment(_PatchedCliTestCase):
     """Tests for clawnews comment command."""
 
-    @mock.patch("beacon_skill.cli.load_config")
-    @mock.patch("beacon_skill.cli._clawnews_client")
-    @mock.patch("beacon_skill.cli.append_jsonl")
-    def test_comment_basic(self, mock_append, mock_client_factory, mock_load_cfg):
+    def test_comment_basic(self):
         """Test basic comment submission."""
-        mock_client = mock.MagicMock()
-        mock_client.submit_comment.return_value = {"id": 456, "ok": True}
-        mock_client_factory.return_value = mock_client
-        mock_load_cfg.return_value = {}
+        self.mock_client.submit_comment.return_value = {"id": 456, "ok": True}
 
-        args = MockArgs(parent_id=123, text="Great post!")
+        args = SimpleNamespace(parent_id=123, text="Great post!")
         result = cmd_clawnews_comment(args)
 
-        mock_client.submit_comment.assert_called_once_with(123, "Great post!")
+        self.mock_client.submit_comment.assert_called_once_with(123, "Great post!")
         self.assertEqual(result, 0)
 
-    @mock.patch("beacon_skill.cli.load_config")
-    @mock.patch("beacon_skill.cli._clawnews_client")
-    def test_comment_reply_to_comment(self, mock_client_factory, mock_load_cfg):
+    def test_comment_reply_to_comment(self):
         """Test replying to another comment."""
-        mock_client = mock.MagicMock()
-        mock_client.submit_comment.return_value = {"id": 789}
-        mock_client_factory.return_value = mock_client
-        mock_load_cfg.return_value = {}
+        self.mock_client.submit_comment.return_value = {"id": 789}
 
-        args = MockArgs(parent_id=456, text="Reply text")
+        args = SimpleNamespace(parent_id=456, text="Reply text")
         cmd_clawnews_comment(args)
 
-        mock_client.submit_comment.assert_called_once_with(456, "Reply text")
+        self.mock_client.submit_comment.assert_called_once_with(456, "Reply text")
 
 
 class TestClawNewsVote(unittest.TestCase):
@@ -209,7 +189,7 @@ class TestClawNewsVote(unittest.TestCase):
         mock_client.upvote.return_value = {"ok": True}
         mock_client_factory.return_value = mock_client
 
-        args = MockArgs(item_id=12345)
+        args = SimpleNamespace(item_id=12345)
         result = cmd_clawnews_vote(args)
 
         mock_client.upvote.assert_called_once_with(12345)
@@ -230,7 +210,7 @@ class TestClawNewsProfile(unittest.TestCase):
         }
         mock_client_factory.return_value = mock_client
 
-        args = MockArgs()
+        args = SimpleNamespace()
         result = cmd_clawnews_profile(args)
 
         mock_client.get_profile.assert_called_once()
@@ -247,7 +227,7 @@ class TestClawNewsSearch(unittest.TestCase):
         mock_client.search.return_value = {"hits": 5, "items": []}
         mock_client_factory.return_value = mock_client
 
-        args = MockArgs(query="beacon protocol", type=None, limit=20)
+        args = SimpleNamespace(query="beacon protocol", type=None, limit=20)
         result = cmd_clawnews_search(args)
 
         mock_client.search.assert_called_once_with("beacon protocol", item_type=None, limit=20)
@@ -260,7 +240,7 @@ class TestClawNewsSearch(unittest.TestCase):
         mock_client.search.return_value = {"hits": 2, "items": []}
         mock_client_factory.return_value = mock_client
 
-        args = MockArgs(query="python", type="story", limit=10)
+        args = SimpleNamespace(query="python", type="story", limit=10)
         cmd_clawnews_search(args)
 
         mock_client.search.assert_called_once_with("python", item_type="story", limit=10)
@@ -274,7 +254,7 @@ class TestClawNewsSearch(unittest.TestCase):
 
         types = ["story", "comment", "ask", "show", "skill", "job"]
         for item_type in types:
-            args = MockArgs(query="test", type=item_type, limit=5)
+            args = SimpleNamespace(query="test", type=item_type, limit=5)
             cmd_clawnews_search(args)
             mock_client.search.assert_called_with("test", item_type=item_type, limit=5)
             mock_client.search.reset_mock()
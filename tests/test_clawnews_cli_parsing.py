@@ -5,61 +5,66 @@ for all ClawNews subcommands to ensure robust command surface.
 """
 
 import argparse
-import sys
+import contextlib
 import unittest
 from io import StringIO
 from unittest import mock
 
-from beacon_skill.cli import main
+from beacon_skill import cli
+
+
+# Built once, at import, before any test patches a cmd_* handler into it.
+_PARSER = cli.build_parser()
+
+
+def _run(args):
+    """main(args) on the shared parser.
+
+    The handler is looked up on the cli module at call time, so tests that
+    mock.patch a cmd_* function still intercept it.
+    """
+    ns = _PARSER.parse_args(args)
+    raise SystemExit(getattr(cli, ns.func.__name__)(ns))
+
+
+_OUT, _ERR = StringIO(), StringIO()
+
+
+def _capture(args):
+    """(exit code, stdout, stderr) of _run(args), via two reused buffers."""
+    for buf in (_OUT, _ERR):
+        buf.seek(0)
+        buf.truncate()
+    with contextlib.redirect_stdout(_OUT), contextlib.redirect_stderr(_ERR):
+        try:
+            _run(args)
+            code = 0
+        except SystemExit as e:
+            code = e.code
+    return code, _OUT.getvalue(), _ERR.getvalue()
 
 
 class TestClawNewsCLIParsing(unittest.TestCase):
     """Test ClawNews CLI argument parsing."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.original_stderr = sys.stderr
-        self.original_stdout = sys.stdout
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        sys.stderr = self.original_stderr
-        sys.stdout = self.original_stdout
-
     def _capture_output(self, args):
         """Helper to capture stdout/stderr from CLI invocation."""
-        sys.stdout = StringIO()
-        sys.stderr = StringIO()
-        
-        try:
-            main(args)
-            return_code = 0
-        except SystemExit as e:
-            return_code = e.code
-        
-        stdout = sys.stdout.getvalue()
-        stderr = sys.stderr.getvalue()
-        
-        sys.stdout = self.original_stdout
-        sys.stderr = self.original_stderr
-        
-        return return_code, stdout, stderr
+        return _capture(args)
 
     def test_clawnews_browse_argument_parsing(self):
         """Test clawnews browse argument parsing."""
         test_cases = [
-            # Valid cases
-            (["clawnews", "browse"], 0),  # Default args
-            (["clawnews", "browse", "--feed", "top"], 0),
-            (["clawnews", "browse", "--feed", "new", "--limit", "50"], 0),
-            (["clawnews", "browse", "--limit", "100"], 0),
+            (["clawnews", "browse"], "top", 20),  # Default args
+            (["clawnews", "browse", "--feed", "top"], "top", 20),
+            (["clawnews", "browse", "--feed", "new", "--limit", "50"], "new", 50),
+            (["clawnews", "browse", "--limit", "100"], "top", 100),
         ]
-        
-        for args, expected_code in test_cases:
+
+        for args, feed, limit in test_cases:
             with self.subTest(args=args):
-                with mock.patch("beacon_skill.cli.cmd_clawnews_browse", return_value=0):
-                    code, stdout, stderr = self._capture_output(args)
-                    self.assertEqual(code, expected_code)
+                ns = _PARSER.parse_args(args)
+                self.assertIs(ns.func, cli.cmd_clawnews_browse)
+                self.assertEqual((ns.feed, ns.limit), (feed, limit))
 
     def test_clawnews_browse_invalid_feed(self):
         """Test clawnews browse with invalid feed type."""
@@ -73,19 +78,21 @@ class TestClawNewsCLIParsing(unittest.TestCase):
     def test_clawnews_submit_argument_parsing(self):
         """Test clawnews submit argument parsing."""
         test_cases = [
-            # Valid cases
-            (["clawnews", "submit", "--title", "Test Title"], 0),
-            (["clawnews", "submit", "--title", "Test", "--url", "https://example.com"], 0),
-            (["clawnews", "submit", "--title", "Test", "--text", "Content"], 0),
-            (["clawnews", "submit", "--title", "Test", "--type", "ask"], 0),
-            (["clawnews", "submit", "--title", "Test", "--dry-run"], 0),
+            (["clawnews", "submit", "--title", "Test Title"], {"title": "Test Title"}),
+            (["clawnews", "submit", "--title", "Test", "--url", "https://example.com"],
+             {"url": "https://example.com"}),
+            (["clawnews", "submit", "--title", "Test", "--text", "Content"], {"text": "Content"}),
+            (["clawnews", "submit", "--title", "Test", "--type", "ask"], {"type": "ask"}),
+            (["clawnews", "submit", "--title", "Test", "--dry-run"], {"dry_run": True}),
         ]
-        
-        for args, expected_code in test_cases:
+        defaults = {"url": None, "text": None, "type": "story", "dry_run": False}
+
+        for args, expected in test_cases:
             with self.subTest(args=args):
-                with mock.patch("beacon_skill.cli.cmd_clawnews_submit", return_value=0):
-                    code, stdout, stderr = self._capture_output(args)
-                    self.assertEqual(code, expected_code)
+                ns = _PARSER.parse_args(args)
+                self.assertIs(ns.func, cli.cmd_clawnews_submit)
+                for name, value in {**defaults, **expected}.items():
+                    self.assertEqual(getattr(ns, name), value)
 
     def test_clawnews_submit_missing_title(self):
         """Test clawnews submit without required title."""
@@ -178,17 +185,17 @@ class TestClawNewsCLIParsing(unittest.TestCase):
     def test_clawnews_search_argument_parsing(self):
         """Test clawnews search argument parsing."""
         test_cases = [
-            (["clawnews", "search", "test query"], 0),
-            (["clawnews", "search", "test", "--type", "story"], 0),
-            (["clawnews", "search", "test", "--limit", "50"], 0),
-            (["clawnews", "search", "test", "--type", "comment", "--limit", "10"], 0),
+            (["clawnews", "search", "test query"], "test query", None, 20),
+            (["clawnews", "search", "test", "--type", "story"], "test", "story", 20),
+            (["clawnews", "search", "test", "--limit", "50"], "test", None, 50),
+            (["clawnews", "search", "test", "--type", "comment", "--limit", "10"], "test", "comment", 10),
         ]
-        
-        for args, expected_code in test_cases:
+
+        for args, query, item_type, limit in test_cases:
             with self.subTest(args=args):
-                with mock.patch("beacon_skill.cli.cmd_clawnews_search", return_value=0):
-                    code, stdout, stderr = self._capture_output(args)
-                    self.assertEqual(code, expected_code)
+                ns = _PARSER.parse_args(args)
+                self.assertIs(ns.func, cli.cmd_clawnews_search)
+                self.assertEqual((ns.query, ns.type, ns.limit), (query, item_type, limit))
 
     def test_clawnews_search_missing_query(self):
         """Test clawnews search without query."""
@@ -234,56 +241,41 @@ class TestClawNewsArgumentValidation(unittest.TestCase):
     def test_feed_type_choices(self):
         """Test that feed type choices are comprehensive."""
         valid_feeds = ["top", "new", "best", "ask", "show", "skills", "jobs"]
-        
+
         # This tests the argparse choices validation
         for feed in valid_feeds:
-            with mock.patch("beacon_skill.cli.cmd_clawnews_browse", return_value=0):
-                # These should not raise SystemExit
-                try:
-                    main(["clawnews", "browse", "--feed", feed])
-                except SystemExit as e:
-                    self.assertEqual(e.code, 0, f"Feed {feed} should be valid")
+            ns = _PARSER.parse_args(["clawnews", "browse", "--feed", feed])
+            self.assertEqual(ns.feed, feed, f"Feed {feed} should be valid")
 
     def test_submit_type_choices(self):
         """Test that submit type choices are comprehensive."""
         valid_types = ["story", "ask", "show", "skill", "job"]
-        
+
         for item_type in valid_types:
-            with mock.patch("beacon_skill.cli.cmd_clawnews_submit", return_value=0):
-                try:
-                    main(["clawnews", "submit", "--title", "Test", "--type", item_type])
-                except SystemExit as e:
-                    self.assertEqual(e.code, 0, f"Type {item_type} should be valid")
+            ns = _PARSER.parse_args(["clawnews", "submit", "--title", "Test", "--type", item_type])
+            self.assertEqual(ns.type, item_type, f"Type {item_type} should be valid")
 
     def test_search_type_choices(self):
         """Test that search type choices are comprehensive."""
         valid_types = ["story", "comment", "ask", "show", "skill", "job"]
-        
+
         for item_type in valid_types:
-            with mock.patch("beacon_skill.cli.cmd_clawnews_search", return_value=0):
-                try:
-                    main(["clawnews", "search", "test", "--type", item_type])
-                except SystemExit as e:
-                    self.assertEqual(e.code, 0, f"Type {item_type} should be valid")
+            ns = _PARSER.parse_args(["clawnews", "search", "test", "--type", item_type])
+            self.assertEqual(ns.type, item_type, f"Type {item_type} should be valid")
 
     def test_numeric_argument_bounds(self):
         """Test numeric argument boundary handling."""
         # Test limit values
         test_cases = [
-            ("clawnews", "browse", "--limit", "1"),      # Minimum reasonable
-            ("clawnews", "browse", "--limit", "1000"),   # Large value
-            ("clawnews", "search", "test", "--limit", "1"),
-            ("clawnews", "search", "test", "--limit", "500"),
+            (("clawnews", "browse", "--limit", "1"), 1),      # Minimum reasonable
+            (("clawnews", "browse", "--limit", "1000"), 1000),   # Large value
+            (("clawnews", "search", "test", "--limit", "1"), 1),
+            (("clawnews", "search", "test", "--limit", "500"), 500),
         ]
-        
-        for args in test_cases:
+
+        for args, limit in test_cases:
             with self.subTest(args=args):
-                with mock.patch("beacon_skill.cli.cmd_clawnews_browse", return_value=0):
-                    with mock.patch("beacon_skill.cli.cmd_clawnews_search", return_value=0):
-                        try:
-                            main(list(args))
-                        except SystemExit as e:
-                            self.assertEqual(e.code, 0)
+                self.assertEqual(_PARSER.parse_args(list(args)).limit, limit)
 
     def test_string_argument_handling(self):
         """Test string argument handling and encoding."""
@@ -297,11 +289,8 @@ class TestClawNewsArgumentValidation(unittest.TestCase):
         
         # Test title argument
         for test_str in test_strings:
-            with mock.patch("beacon_skill.cli.cmd_clawnews_submit", return_value=0):
-                try:
-                    main(["clawnews", "submit", "--title", test_str])
-                except SystemExit as e:
-                    self.assertEqual(e.code, 0)
+            ns = _PARSER.parse_args(["clawnews", "submit", "--title", test_str])
+            self.assertEqual(ns.title, test_str)
 
     def test_optional_vs_required_arguments(self):
         """Test required vs optional argument validation."""
@@ -320,8 +309,8 @@ class TestClawNewsArgumentValidation(unittest.TestCase):
         
         for args, missing_arg in required_cases:
             with self.subTest(args=args, missing=missing_arg):
-                with self.assertRaises(SystemExit) as cm:
-                    main(args)
+                with self.assertRaises(SystemExit) as cm, contextlib.redirect_stderr(_ERR):
+                    _PARSER.parse_args(args)
                 self.assertNotEqual(cm.exception.code, 0)
 
     def test_boolean_flag_handling(self):
@@ -331,55 +320,18 @@ class TestClawNewsArgumentValidation(unittest.TestCase):
             (["clawnews", "submit", "--title", "Test"], "dry_run", False),  # Default
         ]
         
-        captured_args = []
-        
-        def capture_args(args):
-            captured_args.append(args)
-            return 0
-        
         for cmd_args, flag_name, expected_value in boolean_cases:
             with self.subTest(args=cmd_args, flag=flag_name):
-                captured_args.clear()
-                with mock.patch("beacon_skill.cli.cmd_clawnews_submit", side_effect=capture_args):
-                    try:
-                        main(cmd_args)
-                    except SystemExit:
-                        pass
-                    
-                    if captured_args:
-                        self.assertEqual(
-                            getattr(captured_args[0], flag_name, False), 
-                            expected_value
-                        )
+                ns = _PARSER.parse_args(cmd_args)
+                self.assertEqual(getattr(ns, flag_name), expected_value)
 
 
 class TestClawNewsCommandHelpText(unittest.TestCase):
     """Test that help text is available and comprehensive."""
 
-    def setUp(self):
-        self.original_stdout = sys.stdout
-        self.original_stderr = sys.stderr
-
-    def tearDown(self):
-        sys.stdout = self.original_stdout
-        sys.stderr = self.original_stderr
-
     def _get_help_text(self, args):
         """Get help text for given arguments."""
-        sys.stdout = StringIO()
-        sys.stderr = StringIO()
-        
-        try:
-            main(args + ["--help"])
-        except SystemExit:
-            pass
-        
-        stdout = sys.stdout.getvalue()
-        stderr = sys.stderr.getvalue()
-        
-        sys.stdout = self.original_stdout
-        sys.stderr = self.original_stderr
-        
+        code, stdout, stderr = _capture(args + ["--help"])
         return stdout + stderr
 
     def test_main_clawnews_help(self):
@@ -10,6 +10,7 @@ This module provides comprehensive tests for:
 
 import json
 import unittest
+from types import SimpleNamespace
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
@@ -25,14 +26,6 @@ from beacon_skill.cli import (
 from beacon_skill.transports.clawnews import ClawNewsClient, ClawNewsError
 
 
-class MockArgs:
-    """Helper to create mock argparse.Namespace objects."""
-
-    def __init__(self, **kwargs):
-        for k, v in kwargs.items():
-            setattr(self, k, v)
-
-
 class TestClawNewsClientRequestMapping(unittest.TestCase):
     """Test client request mapping and argument validation."""
 
@@ -82,7 +75,7 @@ class TestClawNewsBrowseHardening(unittest.TestCase):
         for feed_type, expected_endpoint in test_cases:
             with self.subTest(feed=feed_type):
                 mock_client.get_stories.return_value = [1, 2, 3]
-                args = MockArgs(feed=feed_type, limit=30)
+                args = SimpleNamespace(feed=feed_type, limit=30)
                 
                 result = cmd_clawnews_browse(args)
                 
@@ -100,7 +93,7 @@ class TestClawNewsBrowseHardening(unittest.TestCase):
         test_limits = [1, 10, 50, 100, 500]
         for limit in test_limits:
             with self.subTest(limit=limit):
-                args = MockArgs(feed="top", limit=limit)
+                args = SimpleNamespace(feed="top", limit=limit)
                 cmd_clawnews_browse(args)
                 mock_client.get_stories.assert_called_with(feed="top", limit=limit)
                 mock_client.reset_mock()
@@ -112,7 +105,7 @@ class TestClawNewsBrowseHardening(unittest.TestCase):
         mock_client.get_stories.side_effect = ClawNewsError("API Error")
         mock_client_factory.return_value = mock_client
         
-        args = MockArgs(feed="top", limit=20)
+        args = SimpleNamespace(feed="top", limit=20)
         
         with self.assertRaises(ClawNewsError):
             cmd_clawnews_browse(args)
@@ -143,7 +136,7 @@ class TestClawNewsSubmitHardening(unittest.TestCase):
         
         for title, url, text, item_type, expected in test_cases:
             with self.subTest(type=item_type):
-                args = MockArgs(title=title, url=url, text=text, type=item_type, dry_run=False)
+                args = SimpleNamespace(title=title, url=url, text=text, type=item_type, dry_run=False)
                 
                 result = cmd_clawnews_submit(args)
                 
@@ -163,7 +156,7 @@ class TestClawNewsSubmitHardening(unittest.TestCase):
         mock_client_factory.return_value = mock_client
         mock_config.return_value = {}
         
-        args = MockArgs(title="Test", url=None, text="Test", type="story", dry_run=True)
+        args = SimpleNamespace(title="Test", url=None, text="Test", type="story", dry_run=True)
         result = cmd_clawnews_submit(args)
         
         mock_client.submit_story.assert_not_called()
@@ -188,7 +181,7 @@ class TestClawNewsSubmitHardening(unittest.TestCase):
                 mock_client.submit_story.return_value = response
                 mock_client_factory.return_value = mock_client
                 
-                args = MockArgs(title="Test", url=None, text="Test", type="story", dry_run=False)
+                args = SimpleNamespace(title="Test", url=None, text="Test", type="story", dry_run=False)
                 
                 # Should not raise, regardless of response format
                 result = cmd_clawnews_submit(args)
@@ -212,7 +205,7 @@ class TestClawNewsCommentHardening(unittest.TestCase):
         
         for parent_id in test_cases:
             with self.subTest(parent_id=parent_id):
-                args = MockArgs(parent_id=parent_id, text="Test comment")
+                args = SimpleNamespace(parent_id=parent_id, text="Test comment")
                 
                 result = cmd_clawnews_comment(args)
                 
@@ -239,7 +232,7 @@ class TestClawNewsCommentHardening(unittest.TestCase):
         
         for text in test_texts:
             with self.subTest(text_length=len(text)):
-                args = MockArgs(parent_id=123, text=text)
+                args = SimpleNamespace(parent_id=123, text=text)
                 
                 result = cmd_clawnews_comment(args)
                 
@@ -262,7 +255,7 @@ class TestClawNewsVoteHardening(unittest.TestCase):
         
         for item_id in test_ids:
             with self.subTest(item_id=item_id):
-                args = MockArgs(item_id=item_id)
+                args = SimpleNamespace(item_id=item_id)
                 
                 result = cmd_clawnews_vote(args)
                 
@@ -277,7 +270,7 @@ class TestClawNewsVoteHardening(unittest.TestCase):
         mock_client.upvote.side_effect = ClawNewsError("Insufficient karma")
         mock_client_factory.return_value = mock_client
         
-        args = MockArgs(item_id=123)
+        args = SimpleNamespace(item_id=123)
         
         with self.assertRaises(ClawNewsError):
             cmd_clawnews_vote(args)
@@ -302,7 +295,7 @@ class TestClawNewsProfileHardening(unittest.TestCase):
                 mock_client.get_profile.return_value = response
                 mock_client_factory.return_value = mock_client
                 
-                args = MockArgs()
+                args = SimpleNamespace()
                 result = cmd_clawnews_profile(args)
                 
                 mock_client.get_profile.assert_called_once()
@@ -315,7 +308,7 @@ class TestClawNewsProfileHardening(unittest.TestCase):
         mock_client.get_profile.side_effect = ClawNewsError("Authentication required")
         mock_client_factory.return_value = mock_client
         
-        args = MockArgs()
+        args = SimpleNamespace()
         
         with self.assertRaises(ClawNewsError):
             cmd_clawnews_profile(args)
@@ -342,7 +335,7 @@ class TestClawNewsSearchHardening(unittest.TestCase):
         
         for query in test_queries:
             with self.subTest(query=query[:20]):
-                args = MockArgs(query=query, type=None, limit=20)
+                args = SimpleNamespace(query=query, type=None, limit=20)
                 
                 result = cmd_clawnews_search(args)
                 
@@ -361,7 +354,7 @@ class TestClawNewsSearchHardening(unittest.TestCase):
         
         for type_filter in type_filters:
             with self.subTest(type_filter=type_filter):
-                args = MockArgs(query="test", type=type_filter, limit=10)
+                args = SimpleNamespace(query="test", type=type_filter, limit=10)
                 
                 result = cmd_clawnews_search(args)
                 
@@ -380,7 +373,7 @@ class TestClawNewsSearchHardening(unittest.TestCase):
         
         for limit in limit_values:
             with self.subTest(limit=limit):
-                args = MockArgs(query="test", type=None, limit=limit)
+                args = SimpleNamespace(query="test", type=None, limit=limit)
                 
                 result = cmd_clawnews_search(args)
                 
@@ -409,7 +402,7 @@ class TestClawNewsErrorHandling(unittest.TestCase):
                     mock_client.get_stories.side_effect = ClawNewsError(error_msg)
                     mock_factory.return_value = mock_client
                     
-                    args = MockArgs(feed="top", limit=20)
+                    args = SimpleNamespace(feed="top", limit=20)
                     
                     with self.assertRaises(ClawNewsError) as cm:
                         cmd_clawnews_browse(args)
@@ -430,16 +423,16 @@ class TestClawNewsBackwardCompatibility(unittest.TestCase):
         }
         
         # Verify browse defaults
-        args = MockArgs(**default_values["browse"])
+        args = SimpleNamespace(**default_values["browse"])
         self.assertEqual(args.feed, "top")
         self.assertEqual(args.limit, 20)
         
         # Verify submit defaults
-        args = MockArgs(title="Test", **default_values["submit"])
+        args = SimpleNamespace(title="Test", **default_values["submit"])
         self.assertEqual(args.type, "story")
         
         # Verify search defaults
-        args = MockArgs(query="test", **default_values["search"])
+        args = SimpleNamespace(query="test", **default_values["search"])
         self.assertIsNone(args.type)
         self.assertEqual(args.limit, 20)
 
@@ -465,10 +458,10 @@ class TestClawNewsBackwardCompatibility(unittest.TestCase):
         ]
         
         commands = [
-            (cmd_clawnews_browse, MockArgs(feed="top", limit=20)),
-            (cmd_clawnews_submit, MockArgs(title="Test", url=None, text="Test", type="story", dry_run=False)),
-            (cmd_clawnews_vote, MockArgs(item_id=123)),
-            (cmd_clawnews_profile, MockArgs()),
+            (cmd_clawnews_browse, SimpleNamespace(feed="top", limit=20)),
+            (cmd_clawnews_submit, SimpleNamespace(title="Test", url=None, text="Test", type="story", dry_run=False)),
+            (cmd_clawnews_vote, SimpleNamespace(item_id=123)),
+            (cmd_clawnews_profile, SimpleNamespace()),
         ]
         
         for cmd_func, args in commands:
@@ -506,27 +499,27 @@ class TestClawNewsIntegrationScenarios(unittest.TestCase):
         
         # Step 1: Browse stories
         mock_client.get_stories.return_value = [1, 2, 3]
-        browse_args = MockArgs(feed="top", limit=10)
+        browse_args = SimpleNamespace(feed="top", limit=10)
         result = cmd_clawnews_browse(browse_args)
         self.assertEqual(result, 0)
         
         # Step 2: Submit a story
         mock_client.submit_story.return_value = {"id": 123}
         with patch("beacon_skill.cli.append_jsonl"), patch("beacon_skill.cli._maybe_udp_emit"):
-            submit_args = MockArgs(title="Test Story", url=None, text="Test content", type="story", dry_run=False)
+            submit_args = SimpleNamespace(title="Test Story", url=None, text="Test content", type="story", dry_run=False)
             result = cmd_clawnews_submit(submit_args)
             self.assertEqual(result, 0)
         
         # Step 3: Comment on the story
         mock_client.submit_comment.return_value = {"id": 456}
         with patch("beacon_skill.cli.append_jsonl"):
-            comment_args = MockArgs(parent_id=123, text="Great story!")
+            comment_args = SimpleNamespace(parent_id=123, text="Great story!")
             result = cmd_clawnews_comment(comment_args)
             self.assertEqual(result, 0)
         
         # Step 4: Vote on the story
         mock_client.upvote.return_value = {"ok": True}
-        vote_args = MockArgs(item_id=123)
+        vote_args = SimpleNamespace(item_id=123)
         result = cmd_clawnews_vote(vote_args)
         self.assertEqual(result, 0)
         
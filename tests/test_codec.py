@@ -1,6 +1,15 @@
 import unittest
 
-from beacon_skill.codec import decode_envelopes, encode_envelope, verify_envelope
+from unittest import mock
+
+from beacon_skill import codec
+from beacon_skill.codec import (
+    decode_envelope_binary,
+    decode_envelopes,
+    encode_envelope,
+    encode_envelope_binary,
+    verify_envelope,
+)
 from beacon_skill.identity import AgentIdentity
 
 
@@ -54,6 +63,20 @@ class TestCodec(unittest.TestCase):
         self.assertEqual(len(envs), 1)
         self.assertEqual(envs[0]["kind"], "ok")
 
+    def test_malformed_body_is_skipped_whole(self) -> None:
+        inner = '[BEACON v1]\\n{\\"kind\\":\\"inner\\"}'
+        text = '[BEACON v1]\n{"text": "%s", oops}\n[BEACON v2]\n{"kind": "a}{"} tail' % inner
+        self.assertEqual(decode_envelopes(text), [{"kind": "a}{", "_beacon_version": 2}])
+
+    def test_decode_keeps_wide_ints_exact(self) -> None:
+        # Signatures cover the canonical JSON, so numbers must not be
+        # coerced (orjson, for one, turns ints wider than 64 bits into floats).
+        ident = AgentIdentity.generate()
+        text = encode_envelope({"kind": "hello", "n": 2**70}, identity=ident)
+        env = decode_envelopes(text)[0]
+        self.assertEqual(env["n"], 2**70)
+        self.assertTrue(verify_envelope(env, known_keys={ident.agent_id: ident.public_key_hex}))
+
     def test_v2_field_roundtrip(self) -> None:
         ident = AgentIdentity.generate()
         payload = {
@@ -84,6 +107,15 @@ class TestCodec(unittest.TestCase):
         result = verify_envelope(env)
         self.assertFalse(result)
 
+    def test_tamper_after_cached_verify_fails(self) -> None:
+        ident = AgentIdentity.generate()
+        text = encode_envelope({"kind": "hello", "ts": 1}, version=2, identity=ident, include_pubkey=True)
+        env = decode_envelopes(text)[0]
+        self.assertTrue(verify_envelope(env))
+        self.assertTrue(verify_envelope(dict(env)))
+        env["kind"] = "HACKED"
+        self.assertFalse(verify_envelope(env))
+
     def test_v1_verify_returns_none(self) -> None:
         payload = {"v": 1, "kind": "hello", "from": "a", "to": "b", "ts": 1}
         text = encode_envelope(payload, version=1)
@@ -91,6 +123,23 @@ class TestCodec(unittest.TestCase):
         result = verify_envelope(envs[0])
         self.assertIsNone(result)
 
+    def test_binary_envelope_roundtrip_and_verify(self) -> None:
+        ident = AgentIdentity.generate()
+        payload = {"kind": "heartbeat", "text": "hi é", "health": {"cpu": 1.5, "caps": ["a"]}}
+        for packer in (codec.msgpack, None):
+            with mock.patch.object(codec, "msgpack", packer):
+                data = encode_envelope_binary(payload, identity=ident)
+                env = decode_envelope_binary(data)
+            self.assertTrue(data.startswith(b"BCN\x02"))
+            self.assertEqual(env["_beacon_version"], 2)
+            self.assertEqual(env["health"], payload["health"])
+            self.assertTrue(verify_envelope(env, known_keys={ident.agent_id: ident.public_key_hex}))
+
+        env["text"] = "tampered"
+        self.assertFalse(verify_envelope(env, known_keys={ident.agent_id: ident.public_key_hex}))
+        self.assertIsNone(decode_envelope_binary(b"[BEACON v2]\n{}"))
+        self.assertIsNone(decode_envelope_binary(b"BCN\x02\x02not json"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,9 @@ from pathlib import Path
 
 from beacon_skill.dashboard import (
     _entry_to_row,
+    _prune_notify_seen,
     _row_matches_query,
+    _should_notify,
     export_dashboard_rows,
     fetch_beacon_snapshot,
     parse_dashboard_input,
@@ -59,6 +61,17 @@ class TestDashboardHelpers(unittest.TestCase):
         self.assertEqual(row["kind"], "hello")
         self.assertEqual(row["rtc"], "2")
 
+    def test_should_notify_coalesces_within_window(self):
+        seen = {}
+        key = ("mayday", "bcn_abc")
+        self.assertTrue(_should_notify(seen, key, 100.0))
+        self.assertFalse(_should_notify(seen, key, 101.5))
+        self.assertTrue(_should_notify(seen, ("mayday", "bcn_other"), 101.5))
+        self.assertTrue(_should_notify(seen, key, 102.5))
+
+        _prune_notify_seen(seen, 110.0)
+        self.assertEqual(seen, {})
+
     def test_fetch_beacon_snapshot_success(self):
         def handler(method, url):  # noqa: ARG001
             if url.endswith("/api/agents"):
@@ -1,6 +1,8 @@
+import json
 import unittest
 from unittest import mock
 
+from beacon_skill.storage import _dumps
 from beacon_skill.transports.discord import DiscordClient, DiscordError
 
 
@@ -25,8 +27,8 @@ class TestDiscordTransport(unittest.TestCase):
             self.assertEqual(result["status"], 204)
             args, kwargs = post.call_args
             self.assertEqual(args[0], "https://discord.invalid/webhook")
-            self.assertIn("json", kwargs)
-            self.assertEqual(kwargs["json"]["content"], "hello")
+            self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+            self.assertEqual(json.loads(kwargs["data"])["content"], "hello")
 
     def test_send_beacon_includes_embed_fields(self) -> None:
         client = DiscordClient(webhook_url="https://discord.invalid/webhook")
@@ -39,7 +41,7 @@ class TestDiscordTransport(unittest.TestCase):
                 signature_preview="abc123",
             )
             self.assertTrue(result["ok"])
-            payload = post.call_args.kwargs["json"]
+            payload = json.loads(post.call_args.kwargs["data"])
             self.assertIn("embeds", payload)
             embed = payload["embeds"][0]
             self.assertEqual(embed["title"], "Beacon Ping · BOUNTY")
@@ -47,6 +49,41 @@ class TestDiscordTransport(unittest.TestCase):
             self.assertIn("RTC Tip", field_names)
             self.assertIn("Signature", field_names)
 
+    def test_retry_reuses_encoded_body(self) -> None:
+        client = DiscordClient(webhook_url="https://discord.invalid/webhook", base_delay=0)
+        responses = [_Resp(status_code=500, text="boom"), _Resp(status_code=204)]
+        with mock.patch.object(client.session, "post", side_effect=responses) as post, \
+                mock.patch("beacon_skill.transports.discord._dumps", wraps=_dumps) as dumps:
+            self.assertTrue(client.send_message("hi")["ok"])
+        self.assertEqual(dumps.call_count, 1)
+        bodies = [c.kwargs["data"] for c in post.call_args_list]
+        self.assertEqual(len(bodies), 2)
+        self.assertIs(bodies[0], bodies[1])
+
+    def test_clients_share_one_session(self) -> None:
+        a = DiscordClient(webhook_url="https://discord.invalid/a")
+        b = DiscordClient(webhook_url="https://discord.invalid/b")
+        self.assertIs(a.session, b.session)
+        self.assertIn("Beacon/", a.session.headers["User-Agent"])
+
+    def test_beacon_embed_optional_fields(self) -> None:
+        from beacon_skill.transports.discord import _beacon_embed
+
+        cases = {
+            (None, ""): ["Kind", "Agent"],
+            (0.0, ""): ["Kind", "Agent", "RTC Tip"],
+            (None, "sig"): ["Kind", "Agent", "Signature"],
+            (2.5, "s" * 40): ["Kind", "Agent", "RTC Tip", "Signature"],
+        }
+        for (tip, sig), names in cases.items():
+            embed = _beacon_embed("", "hello", "bcn_" + "a" * 30, tip, sig)
+            self.assertEqual([f["name"] for f in embed["fields"]], names)
+            self.assertEqual(embed["color"], 65450 if tip else 7506394)
+        self.assertEqual(embed["fields"][1]["value"], "bcn_" + "a" * 20 + "...")
+        self.assertEqual(embed["fields"][2]["value"], "2.5 RTC")
+        self.assertEqual(len(embed["fields"][3]["value"]), 32)
+        self.assertEqual(embed["description"], "Beacon ping")
+
     def test_send_without_webhook_errors(self) -> None:
         client = DiscordClient(webhook_url="")
         with self.assertRaises(DiscordError):
@@ -0,0 +1,199 @@
+"""Tests for BEP-5 Human-AI Hybrid Districts."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from beacon_skill.hybrid_district import (
+    GOV_EQUAL,
+    GOV_MULTISIG_2OF3,
+    HYBRID_STATE_FILE,
+    VERIFY_MANUAL,
+    HybridManager,
+)
+
+
+@pytest.fixture
+def mgr(tmp_path):
+    with mock.patch("beacon_skill.storage._dir", return_value=tmp_path):
+        yield HybridManager(data_dir=tmp_path)
+
+
+class TestDistricts:
+    def test_create_and_get(self, mgr):
+        res = mgr.create_district("bcn_sponsor", "coders.beacon", "Forge")
+        assert res["ok"]
+        d = mgr.get_district(res["district_id"])
+        assert d["name"] == "Forge"
+        assert d["agents"] == []
+        assert d["governance_description"]
+
+    def test_invalid_governance(self, mgr):
+        assert "error" in mgr.create_district("bcn_sponsor", "x", "y", governance="nope")
+
+    def test_list_filters_by_city(self, mgr):
+        mgr.create_district("bcn_a", "one.beacon", "A")
+        mgr.create_district("bcn_b", "two.beacon", "B")
+        assert [d["name"] for d in mgr.list_districts("two.beacon")] == ["B"]
+        assert len(mgr.list_districts()) == 2
+
+    def test_returned_views_do_not_alias_state(self, mgr):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        mgr.get_district(did)["agents"].append("bcn_ghost")
+        assert mgr.get_district(did)["agents"] == []
+
+
+class TestStateCache:
+    def test_state_file_is_compact_json(self, mgr, tmp_path):
+        mgr.create_district("bcn_s", "c", "D")
+        raw = (tmp_path / HYBRID_STATE_FILE).read_text(encoding="utf-8")
+        assert "\n " not in raw
+        assert json.loads(raw)["districts"]
+
+    def test_reloads_after_external_write(self, mgr, tmp_path):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        other = HybridManager(data_dir=tmp_path)
+        other.sponsor_agent("bcn_s", "bcn_agent", did)
+        assert mgr.get_district(did)["agents"] == ["bcn_agent"]
+
+
+class TestSponsorship:
+    def test_sponsor_and_revoke(self, mgr):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        assert mgr.sponsor_agent("bcn_s", "bcn_a1", did)["ok"]
+        assert "error" in mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+        assert "error" in mgr.sponsor_agent("bcn_other", "bcn_a2", did)
+        assert len(mgr.agent_sponsorships("bcn_a1")) == 1
+
+        assert mgr.revoke_sponsorship("bcn_s", "bcn_a1", "done")["revoked"]
+        assert mgr.agent_sponsorships("bcn_a1") == []
+        assert mgr.get_district(did)["agents"] == []
+
+    def test_portfolio_and_stats(self, mgr):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        mgr.create_district("bcn_t", "c", "E", governance=GOV_EQUAL)
+        mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+        mgr.sponsor_agent("bcn_s", "bcn_a2", did)
+
+        portfolio = mgr.sponsor_portfolio("bcn_s")
+        assert len(portfolio["districts"]) == 1
+        assert sorted(portfolio["agent_ids"]) == ["bcn_a1", "bcn_a2"]
+
+        stats = mgr.stats()
+        assert stats["total_districts"] == 2
+        assert stats["active_sponsorships"] == 2
+        assert stats["total_agents_sponsored"] == 2
+        assert stats["by_governance"] == {"sponsor_veto": 1, "equal": 1}
+
+    def test_portfolio_excludes_revoked_and_survives_reload(self, mgr, tmp_path):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+        mgr.sponsor_agent("bcn_s", "bcn_a2", did)
+        mgr.revoke_sponsorship("bcn_s", "bcn_a1")
+        assert mgr.sponsor_portfolio("bcn_s")["agent_ids"] == ["bcn_a2"]
+        assert HybridManager(data_dir=tmp_path).sponsor_portfolio("bcn_s")["agent_ids"] == ["bcn_a2"]
+        assert mgr.sponsor_portfolio("bcn_nobody")["sponsored_agents"] == 0
+
+    def test_stats_counters_track_revoke_and_responsor(self, mgr, tmp_path):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+        mgr.revoke_sponsorship("bcn_s", "bcn_a1")
+        assert mgr.stats()["active_sponsorships"] == 0
+        assert mgr.stats()["total_agents_sponsored"] == 0
+
+        mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+        stats = mgr.stats()
+        assert (stats["active_sponsorships"], stats["total_agents_sponsored"]) == (1, 1)
+        fresh = HybridManager(data_dir=tmp_path).stats()
+        assert {k: v for k, v in fresh.items() if k != "ts"} == {k: v for k, v in stats.items() if k != "ts"}
+
+
+class TestVerification:
+    def test_verify_updates_existing_districts(self, mgr):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        res = mgr.verify_human("bcn_s", VERIFY_MANUAL, {"token": "t0p", "note": "ok"})
+        assert res["verified"]
+        assert mgr.is_verified("bcn_s")
+        assert mgr.get_district(did)["sponsor_verified"]
+        assert mgr.stats()["verified_sponsors"] == 1
+
+    def test_verification_data_redacts_credentials(self, mgr, tmp_path):
+        mgr.verify_human("bcn_s", VERIFY_MANUAL, {"token": "t", "api_key": "k", "private_key": "p", "note": "ok"})
+        stored = json.loads((tmp_path / HYBRID_STATE_FILE).read_text(encoding="utf-8"))
+        assert stored["verifications"]["bcn_s"]["data"] == {"note": "ok"}
+
+    def test_indexes_rebuilt_from_disk(self, mgr, tmp_path):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+
+        fresh = HybridManager(data_dir=tmp_path)
+        fresh.verify_human("bcn_s", VERIFY_MANUAL)
+        assert fresh.get_district(did)["sponsor_verified"]
+        assert fresh.agent_sponsorships("bcn_a1")[0]["district_id"] == did
+
+
+class TestCoSign:
+    def test_multisig_2of3(self, mgr):
+        did = mgr.create_district("bcn_s", "c", "D", governance=GOV_MULTISIG_2OF3)["district_id"]
+        mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+        mgr.sponsor_agent("bcn_s", "bcn_a2", did)
+        assert mgr.co_sign_action(did, "bcn_a1", {}, ["bcn_s", "bcn_a2"])["approved"]
+        assert not mgr.co_sign_action(did, "bcn_a1", {}, ["bcn_a1", "bcn_stranger"])["approved"]
+
+    def test_equal(self, mgr):
+        did = mgr.create_district("bcn_s", "c", "D", governance=GOV_EQUAL)["district_id"]
+        mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+        assert mgr.co_sign_action(did, "bcn_a1", {}, ["bcn_s", "bcn_a1"])["approved"]
+        assert not mgr.co_sign_action(did, "bcn_a1", {}, ["bcn_a1"])["approved"]
+
+    def test_agent_not_in_district(self, mgr):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        assert "error" in mgr.co_sign_action(did, "bcn_nobody", {}, [])
+
+
+class TestBatch:
+    def test_batch_defers_writes_until_exit(self, mgr, tmp_path):
+        state_path = tmp_path / HYBRID_STATE_FILE
+        with mgr.batch():
+            did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+            mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+            assert not state_path.exists()
+            assert mgr.get_district(did)["agents"] == ["bcn_a1"]
+            assert mgr.hybrid_log() == []
+
+        assert HybridManager(data_dir=tmp_path).get_district(did)["agents"] == ["bcn_a1"]
+        assert [e["action"] for e in mgr.hybrid_log()] == ["create_district", "sponsor_agent"]
+
+    def test_flush_writes_atomically(self, mgr, tmp_path):
+        mgr.create_district("bcn_s", "c", "D")
+        assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+        mgr.flush()  # nothing pending: no-op
+
+    def test_mutation_commits_state_and_log_once(self, mgr):
+        did = mgr.create_district("bcn_s", "c", "D")["district_id"]
+        with mock.patch("beacon_skill.hybrid_district.append_jsonl_many") as append, \
+                mock.patch.object(mgr, "_write_state", wraps=mgr._write_state) as write:
+            assert mgr.sponsor_agent("bcn_s", "bcn_a1", did)["ok"]
+            assert "error" in mgr.sponsor_agent("bcn_s", "bcn_a1", did)
+        assert write.call_count == 1
+        assert append.call_count == 1
+
+
+def test_district_view_matches_to_dict():
+    from beacon_skill.hybrid_district import HybridDistrict, _district_view
+
+    for data in ({}, {"district_id": "hd_1", "agents": ["a"], "governance": GOV_EQUAL, "metadata": {"k": 1}}):
+        assert _district_view(data) == HybridDistrict(data).to_dict()
+
+
+def test_list_districts_newest_first_with_stable_ties(mgr):
+    with mock.patch("beacon_skill.hybrid_district.time.time", return_value=100):
+        mgr.create_district("bcn_a", "one", "A")
+        mgr.create_district("bcn_a", "two", "B")
+    with mock.patch("beacon_skill.hybrid_district.time.time", return_value=200):
+        mgr.create_district("bcn_a", "one", "C")
+    assert [d["name"] for d in mgr.list_districts()] == ["C", "A", "B"]
+    assert [d["name"] for d in mgr.list_districts("one")] == ["C", "A"]
+    fresh = HybridManager(data_dir=mgr._dir)
+    assert [d["name"] for d in fresh.list_districts()] == ["C", "A", "B"]
@@ -25,6 +25,28 @@ class TestAgentIdentity(unittest.TestCase):
         # Tampered message should fail.
         self.assertFalse(AgentIdentity.verify(ident.public_key_hex, sig_hex, b"tampered"))
 
+    def test_verify_reuses_parsed_public_key(self) -> None:
+        from beacon_skill.identity import _public_key_from_hex
+
+        ident = AgentIdentity.generate()
+        sig_hex = ident.sign_hex(b"m")
+        self.assertTrue(AgentIdentity.verify(ident.public_key_hex, sig_hex, b"m"))
+        hits = _public_key_from_hex.cache_info().hits
+        self.assertTrue(AgentIdentity.verify(ident.public_key_hex, sig_hex, b"m"))
+        self.assertEqual(_public_key_from_hex.cache_info().hits, hits + 1)
+        # Malformed keys still fail closed rather than raising.
+        self.assertFalse(AgentIdentity.verify("zz", sig_hex, b"m"))
+
+    def test_agent_id_from_pubkey_hex_is_memoized(self) -> None:
+        from beacon_skill.identity import _agent_id_from_pubkey_hex
+
+        ident = AgentIdentity.generate()
+        self.assertEqual(_agent_id_from_pubkey_hex(ident.public_key_hex), ident.agent_id)
+        hits = _agent_id_from_pubkey_hex.cache_info().hits
+        self.assertEqual(_agent_id_from_pubkey_hex(ident.public_key_hex), ident.agent_id)
+        self.assertEqual(_agent_id_from_pubkey_hex.cache_info().hits, hits + 1)
+        self.assertIsNone(_agent_id_from_pubkey_hex("zz"))
+
     def test_agent_id_determinism(self) -> None:
         a = AgentIdentity.generate()
         expected = agent_id_from_pubkey(bytes.fromhex(a.public_key_hex))
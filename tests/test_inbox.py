@@ -5,7 +5,7 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
-from beacon_skill.codec import encode_envelope
+from beacon_skill.codec import decode_envelopes, encode_envelope
 from beacon_skill.identity import AgentIdentity
 from beacon_skill.inbox import read_inbox, mark_read, inbox_count, get_entry_by_nonce, trust_key
 
@@ -18,10 +18,13 @@ class TestInbox(unittest.TestCase):
         # Also patch inbox module's _dir reference.
         self.patcher2 = mock.patch("beacon_skill.inbox._dir", return_value=Path(self.tmpdir))
         self.mock_dir2 = self.patcher2.start()
+        self.patcher3 = mock.patch("beacon_skill.key_management._dir", return_value=Path(self.tmpdir))
+        self.patcher3.start()
 
     def tearDown(self):
         self.patcher.stop()
         self.patcher2.stop()
+        self.patcher3.stop()
         import shutil
         shutil.rmtree(self.tmpdir, ignore_errors=True)
 
@@ -49,6 +52,24 @@ class TestInbox(unittest.TestCase):
         self.assertEqual(entries[0]["envelope"]["kind"], "hello")
         self.assertTrue(entries[0]["verified"])
 
+    def test_preparsed_envelope_with_wide_int_verifies(self) -> None:
+        ident = AgentIdentity.generate()
+        text = encode_envelope(
+            {"kind": "hello", "from": "a", "to": "b", "ts": 1, "amount": 2 ** 64 + 1},
+            version=2, identity=ident, include_pubkey=True,
+        )
+        # CLI-written rows carry the already decoded envelopes.
+        self._write_inbox([{
+            "platform": "udp",
+            "received_at": 1000.0,
+            "text": text,
+            "envelopes": decode_envelopes(text),
+        }])
+        entries = read_inbox()
+        self.assertEqual(entries[0]["envelope"]["amount"], 2 ** 64 + 1)
+        self.assertTrue(entries[0]["verified"])
+        self.assertEqual(get_entry_by_nonce(entries[0]["envelope"]["nonce"])["verified"], True)
+
     def test_filter_by_kind(self) -> None:
         ident = AgentIdentity.generate()
         hello = encode_envelope(
@@ -93,6 +114,61 @@ class TestInbox(unittest.TestCase):
         self.assertEqual(len(entries), 1)
         self.assertTrue(entries[0]["is_read"])
 
+    def test_limit_and_lookup_by_nonce(self) -> None:
+        ident = AgentIdentity.generate()
+        rows = []
+        for i in range(5):
+            text = encode_envelope(
+                {"kind": "hello", "from": "a", "to": "b", "ts": i, "nonce": f"nonce{i}"},
+                version=2, identity=ident,
+            )
+            rows.append({"platform": "udp", "received_at": 1000.0 + i, "text": text, "envelopes": []})
+        self._write_inbox(rows)
+
+        entries = read_inbox(limit=2)
+        self.assertEqual([e["envelope"]["nonce"] for e in entries], ["nonce3", "nonce4"])
+        self.assertEqual(get_entry_by_nonce("nonce1")["received_at"], 1001.0)
+        self.assertIsNone(get_entry_by_nonce("missing"))
+
+    def test_nonce_index_extends_on_append(self) -> None:
+        ident = AgentIdentity.generate()
+
+        def row(i):
+            text = encode_envelope(
+                {"kind": "hello", "ts": i, "nonce": f"idx{i}"},
+                version=2, identity=ident, include_pubkey=True,
+            )
+            return {"platform": "udp", "received_at": 2000.0 + i, "text": text, "envelopes": []}
+
+        self._write_inbox([row(0), row(1)])
+        entry = get_entry_by_nonce("idx1")
+        self.assertTrue(entry["verified"])
+        self.assertTrue((Path(self.tmpdir) / "inbox_index.json").exists())
+
+        with open(Path(self.tmpdir) / "inbox.jsonl", "a") as f:
+            f.write(json.dumps(row(2)) + "\n")
+        self.assertEqual(get_entry_by_nonce("idx2")["received_at"], 2002.0)
+
+        # A rewritten (shorter) inbox invalidates the index.
+        self._write_inbox([row(2)])
+        self.assertIsNone(get_entry_by_nonce("idx1"))
+        self.assertEqual(get_entry_by_nonce("idx2")["received_at"], 2002.0)
+
+    def test_mark_read_appends_to_nonce_log(self) -> None:
+        mark_read("n1")
+        mark_read("n2")
+        mark_read("n1")
+        log = (Path(self.tmpdir) / "read_nonces.log").read_text(encoding="utf-8")
+        self.assertEqual(log.split(), ["n1", "n2"])
+
+    def test_read_nonces_migrate_from_state(self) -> None:
+        (Path(self.tmpdir) / "state.json").write_text(
+            json.dumps({"read_nonces": ["legacy1"]}), encoding="utf-8"
+        )
+        mark_read("fresh1")
+        log = (Path(self.tmpdir) / "read_nonces.log").read_text(encoding="utf-8")
+        self.assertEqual(log.split(), ["legacy1", "fresh1"])
+
     def test_count(self) -> None:
         ident = AgentIdentity.generate()
         text = encode_envelope(
@@ -105,6 +181,42 @@ class TestInbox(unittest.TestCase):
         ])
         self.assertEqual(inbox_count(), 2)
 
+    def test_raw_text_decoded_once_across_reads(self) -> None:
+        ident = AgentIdentity.generate()
+        text = encode_envelope(
+            {"kind": "hello", "from": "a", "to": "b", "ts": 2, "nonce": "dec1"},
+            version=2, identity=ident, include_pubkey=True,
+        )
+        self._write_inbox([{"platform": "udp", "received_at": 1000.0, "text": text}])
+        with mock.patch("beacon_skill.inbox.decode_envelopes", wraps=decode_envelopes) as dec:
+            first = read_inbox()
+            first[0]["envelope"]["kind"] = "tampered"
+            second = read_inbox()
+        self.assertLessEqual(dec.call_count, 1)
+        self.assertEqual(second[0]["envelope"]["kind"], "hello")
+        self.assertTrue(second[0]["verified"])
+
+    def test_count_unread_and_no_key_rewrite_on_reread(self) -> None:
+        ident = AgentIdentity.generate()
+        text = encode_envelope(
+            {"kind": "hello", "from": "a", "to": "b", "ts": 1, "nonce": "cnt1"},
+            version=2, identity=ident, include_pubkey=True,
+        )
+        self._write_inbox([
+            {"platform": "udp", "received_at": 1000.0, "text": text, "envelopes": []},
+            {"platform": "udp", "received_at": 1001.0, "text": "plain text"},
+        ])
+        read_inbox()
+        keys_dir = Path(self.tmpdir) / "known_keys"
+        before = {p.name: p.stat().st_mtime_ns for p in keys_dir.iterdir()}
+        self.assertTrue(before)
+        read_inbox()
+        self.assertEqual({p.name: p.stat().st_mtime_ns for p in keys_dir.iterdir()}, before)
+
+        mark_read("cnt1")
+        self.assertEqual(inbox_count(), 2)
+        self.assertEqual(inbox_count(unread_only=True), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,7 @@ import os
 import tempfile
 import time
 import unittest
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
@@ -19,6 +20,10 @@ from beacon_skill.key_management import (
     get_key_info,
     cleanup_expired_keys,
     DEFAULT_KEY_TTL,
+    KeyStoreBatch,
+    _cached_keys,
+    rotate_key,
+    rotate_keys_batch,
 )
 
 
@@ -93,11 +98,62 @@ class TestKeyManagement(unittest.TestCase):
             keys = load_known_keys()
             original_last_seen = keys["bcn_update"]["last_seen"]
 
-            time.sleep(0.01)
-            update_last_seen("bcn_update")
+            with patch("beacon_skill.key_management._now_s", return_value=original_last_seen + 5):
+                update_last_seen("bcn_update")
 
             keys = load_known_keys()
-            self.assertGreater(keys["bcn_update"]["last_seen"], original_last_seen)
+            self.assertEqual(keys["bcn_update"]["last_seen"], original_last_seen + 5)
+            self.assertIsInstance(keys["bcn_update"]["last_seen"], int)
+
+    def test_update_last_seen_is_throttled(self):
+        """Fresh bumps stay in memory until the interval passes or a flush."""
+        from beacon_skill.key_management import flush_last_seen
+
+        with self._patch_storage():
+            with patch("beacon_skill.key_management._now_s", return_value=1000):
+                trust_key("bcn_chatty", "ab" * 32)
+            with patch("beacon_skill.key_management.save_known_keys") as save:
+                with patch("beacon_skill.key_management._now_s", return_value=1010):
+                    update_last_seen("bcn_chatty")
+                save.assert_not_called()
+            self.assertEqual(load_known_keys()["bcn_chatty"]["last_seen"], 1010)
+            self.assertEqual(_cached_keys()["bcn_chatty"]["last_seen"], 1000)
+
+            flush_last_seen()
+            self.assertEqual(_cached_keys()["bcn_chatty"]["last_seen"], 1010)
+
+            with patch("beacon_skill.key_management._now_s", return_value=1100):
+                update_last_seen("bcn_chatty")
+            self.assertEqual(_cached_keys()["bcn_chatty"]["last_seen"], 1100)
+
+    def test_pending_last_seen_is_seen_by_all_readers(self):
+        """Unflushed bumps show in every reader and are flushed for every store."""
+        import shutil
+
+        from beacon_skill.key_management import flush_last_seen
+
+        with self._patch_storage():
+            with patch("beacon_skill.key_management._now_s", return_value=1000):
+                trust_key("bcn_idle", "cd" * 32)
+            with patch("beacon_skill.key_management._now_s", return_value=1000 + 100):
+                update_last_seen("bcn_idle")
+            with patch("beacon_skill.key_management._now_s", return_value=1000 + 150):
+                seen = datetime.fromtimestamp(1100).isoformat()
+                self.assertEqual(get_key_info("bcn_idle")["last_seen"], seen)
+                self.assertEqual(list_keys()[0]["last_seen"], seen)
+                self.assertFalse(is_key_expired("bcn_idle", ttl=60))
+                self.assertEqual(cleanup_expired_keys(ttl=60, dry_run=True), [])
+
+        # The bump was recorded for the temp store; flushing from another store
+        # still writes it there.
+        other = tempfile.mkdtemp()
+        try:
+            with patch("beacon_skill.key_management._dir", return_value=Path(other)):
+                flush_last_seen()
+        finally:
+            shutil.rmtree(other)
+        with self._patch_storage():
+            self.assertEqual(_cached_keys()["bcn_idle"]["last_seen"], 1100)
 
     def test_list_keys(self):
         """Test listing keys including revoked."""
@@ -115,6 +171,64 @@ class TestKeyManagement(unittest.TestCase):
             self.assertEqual(len(keys), 1)
             self.assertEqual(keys[0]["agent_id"], "bcn_list1")
 
+    def test_list_keys_loads_store_once(self):
+        """Listing evaluates expiry without re-reading the store per key."""
+        with self._patch_storage():
+            for i in range(5):
+                trust_key(f"bcn_once{i}", f"{i:04d}" * 16)
+            with patch("beacon_skill.key_management._cached_keys", wraps=_cached_keys) as load:
+                self.assertEqual(len(list_keys(ttl=1)), 5)
+                self.assertEqual(cleanup_expired_keys(ttl=10**9), [])
+            self.assertEqual(load.call_count, 2)
+
+    def test_batch_saves_once(self):
+        """KeyStoreBatch applies several mutations with a single save."""
+        with self._patch_storage():
+            with patch("beacon_skill.key_management.save_known_keys", wraps=save_known_keys) as save:
+                with KeyStoreBatch() as batch:
+                    batch.trust("bcn_b1", "1111" * 16)
+                    batch.trust("bcn_b2", "2222" * 16)
+                    self.assertTrue(batch.revoke("bcn_b2"))
+                    self.assertFalse(batch.revoke("bcn_missing"))
+                    batch.update_last_seen("bcn_b1")
+                with KeyStoreBatch():
+                    pass  # no mutations: no write
+            self.assertEqual(save.call_count, 1)
+            keys = load_known_keys()
+            self.assertTrue(keys["bcn_b2"]["revoked"])
+            self.assertFalse(keys["bcn_b1"]["revoked"])
+
+    def test_read_paths_do_not_alias_cache(self):
+        """Mutating a loaded copy never leaks into read-only views."""
+        with self._patch_storage():
+            trust_key("bcn_alias", "abab" * 16)
+            load_known_keys()["bcn_alias"]["revoked"] = True
+            self.assertFalse(get_key_info("bcn_alias")["is_revoked"])
+            self.assertFalse(is_key_expired("bcn_alias"))
+
+    def test_rotate_keys_batch(self):
+        """Bulk rotation applies valid items and reports failures per item."""
+        from beacon_skill.identity import AgentIdentity
+
+        old, new, other = (AgentIdentity.generate() for _ in range(3))
+        with self._patch_storage():
+            trust_key("bcn_rot", old.public_key_hex)
+            trust_key("bcn_rot2", other.public_key_hex)
+            good_sig = old.sign_hex(bytes.fromhex(new.public_key_hex))
+            results = rotate_keys_batch([
+                ("bcn_rot", new.public_key_hex, good_sig),
+                ("bcn_rot2", new.public_key_hex, good_sig),  # not signed by bcn_rot2's key
+                ("bcn_missing", new.public_key_hex, good_sig),
+            ])
+            self.assertEqual([ok for ok, _ in results], [True, False, False])
+            keys = load_known_keys()
+            self.assertEqual(keys["bcn_rot"]["pubkey_hex"], new.public_key_hex)
+            self.assertEqual(keys["bcn_rot"]["previous_key"], old.public_key_hex)
+            self.assertEqual(keys["bcn_rot2"]["pubkey_hex"], other.public_key_hex)
+
+            ok, msg = rotate_key("bcn_rot", old.public_key_hex, good_sig)
+            self.assertFalse(ok)
+
     def test_get_key_info(self):
         """Test getting key info."""
         with self._patch_storage():
@@ -126,6 +240,10 @@ class TestKeyManagement(unittest.TestCase):
             self.assertEqual(info["pubkey_hex"], "cccc" * 16)
             self.assertEqual(info["rotation_count"], 0)
 
+            stored = load_known_keys()["bcn_info"]
+            self.assertEqual(info["first_seen"], datetime.fromtimestamp(stored["first_seen"]).isoformat())
+            self.assertEqual(list_keys()[0]["last_seen"], info["last_seen"])
+
             # Non-existent key
             info = get_key_info("bcn_nonexistent")
             self.assertIsNone(info)
@@ -159,6 +277,25 @@ class TestKeyManagement(unittest.TestCase):
             self.assertNotIn("bcn_old", keys)
             self.assertIn("bcn_fresh", keys)
 
+    def test_expired_ids_match_per_key_check(self):
+        """The bisect-based expiry scan agrees with is_key_expired."""
+        with self._patch_storage():
+            now = time.time()
+            with KeyStoreBatch() as batch:
+                for i in range(30):
+                    batch.trust(f"bcn_exp{i:02d}", "abcd" * 16)
+                    batch.keys[f"bcn_exp{i:02d}"]["last_seen"] = now - i * 100
+                batch.revoke("bcn_exp00")
+            expected = {f"bcn_exp{i:02d}" for i in range(30) if is_key_expired(f"bcn_exp{i:02d}", ttl=1050)}
+            removed = cleanup_expired_keys(ttl=1050, dry_run=True)
+            self.assertEqual(set(removed), expected)
+            self.assertEqual(removed[0], "bcn_exp00")
+            self.assertEqual(len(removed), 1 + 19)
+
+            self.assertEqual(cleanup_expired_keys(ttl=1050, dry_run=False), removed)
+            self.assertEqual(len(load_known_keys()), 10)
+            self.assertEqual(cleanup_expired_keys(ttl=1050), [])
+
     def test_migrate_old_format(self):
         """Test migration from old key format (string) to new format (dict)."""
         with self._patch_storage():
@@ -171,6 +308,54 @@ class TestKeyManagement(unittest.TestCase):
             self.assertIn("bcn_old_format", keys)
             self.assertIsInstance(keys["bcn_old_format"], dict)
             self.assertEqual(keys["bcn_old_format"]["pubkey_hex"], "ffff" * 16)
+            # The legacy file is split into shard files and removed.
+            self.assertFalse(self.keys_path.exists())
+            self.assertTrue(list((Path(self.temp_dir) / "known_keys").glob("*.json")))
+            self.assertIn("bcn_old_format", load_known_keys())
+
+    def test_migration_check_runs_once_per_store(self):
+        """Only the first read of a store looks for the legacy file."""
+        with self._patch_storage():
+            trust_key("bcn_a", "aa" * 32)
+            with patch("beacon_skill.key_management._migrate_legacy_store",
+                       side_effect=AssertionError):
+                self.assertIn("bcn_a", load_known_keys())
+                update_last_seen("bcn_a")
+
+    def test_save_rewrites_only_changed_shard(self):
+        """Updating one agent leaves the other shard files untouched."""
+        from beacon_skill.key_management import _shard_name
+
+        with self._patch_storage():
+            ids = [f"bcn_shard{i:02d}" for i in range(40)]
+            with KeyStoreBatch() as batch:
+                for agent_id in ids:
+                    batch.trust(agent_id, "abcd" * 16)
+            shard_dir = Path(self.temp_dir) / "known_keys"
+            before = {p.name: p.stat().st_mtime_ns for p in shard_dir.glob("*.json")}
+            self.assertGreater(len(before), 1)
+
+            time.sleep(0.01)
+            revoke_key(ids[0])
+            after = {p.name: p.stat().st_mtime_ns for p in shard_dir.glob("*.json")}
+            changed = {name for name in before if before[name] != after[name]}
+            self.assertEqual(changed, {_shard_name(ids[0]) + ".json"})
+            self.assertTrue(load_known_keys()[ids[0]]["revoked"])
+            self.assertEqual(len(load_known_keys()), 40)
+
+    def test_export_sorts_by_agent_id(self):
+        """Exports are sorted for diffing; the store itself keeps insertion order."""
+        from beacon_skill.key_management import export_known_keys
+
+        with self._patch_storage():
+            trust_key("bcn_b", "bb" * 32)
+            trust_key("bcn_a", "aa" * 32)
+            out = Path(self.temp_dir) / "export.json"
+            data = export_known_keys(out)
+            self.assertEqual(out.read_bytes(), data)
+            self.assertEqual(list(json.loads(data)), ["bcn_a", "bcn_b"])
+            self.assertEqual(list(load_known_keys()), ["bcn_b", "bcn_a"])
+            self.assertEqual(list(json.loads(export_known_keys(sort_keys=False))), ["bcn_b", "bcn_a"])
 
 
 if __name__ == "__main__":
@@ -52,6 +52,20 @@ class TestMemory(unittest.TestCase):
         self.assertEqual(profile["rtc_sent"], 5.0)
         self.assertIn("python", profile["topic_frequency"])
 
+    def test_rebuild_reads_records_with_unicode_line_breaks(self):
+        from unittest import mock
+
+        from beacon_skill import storage
+
+        with mock.patch("beacon_skill.storage._dir", return_value=self.data_dir):
+            storage.append_jsonl("interactions.jsonl", {
+                "agent_id": "bcn_alice", "dir": "in", "kind": "hello",
+                "outcome": "ok", "rtc": 3, "note": "a\u2028b\u2029c\x85d",
+            })
+        profile = self._mgr().rebuild()
+        self.assertEqual(profile["rtc_received"], 3.0)
+        self.assertEqual(profile["top_contacts"], [{"agent_id": "bcn_alice", "interactions": 1}])
+
     def test_contact(self):
         self._write_jsonl("interactions.jsonl", [
             {"agent_id": "bcn_bob", "dir": "in", "kind": "hello", "outcome": "ok", "ts": 100},
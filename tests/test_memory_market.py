@@ -0,0 +1,216 @@
+"""Tests for BEP-4 Memory Markets."""
+
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from beacon_skill.memory_market import MARKET_STATE_FILE, MemoryMarketManager
+
+
+@pytest.fixture
+def mgr(tmp_path):
+    with mock.patch("beacon_skill.storage._dir", return_value=tmp_path):
+        yield MemoryMarketManager(data_dir=tmp_path)
+
+
+def _ident(agent_id):
+    return SimpleNamespace(agent_id=agent_id)
+
+
+class TestStateCache:
+    def test_reloads_after_external_write(self, mgr, tmp_path):
+        seller = _ident("bcn_seller")
+        shard_id = mgr.list_shard(seller, domain="coding", title="T", price_rtc=1.0)["shard_id"]
+        assert mgr.get_shard(shard_id)["listed"]
+
+        MemoryMarketManager(data_dir=tmp_path).delist_shard(seller, shard_id)
+        assert not mgr.get_shard(shard_id)["listed"]
+
+    def test_returned_views_do_not_alias_state(self, mgr):
+        shard_id = mgr.list_shard(_ident("bcn_s"), domain="d", title="T", rent_rtc_per_day=1.0,
+                                  metadata={"k": 1})["shard_id"]
+        mgr.get_shard(shard_id)["metadata"]["k"] = 2
+        assert mgr.get_shard(shard_id)["metadata"] == {"k": 1}
+
+        mgr.rent_shard("bcn_r", shard_id)["rental"]["days"] = 99
+        assert mgr.active_rentals("bcn_r")[0]["days"] == 1
+
+    def test_state_file_is_compact_json(self, mgr, tmp_path):
+        mgr.list_shard(_ident("bcn_s"), domain="d", title="T")
+        raw = (tmp_path / MARKET_STATE_FILE).read_text(encoding="utf-8")
+        assert "\n " not in raw
+        assert json.loads(raw)["shards"]
+        assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+    def test_load_skips_reparse_when_unchanged(self, mgr):
+        mgr.list_shard(_ident("bcn_s"), domain="d", title="T")
+        with mock.patch("beacon_skill.memory_market._loads", side_effect=AssertionError):
+            assert len(mgr.browse_market()) == 1
+
+
+class TestAmnesia:
+    def test_quorum_amnesia_delists_shard(self, mgr, tmp_path):
+        owner = _ident("bcn_owner")
+        shard_id = mgr.list_shard(owner, domain="d", title="T", price_rtc=2.0)["shard_id"]
+        req = mgr.request_amnesia(owner, shard_id)
+        assert req["amnesia_cost_rtc"] == 4.0
+        assert "error" in mgr.amnesia_vote(shard_id, "bcn_owner", True)
+
+        for voter in ("bcn_v1", "bcn_v2", "bcn_v3"):
+            res = mgr.amnesia_vote(shard_id, voter, True)
+        assert res["approved"] and res["resolved"]
+        assert mgr.browse_market() == []
+        assert mgr.pending_amnesia() == []
+
+        stored = json.loads((tmp_path / MARKET_STATE_FILE).read_text(encoding="utf-8"))
+        assert stored["shards"][shard_id]["amnesia"]
+
+    def test_rejection_resolves_and_next_request_takes_over(self, mgr, tmp_path):
+        owner = _ident("bcn_owner")
+        shard_id = mgr.list_shard(owner, domain="d", title="T")["shard_id"]
+        first = mgr.request_amnesia(owner, shard_id)["request_id"]
+        second = mgr.request_amnesia(owner, shard_id)["request_id"]
+        for voter in ("bcn_v1", "bcn_v2", "bcn_v3"):
+            res = mgr.amnesia_vote(shard_id, voter, False)
+        assert res["resolved"] and not res["approved"]
+        assert res["request_id"] == first
+
+        fresh = MemoryMarketManager(data_dir=tmp_path)
+        assert fresh.amnesia_vote(shard_id, "bcn_v1", True)["request_id"] == second
+        res = fresh.amnesia_vote(shard_id, "bcn_v2", False)
+        assert (res["approvals"], res["rejections"], res["total_votes"]) == (1, 1, 2)
+        res = fresh.amnesia_vote(shard_id, "bcn_v2", True)  # changed vote replaces the old one
+        assert (res["approvals"], res["rejections"], res["total_votes"]) == (2, 0, 2)
+        assert "error" in mgr.amnesia_vote("nope", "bcn_v1", True)
+
+
+def test_batch_defers_state_write(mgr, tmp_path):
+    state_path = tmp_path / MARKET_STATE_FILE
+    owner = _ident("bcn_owner")
+    with mgr.batch():
+        ids = [mgr.list_shard(owner, domain="d", title=f"T{i}")["shard_id"] for i in range(3)]
+        mgr.delist_shard(owner, ids[0])
+        assert not state_path.exists()
+        assert len(mgr.browse_market()) == 2
+    fresh = MemoryMarketManager(data_dir=tmp_path)
+    assert sorted(s["shard_id"] for s in fresh.browse_market()) == sorted(ids[1:])
+
+
+def test_browse_filters_by_domain_price_and_entries(mgr, tmp_path):
+    owner = _ident("bcn_owner")
+    with mock.patch("beacon_skill.memory_market.time.time", return_value=100):
+        a = mgr.list_shard(owner, domain="Coding", title="A", price_rtc=5.0, entry_count=10)["shard_id"]
+        b = mgr.list_shard(owner, domain="coding", title="B", price_rtc=1.0)["shard_id"]
+        mgr.list_shard(owner, domain="art", title="C")
+    mgr.delist_shard(owner, b)
+
+    assert [s["title"] for s in mgr.browse_market(domain="CODING")] == ["A"]
+    assert mgr.browse_market(domain="coding", max_price=2.0) == []
+    assert [s["title"] for s in mgr.browse_market(min_entries=1)] == ["A"]
+    assert [s["title"] for s in mgr.browse_market()] == ["A", "C"]
+    fresh = MemoryMarketManager(data_dir=tmp_path)
+    assert [s["shard_id"] for s in fresh.browse_market(domain="coding")] == [a]
+
+
+def test_domain_index_holds_only_listed_shards(mgr):
+    owner = _ident("bcn_owner")
+    a = mgr.list_shard(owner, domain="Code", title="A")["shard_id"]
+    b = mgr.list_shard(owner, domain="code", title="B")["shard_id"]
+    mgr.delist_shard(owner, b)
+    assert list(mgr._ids_by_domain) == ["code"]
+    assert list(mgr._ids_by_domain["code"]) == [a]
+
+    mgr.request_amnesia(owner, a)
+    for voter in ("bcn_v1", "bcn_v2", "bcn_v3"):
+        mgr.amnesia_vote(a, voter, True)
+    assert mgr._ids_by_domain == {}
+    assert mgr.browse_market(domain="code") == []
+
+
+def test_shard_view_matches_to_dict():
+    from beacon_skill.memory_market import KnowledgeShard, _shard_view
+
+    for data in ({}, {"shard_id": "s1", "listed": False, "metadata": {"k": 1}}):
+        assert _shard_view(data) == KnowledgeShard(data).to_dict()
+    assert not hasattr(KnowledgeShard({}), "__dict__")
+
+
+def test_market_views_skip_shard_wrapper(mgr):
+    shard_id = mgr.list_shard(_ident("bcn_s"), domain="d", title="T")["shard_id"]
+    with mock.patch("beacon_skill.memory_market.KnowledgeShard", side_effect=AssertionError):
+        assert mgr.browse_market()[0]["shard_id"] == shard_id
+        assert mgr.get_shard(shard_id)["title"] == "T"
+
+
+def test_history_served_from_memory_until_file_changes(mgr, tmp_path):
+    owner = _ident("bcn_owner")
+    mgr.list_shard(owner, domain="d", title="A")
+    assert [e["title"] for e in mgr.listing_history()] == ["A"]
+
+    mgr.list_shard(owner, domain="d", title="B")
+    with mock.patch("beacon_skill.memory_market.read_jsonl_tail", side_effect=AssertionError):
+        assert [e["title"] for e in mgr.listing_history()] == ["A", "B"]
+        assert [e["title"] for e in mgr.listing_history(limit=1)] == ["B"]
+
+    MemoryMarketManager(data_dir=tmp_path).list_shard(owner, domain="d", title="C")
+    assert [e["title"] for e in mgr.listing_history()] == ["A", "B", "C"]
+
+
+def test_market_stats_tracks_listing_changes(mgr, tmp_path):
+    owner = _ident("bcn_owner")
+    a = mgr.list_shard(owner, domain="code", title="A", price_rtc=0.1)["shard_id"]
+    b = mgr.list_shard(owner, domain="code", title="B", price_rtc=0.2, rent_rtc_per_day=1.0)["shard_id"]
+    mgr.list_shard(owner, domain="art", title="C", price_rtc=1.5)
+    mgr.rent_shard("bcn_r", b)
+    mgr.request_amnesia(owner, a)
+
+    stats = mgr.market_stats()
+    assert stats["listed"] == 3
+    assert stats["by_domain"] == {"code": 2, "art": 1}
+    assert stats["total_market_value_rtc"] == 1.8
+    assert (stats["active_rentals"], stats["pending_amnesia"]) == (1, 1)
+
+    mgr.delist_shard(owner, b)
+    for voter in ("bcn_v1", "bcn_v2", "bcn_v3"):
+        mgr.amnesia_vote(a, voter, True)
+    stats = mgr.market_stats()
+    assert (stats["listed"], stats["amnesia_count"], stats["pending_amnesia"]) == (1, 1, 0)
+    assert stats["by_domain"] == {"art": 1}
+    assert stats["total_market_value_rtc"] == 1.5
+
+    fresh = MemoryMarketManager(data_dir=tmp_path).market_stats()
+    assert {k: v for k, v in fresh.items() if k != "ts"} == {k: v for k, v in stats.items() if k != "ts"}
+
+
+def test_concurrent_managers_do_not_lose_listings(mgr, tmp_path):
+    import threading
+
+    def worker(n):
+        other = MemoryMarketManager(data_dir=tmp_path)
+        for i in range(15):
+            other.list_shard(_ident(f"bcn_{n}"), domain="d", title=f"{n}-{i}")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert mgr.market_stats()["total_shards"] == 45
+    assert (tmp_path / (MARKET_STATE_FILE + ".lock")).exists()
+
+
+def test_shared_manager_serializes_threads(mgr):
+    import threading
+
+    with mgr.batch():
+        t = threading.Thread(target=mgr.list_shard, args=(_ident("bcn_b"),),
+                             kwargs={"domain": "d", "title": "t"})
+        t.start()
+        t.join(timeout=0.2)
+        # Another thread's mutation waits for this thread's lock.
+        assert t.is_alive()
+        assert mgr.market_stats()["total_shards"] == 0
+    t.join()
+    assert mgr.market_stats()["total_shards"] == 1
@@ -0,0 +1,130 @@
+"""Tests for BEP-1 Proof-of-Thought."""
+
+import hashlib
+from unittest import mock
+
+import pytest
+
+from beacon_skill.identity import AgentIdentity
+from beacon_skill.proof_of_thought import ThoughtProofManager
+
+
+@pytest.fixture
+def mgr(tmp_path):
+    with mock.patch("beacon_skill.storage._dir", return_value=tmp_path):
+        yield ThoughtProofManager(data_dir=tmp_path)
+
+
+def test_commitment_is_hash_of_joined_hashes():
+    ph, th, oh = (hashlib.sha256(s.encode("utf-8")).hexdigest() for s in ("p", "t", "o"))
+    expected = hashlib.sha256(f"{ph}:{th}:{oh}".encode("utf-8")).hexdigest()
+    assert ThoughtProofManager._compute_commitment(ph, th, oh) == expected
+
+
+def test_create_verify_and_reveal(mgr):
+    ident = AgentIdentity.generate()
+    proof = mgr.create_proof(ident, "prompt é", "step one\n step  two", "answer", model_id="m")
+    assert proof.prompt_hash == hashlib.sha256("prompt é".encode("utf-8")).hexdigest()
+    assert proof.token_count == 4
+    assert AgentIdentity.verify(ident.public_key_hex, proof.sig, proof.commitment.encode("utf-8"))
+
+    assert mgr.verify_proof(proof.commitment, "prompt é", "step one\n step  two", "answer")
+    assert not mgr.verify_proof(proof.commitment, "prompt é", "edited", "answer")
+    assert "error" in mgr.reveal_proof(ident, proof.commitment, "x", "y", "z")
+    assert [p["commitment"] for p in mgr.proof_history()] == [proof.commitment]
+
+
+def test_large_inputs_hash_the_same_on_two_threads():
+    from beacon_skill.proof_of_thought import PARALLEL_HASH_BYTES, _hash_texts
+
+    big = "x" * PARALLEL_HASH_BYTES
+    with mock.patch("beacon_skill.proof_of_thought._PARALLEL_HASH", True):
+        for texts in (("p", "t", "o"), (big, big + "y", "o"), ("p", big, big + "z")):
+            assert _hash_texts(*texts) == tuple(ThoughtProofManager._hash(t) for t in texts)
+
+
+def test_repeated_commitment_reuses_signature(mgr):
+    ident = AgentIdentity.generate()
+    first = mgr.create_proof(ident, "p", "t", "o")
+    with mock.patch.object(ident, "sign_hex", side_effect=AssertionError):
+        again = mgr.create_proof(ident, "p", "t", "o")
+        reveal = mgr.reveal_proof(ident, first.commitment, "p", "t", "o")
+    assert again.sig == reveal["sig"] == first.sig
+    assert mgr.create_proof(ident, "p", "t", "other").sig != first.sig
+    assert len(mgr.proof_history()) == 3
+
+
+def test_word_count_matches_str_split():
+    from beacon_skill.proof_of_thought import _word_count
+
+    for text in ("", "  ", "one", " two  words ", "a\tb\nc\x0bd\x1ce\r", "x　y", "café au lait"):
+        assert _word_count(text) == len(text.split())
+
+
+def test_verify_accepts_utf8_bytes(mgr):
+    proof = mgr.create_proof(AgentIdentity.generate(), "prompt é", "trace", "out")
+    assert mgr.verify_proof(proof.commitment, "prompt é".encode("utf-8"), b"trace", "out")
+    assert not mgr.verify_proof(proof.commitment, b"prompt e", b"trace", b"out")
+
+
+def test_prefix_hasher_resumes_from_shared_checkpoints():
+    from beacon_skill.proof_of_thought import _PrefixHasher
+
+    hasher = _PrefixHasher(max_inputs=2, step=64)
+    base = bytes(range(256)) * 4
+    inputs = [base, base + b"more", base[:300] + b"fork" + base[300:], b"short", base[:-1], base]
+    for data in inputs:
+        assert hasher(data) == hashlib.sha256(data).hexdigest()
+    assert len(hasher._entries) == 1
+
+    with mock.patch("beacon_skill.proof_of_thought._sha256", side_effect=AssertionError):
+        assert hasher(base + b"!") == hashlib.sha256(base + b"!").hexdigest()
+
+
+def test_prefix_hasher_key_collision_is_a_miss():
+    from beacon_skill.proof_of_thought import _PrefixHasher
+
+    hasher = _PrefixHasher(step=64)
+    a, b = b"a" * 200, b"b" * 200
+    with mock.patch("beacon_skill.proof_of_thought._block_key", return_value=0):
+        assert hasher(a) == hashlib.sha256(a).hexdigest()
+        assert hasher(b) == hashlib.sha256(b).hexdigest()
+
+
+def test_anchor_proof_submits_canonical_bytes_once(mgr):
+    from beacon_skill.anchor import commitment_hash
+
+    proof = mgr.create_proof(AgentIdentity.generate(), "p", "t", "o", model_id="m")
+    anchor_mgr = mock.Mock()
+    mgr.anchor_proof(proof, anchor_mgr)
+    raw = anchor_mgr.anchor_bytes.call_args[0][0]
+    assert hashlib.sha256(raw).hexdigest() == commitment_hash(proof.to_dict())
+    assert anchor_mgr.anchor_bytes.call_args[1]["metadata"]["commitment"] == proof.commitment
+    assert proof.canonical_bytes() is raw
+
+    proof.model_id = "other"
+    assert hashlib.sha256(proof.canonical_bytes()).hexdigest() == commitment_hash(proof.to_dict())
+
+
+def test_batch_matches_single_proofs(mgr):
+    ident = AgentIdentity.generate()
+    items = [("p%d" % i, "trace words %d" % i, "o") for i in range(5)]
+    with mock.patch("beacon_skill.proof_of_thought.os.cpu_count", return_value=4):
+        batch = mgr.create_proofs_batch(ident, items, model_id="m")
+    singles = [mgr.create_proof(ident, *item, model_id="m") for item in items]
+    assert [p.commitment for p in batch] == [p.commitment for p in singles]
+    assert [p.sig for p in batch] == [p.sig for p in singles]
+    assert {p.token_count for p in batch} == {3}
+    assert len(mgr.proof_history()) == 10
+    assert mgr.create_proofs_batch(ident, []) == []
+
+
+def test_binary_log_opt_in(mgr, tmp_path):
+    mgr._binary_log = True
+    ident = AgentIdentity.generate()
+    proof = mgr.create_proof(ident, "p", "t", "o")
+    mgr.challenge_proof(ident, "bcn_other", proof.commitment)
+    assert [p["commitment"] for p in mgr.proof_history()] == [proof.commitment]
+    assert [c["commitment"] for c in mgr.challenge_history()] == [proof.commitment]
+    assert (tmp_path / "thought_proofs.bin").exists()
+    assert not (tmp_path / "thought_proofs.jsonl").exists()
@@ -0,0 +1,249 @@
+"""Tests for JSONL storage helpers."""
+
+from unittest import mock
+
+import pytest
+
+from beacon_skill import storage
+
+
+@pytest.fixture
+def beacon_dir(tmp_path):
+    with mock.patch("beacon_skill.storage._dir", return_value=tmp_path):
+        yield tmp_path
+    storage.flush_jsonl()
+
+
+def test_buffered_append_is_visible_to_readers(beacon_dir):
+    storage.append_jsonl("log.jsonl", {"n": 1}, buffered=True)
+    storage.append_jsonl("log.jsonl", {"n": 2}, buffered=True)
+    assert not (beacon_dir / "log.jsonl").exists()
+    assert [e["n"] for e in storage.read_jsonl_tail("log.jsonl")] == [1, 2]
+    assert storage.jsonl_count("log.jsonl") == 2
+
+
+def test_unbuffered_append_keeps_order_after_buffered(beacon_dir):
+    storage.append_jsonl("log.jsonl", {"n": 1}, buffered=True)
+    storage.append_jsonl("log.jsonl", {"n": 2})
+    lines = (beacon_dir / "log.jsonl").read_text(encoding="utf-8").splitlines()
+    assert lines == ['{"n":1}', '{"n":2}']
+
+
+def test_writer_flushes_when_full(tmp_path):
+    writer = storage.BufferedJsonlWriter(max_entries=2, max_delay_s=60)
+    path = tmp_path / "x.jsonl"
+    writer.append(path, [b"a\n"])
+    assert not path.exists()
+    writer.append(path, [b"b\n"])
+    assert path.read_bytes() == b"a\nb\n"
+    writer.flush()  # nothing pending, cancels no timer
+
+
+def test_writer_flushes_on_byte_threshold(tmp_path):
+    writer = storage.BufferedJsonlWriter(max_entries=100, max_delay_s=60, max_bytes=8)
+    path = tmp_path / "x.jsonl"
+    writer.append(path, [b"abc\n"])
+    assert not path.exists()
+    writer.append(path, [b"defg\n"])
+    assert path.read_bytes() == b"abc\ndefg\n"
+    writer.append(path, [b"h\n"])  # size count restarted after the flush
+    writer.flush(path)
+    assert path.read_bytes().endswith(b"defg\nh\n")
+
+
+def test_flush_jsonl_by_name(beacon_dir):
+    storage.append_jsonl("a.jsonl", {"n": 1}, buffered=True)
+    storage.append_jsonl("b.jsonl", {"n": 2}, buffered=True)
+    storage.flush_jsonl("a.jsonl")
+    assert (beacon_dir / "a.jsonl").exists()
+    assert not (beacon_dir / "b.jsonl").exists()
+
+
+def test_tail_and_count_across_chunks(beacon_dir):
+    path = beacon_dir / "log.jsonl"
+    path.write_text("\n".join(['{"n": %d}' % n for n in range(50)] + ["", '{"n": 50}']), encoding="utf-8")
+    with mock.patch("beacon_skill.storage._SCAN_CHUNK", 16), mock.patch("beacon_skill.storage._COUNT_CHUNK", 7):
+        assert [e["n"] for e in storage.read_jsonl_tail("log.jsonl", limit=3)] == [48, 49, 50]
+        assert len(storage.read_jsonl_tail("log.jsonl", limit=500)) == 51
+        assert storage.jsonl_count("log.jsonl") == 51
+    assert [e["n"] for e in storage.read_jsonl_tail("log.jsonl", limit=1)] == [50]
+
+
+def test_count_skips_whitespace_only_lines(beacon_dir):
+    text = '{"a":1}\n   \n\r\n{"b":2}\n\t\n  {"c": 3} \r\n \n  '
+    (beacon_dir / "log.jsonl").write_bytes(text.encode("utf-8"))
+    expected = len(storage.read_jsonl("log.jsonl"))
+    assert expected == 3
+    for size in range(1, len(text) + 2):
+        with mock.patch("beacon_skill.storage._COUNT_CHUNK", size):
+            assert storage.jsonl_count("log.jsonl") == expected, size
+
+
+def test_jsonl_lines_stay_single_line_when_pretty(beacon_dir):
+    with mock.patch("beacon_skill.storage.PRETTY_JSON", True):
+        storage.append_jsonl("log.jsonl", {"b": 1, "a": {"c": 2}})
+        storage.write_state({"z": 1, "a": 2})
+    assert (beacon_dir / "log.jsonl").read_text(encoding="utf-8") == '{"a":{"c":2},"b":1}\n'
+    assert (beacon_dir / "state.json").read_text(encoding="utf-8") == '{\n  "a": 2,\n  "z": 1\n}\n'
+    assert storage.read_state() == {"a": 2, "z": 1}
+
+
+def test_loads_and_dumps_fall_back_to_stdlib():
+    assert storage._loads('{"x": NaN}')["x"] != storage._loads('{"x": NaN}')["x"]
+    assert storage._loads(storage._dumps({"n": 2 ** 64 + 1})) == {"n": 2 ** 64 + 1}
+    data = storage._dumps({"x": float("nan"), "y": [float("inf")], "z": None})
+    assert data == b'{"x":NaN,"y":[Infinity],"z":null}'
+
+
+def test_jsonl_records_with_unicode_line_breaks_stay_on_one_line(beacon_dir):
+    text = "a\u2028b\u2029c\x85d \u00e9"
+    storage.append_jsonl("log.jsonl", {"t": text})
+    lines = (beacon_dir / "log.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert storage._loads(lines[0]) == {"t": text}
+
+
+def test_loads_keeps_integers_wider_than_64_bits():
+    for n in (2 ** 64 + 1, -(2 ** 63) - 1, 10 ** 30):
+        doc = '{"n": %d, "s": "x"}' % n
+        assert storage._loads(doc)["n"] == n
+        assert type(storage._loads(doc.encode("ascii"))["n"]) is int
+    assert storage._loads(b'{"n": 2, "ts": "1234567890123456789"}')["ts"] == "1234567890123456789"
+
+
+def test_read_jsonl_skips_blank_and_malformed_lines(beacon_dir):
+    (beacon_dir / "log.jsonl").write_bytes('{"n": 1}\n\n  \nnot json\n{"s": "é"}'.encode("utf-8"))
+    assert storage.read_jsonl("log.jsonl") == [{"n": 1}, {"s": "é"}]
+    assert storage.read_jsonl_tail("log.jsonl", limit=0) == [{"n": 1}, {"s": "é"}]
+
+
+def test_file_lock_is_reentrant_and_reuses_lock_file(tmp_path):
+    target = tmp_path / "state.json"
+    with storage.file_lock(target):
+        with storage.file_lock(target, write=False):
+            pass
+    with mock.patch.object(type(tmp_path), "open", side_effect=AssertionError):
+        with storage.file_lock(target):
+            pass
+    (tmp_path / "state.json.lock").unlink()
+    with storage.file_lock(target):
+        assert (tmp_path / "state.json.lock").exists()
+
+
+def test_file_lock_serializes_threads(tmp_path):
+    import threading
+
+    target = tmp_path / "counter.json"
+    target.write_text("0", encoding="utf-8")
+
+    def bump():
+        for _ in range(50):
+            with storage.file_lock(target):
+                target.write_text(str(int(target.read_text(encoding="utf-8")) + 1), encoding="utf-8")
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert target.read_text(encoding="utf-8") == "200"
+
+
+def test_file_lock_eviction_skips_states_in_use(tmp_path):
+    held, waiting = tmp_path / "held.json", tmp_path / "waiting.json"
+    with storage.file_lock(held):
+        held_state = storage._file_locks[tmp_path / "held.json.lock"]
+        # Fetched but not yet locked, as by a thread queued on the RLock.
+        waiting_state = storage._lock_state(tmp_path / "waiting.json.lock")
+        for i in range(storage._MAX_OPEN_LOCK_FILES + 6):
+            with storage.file_lock(tmp_path / f"p{i}.json"):
+                pass
+        assert storage._file_locks[tmp_path / "held.json.lock"] is held_state
+        assert not held_state.fh.closed
+        assert storage._file_locks[tmp_path / "waiting.json.lock"] is waiting_state
+        storage._release_state(waiting_state)
+    with storage.file_lock(held), storage.file_lock(waiting):
+        pass
+    assert len(storage._file_locks) <= storage._MAX_OPEN_LOCK_FILES
+
+
+def test_set_last_ts_is_debounced_and_merged(beacon_dir):
+    state_path = beacon_dir / "state.json"
+    storage.write_state({"seen_nonces": {"n1": 1}})
+    storage.set_last_ts("post", 100.0)
+    assert storage.get_last_ts("post") == 100.0
+    assert storage.read_state()["last_ts"] == {"post": 100.0}
+    assert "last_ts" not in storage._loads(state_path.read_bytes())
+
+    # Another process writes meanwhile: the flush merges instead of clobbering.
+    state_path.write_text('{"seen_nonces": {"n2": 2}}', encoding="utf-8")
+    storage.flush_state()
+    assert storage._loads(state_path.read_bytes()) == {"last_ts": {"post": 100.0}, "seen_nonces": {"n2": 2}}
+    assert storage.get_last_ts("post") == 100.0
+
+
+def test_read_state_reparses_only_on_change(beacon_dir):
+    storage.write_state({"a": {"b": 1}})
+    with mock.patch("beacon_skill.storage._loads", side_effect=AssertionError):
+        state = storage.read_state()
+        state["a"]["b"] = 2
+        assert storage.read_state() == {"a": {"b": 1}}
+    (beacon_dir / "state.json").write_text('{"a": {"b": 3}, "c": 0}', encoding="utf-8")
+    assert storage.read_state()["a"] == {"b": 3}
+    assert [p.name for p in beacon_dir.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_readers_handle_missing_files_without_stat(beacon_dir):
+    with mock.patch("pathlib.Path.exists", side_effect=AssertionError):
+        assert storage.read_jsonl("none.jsonl") == []
+        assert storage.read_jsonl_tail("none.jsonl") == []
+        assert storage.read_jsonl_tail("none.jsonl", limit=0) == []
+        assert storage.jsonl_count("none.jsonl") == 0
+        assert storage.read_json("none.json") == {}
+
+
+def test_framed_log_round_trip_and_tail(beacon_dir):
+    items = [{"n": i, "s": "x" * i} for i in range(20)]
+    storage.append_framed_many("log.bin", items[:10])
+    for item in items[10:]:
+        storage.append_framed("log.bin", item, buffered=True)
+    assert storage.read_framed("log.bin") == items
+    assert storage.read_framed_tail("log.bin", limit=3) == items[-3:]
+    assert storage.read_framed_tail("log.bin", limit=0) == items
+    assert storage.read_framed_tail("none.bin") == []
+
+    with (beacon_dir / "log.bin").open("ab") as f:
+        f.write(b"\x05\x00\x00\x00jtor")  # torn final frame
+    assert storage.read_framed_tail("log.bin", limit=2) == items[-2:]
+    assert storage.read_framed("log.bin") == items
+
+
+def test_framed_log_without_msgpack_uses_json(beacon_dir):
+    with mock.patch.object(storage, "msgpack", None):
+        storage.append_framed("log.bin", {"k": "v"})
+    assert (beacon_dir / "log.bin").read_bytes()[4:5] == b"j"
+    assert storage.read_framed_tail("log.bin") == [{"k": "v"}]
+
+
+def test_write_atomic_from_many_threads(tmp_path):
+    import threading
+
+    target = tmp_path / "state.json"
+    errors = []
+
+    def write(n):
+        try:
+            for i in range(50):
+                storage._write_atomic(target, b"%d-%d" % (n, i) * 1000)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    data = target.read_bytes()
+    assert data == data[: len(data) // 1000] * 1000
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
@@ -3,9 +3,12 @@ import threading
 import time
 import unittest
 
-from beacon_skill.codec import encode_envelope, verify_envelope, decode_envelopes
+from beacon_skill.codec import encode_envelope, encode_envelope_binary, verify_envelope, decode_envelopes
 from beacon_skill.identity import AgentIdentity
-from beacon_skill.transports.udp import udp_send, udp_listen, UDPMessage
+from unittest import mock
+
+from beacon_skill.transports import udp
+from beacon_skill.transports.udp import udp_send, udp_send_many, udp_listen, UDPMessage
 
 
 def _find_free_port() -> int:
@@ -28,7 +31,7 @@ class TestUDP(unittest.TestCase):
         t.start()
         time.sleep(0.1)  # Let listener bind.
 
-        udp_send("127.0.0.1", port, b"hello beacon")
+        udp_send("127.0.0.1", port, memoryview(b"hello beacon"))
         t.join(timeout=3.0)
 
         self.assertEqual(len(received), 1)
@@ -77,6 +80,164 @@ class TestUDP(unittest.TestCase):
         self.assertEqual(len(received), 1)
         self.assertIsNone(received[0].verified)
 
+    def test_binary_envelope_verify(self) -> None:
+        port = _find_free_port()
+        ident = AgentIdentity.generate()
+        received = []
+
+        def listener():
+            udp_listen("127.0.0.1", port, received.append, timeout_s=2.0,
+                       known_keys={ident.agent_id: ident.public_key_hex})
+
+        t = threading.Thread(target=listener, daemon=True)
+        t.start()
+        time.sleep(0.1)
+
+        udp_send("127.0.0.1", port, encode_envelope_binary({"kind": "heartbeat"}, identity=ident))
+        t.join(timeout=3.0)
+
+        self.assertEqual(len(received), 1)
+        self.assertTrue(received[0].verified)
+
+    def test_duplicate_datagrams_reuse_verification(self) -> None:
+        ident = AgentIdentity.generate()
+        keys = {ident.agent_id: ident.public_key_hex}
+        data = encode_envelope_binary({"kind": "heartbeat"}, identity=ident)
+        received, seen = [], udp.OrderedDict()
+
+        udp._deliver(data, ("127.0.0.1", 1), received.append, keys, seen)
+        with mock.patch.object(udp, "verify_envelope", side_effect=AssertionError):
+            udp._deliver(bytes(data), ("127.0.0.1", 2), received.append, keys, seen)
+        tampered = data.replace(b"heartbeat", b"heartbeet")
+        udp._deliver(tampered, ("127.0.0.1", 3), received.append, keys, seen)
+
+        self.assertEqual([m.verified for m in received], [True, True, False])
+        self.assertEqual(len(seen), 2)
+
+    def test_verify_cache_stays_small_for_large_datagrams(self) -> None:
+        ident = AgentIdentity.generate()
+        keys = {ident.agent_id: ident.public_key_hex}
+        seen = udp.OrderedDict()
+        with mock.patch.object(udp, "VERIFY_CACHE_SIZE", 4):
+            for i in range(10):
+                data = encode_envelope_binary({"kind": "heartbeat", "pad": str(i) * 50000}, identity=ident)
+                udp._deliver(data, ("127.0.0.1", 1), lambda m: None, keys, seen)
+        self.assertEqual(len(seen), 4)
+        self.assertEqual({len(k) for k in seen}, {16})
+
+    def test_verify_cache_rechecks_after_keys_are_learned(self) -> None:
+        ident, other = AgentIdentity.generate(), AgentIdentity.generate()
+        keys = {other.agent_id: other.public_key_hex}
+        data = encode_envelope_binary({"kind": "heartbeat"}, identity=ident)
+        received, seen = [], udp.OrderedDict()
+
+        udp._deliver(data, ("127.0.0.1", 1), received.append, keys, seen)
+        keys[ident.agent_id] = ident.public_key_hex
+        udp._deliver(data, ("127.0.0.1", 1), received.append, keys, seen)
+        keys[AgentIdentity.generate().agent_id] = "00" * 32
+        udp._deliver(data, ("127.0.0.1", 1), received.append, keys, seen)
+
+        self.assertEqual([m.verified for m in received], [None, True, True])
+        self.assertEqual(list(seen.values()), [(3, True)])
+
+    @unittest.skipUnless(hasattr(socket, "SO_REUSEPORT"), "needs SO_REUSEPORT")
+    def test_listen_with_reuseport_workers(self) -> None:
+        port = _find_free_port()
+        received = []
+
+        def listener():
+            udp_listen("127.0.0.1", port, received.append, timeout_s=1.0, workers=3)
+
+        t = threading.Thread(target=listener, daemon=True)
+        t.start()
+        time.sleep(0.1)
+
+        for i in range(12):
+            udp_send("127.0.0.1", port, b"from-%d" % i)  # fresh source port each time
+        t.join(timeout=3.0)
+
+        self.assertFalse(t.is_alive())
+        self.assertEqual(sorted(m.data for m in received), sorted(b"from-%d" % i for i in range(12)))
+
+    @unittest.skipUnless(hasattr(socket, "SO_REUSEPORT"), "needs SO_REUSEPORT")
+    def test_worker_callback_error_stops_listener(self) -> None:
+        port = _find_free_port()
+        errors = []
+
+        def on_message(msg):
+            if threading.current_thread() is not t:
+                raise RuntimeError("worker failed")
+
+        def listener():
+            try:
+                udp_listen("127.0.0.1", port, on_message, timeout_s=None, workers=3)
+            except RuntimeError as e:
+                errors.append(e)
+
+        t = threading.Thread(target=listener, daemon=True)
+        t.start()
+        time.sleep(0.1)
+
+        for i in range(50):  # fresh source ports until a worker socket gets one
+            if not t.is_alive():
+                break
+            udp_send("127.0.0.1", port, b"from-%d" % i)
+            time.sleep(0.02)
+        t.join(timeout=3.0)
+
+        self.assertFalse(t.is_alive())
+        self.assertEqual([str(e) for e in errors], ["worker failed"])
+
+    def test_listener_drains_bursts(self) -> None:
+        port = _find_free_port()
+        received = []
+
+        def listener():
+            udp_listen("127.0.0.1", port, received.append, timeout_s=1.0)
+
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        payloads = [b"burst-%d" % i + b"x" * i for i in range(40)]
+        with mock.patch.object(udp, "RECVMMSG_BATCH", 4):
+            t = threading.Thread(target=listener, daemon=True)
+            t.start()
+            time.sleep(0.1)
+            for p in payloads:
+                sender.sendto(p, ("127.0.0.1", port))
+            t.join(timeout=3.0)
+        sender_addr = ("127.0.0.1", sender.getsockname()[1])
+        sender.close()
+
+        self.assertEqual([m.data for m in received], payloads)
+        self.assertEqual({m.addr for m in received}, {sender_addr})
+
+    def _send_many_and_collect(self, count: int):
+        port = _find_free_port()
+        received = []
+
+        def listener():
+            udp_listen("127.0.0.1", port, received.append, timeout_s=1.0)
+
+        t = threading.Thread(target=listener, daemon=True)
+        t.start()
+        time.sleep(0.1)
+
+        buffers = (bytes, bytearray, memoryview)
+        datagrams = [("127.0.0.1", port, buffers[i % 3](b"msg-%d" % i)) for i in range(count)]
+        self.assertEqual(udp_send_many(datagrams), count)
+        t.join(timeout=3.0)
+        return sorted(m.data for m in received), sorted(bytes(d[2]) for d in datagrams)
+
+    def test_send_many(self) -> None:
+        with mock.patch.object(udp, "SENDMMSG_BATCH", 4):
+            got, sent = self._send_many_and_collect(10)
+        self.assertEqual(got, sent)
+        self.assertEqual(udp_send_many([]), 0)
+
+    def test_send_many_without_sendmmsg(self) -> None:
+        with mock.patch.object(udp, "_sendmmsg", None):
+            got, sent = self._send_many_and_collect(3)
+        self.assertEqual(got, sent)
+
 
 if __name__ == "__main__":
     unittest.main()